@@ -8,9 +8,18 @@ import os
 import re
 import yaml
 import json
-from typing import Dict, List, Optional, Tuple
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+from model_routing import RoutingTable, build_routing_table, frontmatter_models, load_routing_config
+
+# libyaml's loader when PyYAML was built with it; same results, several times faster
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 @dataclass
 class AgentSpecification:
@@ -38,19 +47,343 @@ class AgentSpecification:
         }
 
 
+def compute_spec_hash(content: str) -> str:
+    """Return a stable content hash for an agent specification"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+# Heading aliases folded into the section names the loader reports
+SECTION_ALIASES = {
+    "example": "examples",
+    "guardrail": "guardrails",
+    "instruction": "instructions"
+}
+
+
+def frontmatter_end(content: str) -> int:
+    """
+    Offset where the body starts after a leading YAML frontmatter block
+
+    Returns:
+        0 when content does not open with a '---' fence that is closed
+    """
+    first_newline = content.find("\n")
+    if first_newline < 0 or not content.startswith("---") or content[3:first_newline].strip():
+        return 0
+
+    position = first_newline + 1
+    while True:
+        fence = content.find("\n---", position)
+        if fence < 0:
+            return 0
+        line_end = content.find("\n", fence + 4)
+        if line_end < 0:
+            return 0
+        if not content[fence + 4:line_end].strip():
+            return line_end + 1
+        position = fence + 4
+
+
+def index_markdown_sections(content: str, start: int = 0) -> Dict[str, Tuple[int, int]]:
+    """
+    Index the level one and two sections of a markdown document in one pass
+
+    Each '#' or '##' heading line opens a section that runs to the next such
+    line; deeper headings stay inside their parent section. Names are
+    lowercased with SECTION_ALIASES applied, and the first section with a
+    given name wins.
+
+    Args:
+        content: Markdown text
+        start: Offset of a line start to scan from (e.g. frontmatter_end(content))
+
+    Returns:
+        Mapping of section name to the (start, end) offsets of its body
+    """
+    sections = {}
+    current_name = None
+    body_start = 0
+    position = start
+
+    # Jump between line starts that begin with '#'; str.find does the scanning
+    while True:
+        if content.startswith("#", position):
+            line_end = content.find("\n", position)
+            if line_end < 0:
+                break  # An unterminated last line is not a heading
+            hashes = 2 if content.startswith("##", position) else 1
+            if not content.startswith("#", position + hashes):
+                if current_name is not None and current_name not in sections:
+                    # The body ends before the newline that precedes the heading
+                    sections[current_name] = (body_start, max(body_start, position - 1))
+                name = content[position + hashes:line_end].strip().lower()
+                current_name = SECTION_ALIASES.get(name, name)
+                body_start = line_end + 1
+            position = line_end
+
+        position = content.find("\n#", position)
+        if position < 0:
+            break
+        position += 1
+
+    if current_name is not None and current_name not in sections:
+        sections[current_name] = (body_start, len(content))
+
+    return sections
+
+
+@dataclass
+class SpecLoadResult:
+    """Outcome of loading (and optionally validating) one agent's spec"""
+    agent_name: str
+    spec: Optional[AgentSpecification]
+    size_bytes: int
+    parse_time_ms: float  # Read, parse and validate time for this agent
+    error: Optional[str] = None
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        """Whether the spec loaded without errors or validation issues"""
+        return self.error is None and not self.issues
+
+
+def normalize_tools(tools) -> List[str]:
+    """Tool list from frontmatter given as a list or a comma-separated string"""
+    if not tools:
+        return []
+    if isinstance(tools, str):
+        return [tool.strip() for tool in tools.split(",") if tool.strip()]
+    return [str(tool) for tool in tools]
+
+
+@dataclass
+class CachedSpec:
+    """A loaded specification and the file state it was read from"""
+    agent_name: str
+    path: Optional[Path]  # None for a generated default
+    mtime_ns: int
+    size: int
+    content_hash: str
+    content: str
+    spec: Optional[AgentSpecification] = None  # Parsed on first use
+
+
+@dataclass
+class SpecChangeEvent:
+    """Published when a loaded agent's specification content changes"""
+    agent_name: str
+    kind: str  # "modified", "created" (replaced a default) or "deleted" (fell back to one)
+    old_hash: str
+    new_hash: str
+    path: Optional[Path] = None
+    detected_at: float = 0.0
+
+
 class AgentSpecLoader:
     """Load agent specifications from optimized_versions directory"""
 
-    def __init__(self, base_path: str = None):
-        """Initialize specification loader"""
+    def __init__(self, base_path: str = None, bundle_path: str = None, use_bundle: bool = True,
+                 validate_on_access: bool = True):
+        """
+        Initialize specification loader
+
+        Cached specs are keyed by file path, mtime and content hash. With
+        validate_on_access each load stats the file and re-reads it when the
+        stat changed; a spec whose content hash is unchanged keeps its parsed
+        form. Generated defaults are cached too and are only re-checked by
+        refresh() (see spec_watcher.py to run it in the background).
+
+        Args:
+            base_path: Directory containing optimized_versions
+            bundle_path: Precompiled spec bundle (see spec_bundle.py); the
+                default bundle is used when it exists
+            use_bundle: Set False to always parse the markdown files
+            validate_on_access: Set False to trust cached specs until refresh()
+        """
         if base_path:
             self.base_path = Path(base_path)
         else:
             # Default to the content_subagent_files directory
-            self.base_path = Path(__file__).parent.parent.parent / "content_creation_subagents" / "content_subagent_files"
+            self.base_path = Path(__file__).parent.parent.parent / "content_subagent_files"
 
         self.optimized_dir = self.base_path / "optimized_versions"
-        self.cache = {}
+        self.validate_on_access = validate_on_access
+        self.cache: Dict[str, CachedSpec] = {}
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[SpecChangeEvent], None]] = []
+        self.stats = {"hits": 0, "loads": 0, "revalidated": 0, "changes": 0}
+
+        self.bundle = None
+        if use_bundle:
+            # Imported here: spec_bundle itself builds on this module
+            from spec_bundle import load_spec_bundle
+            bundle = load_spec_bundle(bundle_path)
+            if bundle is not None and Path(bundle.source_dir) == self.optimized_dir.resolve():
+                self.bundle = bundle
+
+    def subscribe(self, callback: Callable[[SpecChangeEvent], None]) -> Callable[[SpecChangeEvent], None]:
+        """
+        Register a callback for spec change events
+
+        Callbacks run on the thread that detected the change (a loading
+        thread or the spec watcher) and must not raise.
+
+        Returns:
+            The callback, for unsubscribe()
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[SpecChangeEvent], None]):
+        """Remove a registered callback"""
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def _publish(self, events: List[SpecChangeEvent]):
+        """Deliver change events to every subscriber"""
+        if not events:
+            return
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for event in events:
+            for callback in subscribers:
+                try:
+                    callback(event)
+                except Exception as e:
+                    print(f"Warning: spec change subscriber failed for {event.agent_name}: {e}")
+
+    def _get_entry(self, agent_name: str) -> CachedSpec:
+        """Return the cache entry for an agent, (re)loading it if needed"""
+        entry = self.cache.get(agent_name)
+        if entry is not None and (not self.validate_on_access or self._is_current(entry)):
+            self.stats["hits"] += 1
+            return entry
+
+        entry, event = self._reload(agent_name, entry)
+        self._publish([event] if event else [])
+        return entry
+
+    @staticmethod
+    def _is_current(entry: CachedSpec) -> bool:
+        """Whether a cached file still has the stat it was read with"""
+        if entry.path is None:
+            return True
+        try:
+            stat = entry.path.stat()
+        except OSError:
+            return False
+        return stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size
+
+    def _reload(self, agent_name: str, previous: Optional[CachedSpec]) -> Tuple[CachedSpec, Optional[SpecChangeEvent]]:
+        """
+        Read an agent's spec into the cache
+
+        Returns:
+            The new entry and the change event, if its content changed
+        """
+        entry = self._read_entry(agent_name)
+        with self._lock:
+            self.stats["loads"] += 1
+            current = self.cache.get(agent_name)
+            if current is not previous and current is not None:
+                # Another thread reloaded it first and published any change
+                return current, None
+            if previous is not None and previous.path == entry.path and previous.content_hash == entry.content_hash:
+                # Touched but identical: keep the parsed spec, adopt the new stat
+                previous.mtime_ns, previous.size = entry.mtime_ns, entry.size
+                self.stats["revalidated"] += 1
+                return previous, None
+
+            self.cache[agent_name] = entry
+            if previous is None:
+                return entry, None
+
+            self.stats["changes"] += 1
+            if previous.path is None:
+                kind = "created"
+            elif entry.path is None:
+                kind = "deleted"
+            else:
+                kind = "modified"
+            return entry, SpecChangeEvent(
+                agent_name=agent_name,
+                kind=kind,
+                old_hash=previous.content_hash,
+                new_hash=entry.content_hash,
+                path=entry.path or previous.path,
+                detected_at=time.time()
+            )
+
+    def _read_entry(self, agent_name: str) -> CachedSpec:
+        """Read an agent's spec file, or generate its default"""
+        bundled = self.bundle.entries.get(agent_name) if self.bundle is not None else None
+        agent_file = self._find_agent_file(agent_name)
+
+        if agent_file:
+            try:
+                stat = agent_file.stat()
+                if bundled is not None and stat.st_mtime_ns == bundled.mtime_ns and stat.st_size == bundled.size:
+                    return CachedSpec(agent_name, agent_file, stat.st_mtime_ns, stat.st_size,
+                                      bundled.content_hash, bundled.content, bundled.spec)
+
+                with open(agent_file, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                content_hash = compute_spec_hash(content)
+                # A touched file whose content still matches the bundle keeps its compiled spec
+                spec = bundled.spec if bundled is not None and bundled.content_hash == content_hash else None
+                return CachedSpec(agent_name, agent_file, stat.st_mtime_ns, stat.st_size,
+                                  content_hash, content, spec)
+
+            except Exception as e:
+                print(f"Error loading agent spec for {agent_name}: {e}")
+
+        # Default specification if the file is missing or unreadable
+        content = self._generate_default_spec(agent_name)
+        return CachedSpec(agent_name, None, 0, 0, compute_spec_hash(content), content)
+
+    def refresh(self, agent_names: Optional[List[str]] = None) -> List[SpecChangeEvent]:
+        """
+        Re-check cached specs against the filesystem and reload changed ones
+
+        Files whose stat changed are re-read, and agents served a generated
+        default are checked for a file that has since appeared. Subscribers
+        are notified of every content change.
+
+        Args:
+            agent_names: Agents to check (defaults to every cached agent)
+
+        Returns:
+            Change events for the agents whose content changed
+        """
+        names = list(self.cache) if agent_names is None else [name for name in agent_names if name in self.cache]
+        events = []
+        for agent_name in names:
+            entry = self.cache.get(agent_name)
+            if entry is None:
+                continue
+            if entry.path is None:
+                if self._find_agent_file(agent_name) is None:
+                    continue
+            elif self._is_current(entry):
+                continue
+
+            _, event = self._reload(agent_name, entry)
+            if event:
+                events.append(event)
+
+        self._publish(events)
+        return events
+
+    def invalidate(self, agent_name: Optional[str] = None):
+        """Drop one agent's cached spec, or all of them, without publishing events"""
+        with self._lock:
+            if agent_name is None:
+                self.cache.clear()
+            else:
+                self.cache.pop(agent_name, None)
 
     def load_agent_spec(self, agent_name: str) -> str:
         """
@@ -62,28 +395,11 @@ class AgentSpecLoader:
         Returns:
             Complete agent specification as string
         """
-        # Check cache first
-        if agent_name in self.cache:
-            return self.cache[agent_name]
-
-        # Try to find the agent file
-        agent_file = self._find_agent_file(agent_name)
-
-        if not agent_file:
-            # Return a default specification if file not found
-            return self._generate_default_spec(agent_name)
-
-        try:
-            with open(agent_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Cache the content
-            self.cache[agent_name] = content
-            return content
+        return self._get_entry(agent_name).content
 
-        except Exception as e:
-            print(f"Error loading agent spec for {agent_name}: {e}")
-            return self._generate_default_spec(agent_name)
+    def get_spec_hash(self, agent_name: str) -> str:
+        """Return the content hash of the resolved specification for an agent"""
+        return self._get_entry(agent_name).content_hash
 
     def parse_agent_spec(self, agent_name: str) -> AgentSpecification:
         """
@@ -95,8 +411,13 @@ class AgentSpecLoader:
         Returns:
             Parsed AgentSpecification object
         """
-        content = self.load_agent_spec(agent_name)
+        entry = self._get_entry(agent_name)
+        if entry.spec is None:
+            entry.spec = self.parse_spec_content(agent_name, entry.content)
+        return entry.spec
 
+    def parse_spec_content(self, agent_name: str, content: str) -> AgentSpecification:
+        """Parse specification text for an agent"""
         # Extract YAML frontmatter if present
         yaml_data = self.extract_yaml_frontmatter(content)
 
@@ -108,7 +429,7 @@ class AgentSpecLoader:
             name=yaml_data.get("name", agent_name),
             description=yaml_data.get("description", sections.get("description", "")),
             model=yaml_data.get("model", "sonnet"),
-            tools=yaml_data.get("tools", []),
+            tools=normalize_tools(yaml_data.get("tools")),
             prompt=sections.get("prompt", content),
             examples=sections.get("examples"),
             guardrails=sections.get("guardrails"),
@@ -134,7 +455,7 @@ class AgentSpecLoader:
         if match:
             yaml_content = match.group(1)
             try:
-                return yaml.safe_load(yaml_content) or {}
+                return yaml.load(yaml_content, Loader=YAML_LOADER) or {}
             except yaml.YAMLError as e:
                 print(f"Error parsing YAML frontmatter: {e}")
                 return {}
@@ -164,30 +485,36 @@ class AgentSpecLoader:
 
         return None
 
-    def _extract_markdown_sections(self, content: str) -> Dict[str, str]:
-        """Extract sections from markdown content"""
-        sections = {}
+    # Sections mapped onto AgentSpecification fields
+    SPEC_SECTIONS = ("description", "prompt", "examples", "guardrails", "instructions")
 
-        # Remove YAML frontmatter if present
-        content = re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, flags=re.DOTALL)
+    def extract_sections(self, content: str) -> Dict[str, str]:
+        """
+        Extract every level one and two section of a spec
 
-        # Extract common sections
-        section_patterns = {
-            "description": r'##?\s*Description\s*\n(.*?)(?=\n##?\s|\Z)',
-            "prompt": r'##?\s*Prompt\s*\n(.*?)(?=\n##?\s|\Z)',
-            "examples": r'##?\s*Examples?\s*\n(.*?)(?=\n##?\s|\Z)',
-            "guardrails": r'##?\s*Guardrails?\s*\n(.*?)(?=\n##?\s|\Z)',
-            "instructions": r'##?\s*Instructions?\s*\n(.*?)(?=\n##?\s|\Z)'
-        }
+        Args:
+            content: Markdown file content
 
-        for section_name, pattern in section_patterns.items():
-            match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-            if match:
-                sections[section_name] = match.group(1).strip()
+        Returns:
+            Mapping of lowercased heading to stripped section text
+        """
+        index = index_markdown_sections(content, frontmatter_end(content))
+        return {name: content[start:end].strip() for name, (start, end) in index.items()}
+
+    def _extract_markdown_sections(self, content: str) -> Dict[str, str]:
+        """Extract the specification sections from markdown content"""
+        body_start = frontmatter_end(content)
+        index = index_markdown_sections(content, body_start)
+
+        sections = {}
+        for section_name in self.SPEC_SECTIONS:
+            span = index.get(section_name)
+            if span is not None:
+                sections[section_name] = content[span[0]:span[1]].strip()
 
         # If no prompt section found, use the entire content as prompt
         if "prompt" not in sections:
-            sections["prompt"] = content.strip()
+            sections["prompt"] = content[body_start:].strip()
 
         return sections
 
@@ -306,8 +633,18 @@ Return appropriate JSON output based on your function.
 
     def get_agent_metadata(self, agent_name: str) -> Dict:
         """Get metadata for an agent without loading full spec"""
-        content = self.load_agent_spec(agent_name)
-        return self.extract_yaml_frontmatter(content)
+        entry = self._get_entry(agent_name)
+        if entry.spec is not None:
+            return dict(entry.spec.metadata or {})
+        return self.extract_yaml_frontmatter(entry.content)
+
+    def get_statistics(self) -> Dict:
+        """Cache counters"""
+        return {
+            "cached_specs": len(self.cache),
+            "bundled": self.bundle is not None,
+            **self.stats
+        }
 
     def validate_spec(self, agent_name: str) -> Tuple[bool, List[str]]:
         """
@@ -316,39 +653,114 @@ Return appropriate JSON output based on your function.
         Returns:
             Tuple of (is_valid, list_of_issues)
         """
+        try:
+            issues = self._spec_issues(self.parse_agent_spec(agent_name))
+        except Exception as e:
+            issues = [f"Error parsing specification: {e}"]
+
+        return len(issues) == 0, issues
+
+    def _spec_issues(self, spec: AgentSpecification) -> List[str]:
+        """Validation issues for a parsed specification"""
         issues = []
 
-        try:
-            spec = self.parse_agent_spec(agent_name)
+        # Check required fields
+        if not spec.name:
+            issues.append("Missing agent name")
+        if not spec.description:
+            issues.append("Missing description")
+        if not spec.model:
+            issues.append("Missing model specification")
+        if not spec.prompt:
+            issues.append("Missing prompt/instructions")
+
+        # Validate model choice
+        valid_models = ["haiku", "sonnet", "opus"]
+        if spec.model and spec.model not in valid_models:
+            issues.append(f"Invalid model: {spec.model}")
+
+        # Check tools are valid
+        valid_tools = [
+            "Read", "Write", "Edit", "MultiEdit",
+            "WebSearch", "WebFetch", "Bash", "Grep", "Glob"
+        ]
+        for tool in spec.tools:
+            if tool not in valid_tools:
+                issues.append(f"Unknown tool: {tool}")
 
-            # Check required fields
-            if not spec.name:
-                issues.append("Missing agent name")
-            if not spec.description:
-                issues.append("Missing description")
-            if not spec.model:
-                issues.append("Missing model specification")
-            if not spec.prompt:
-                issues.append("Missing prompt/instructions")
-
-            # Validate model choice
-            valid_models = ["haiku", "sonnet", "opus"]
-            if spec.model and spec.model not in valid_models:
-                issues.append(f"Invalid model: {spec.model}")
-
-            # Check tools are valid
-            valid_tools = [
-                "Read", "Write", "Edit", "MultiEdit",
-                "WebSearch", "WebFetch", "Bash", "Grep", "Glob"
-            ]
-            for tool in spec.tools:
-                if tool not in valid_tools:
-                    issues.append(f"Unknown tool: {tool}")
+        return issues
 
-        except Exception as e:
-            issues.append(f"Error parsing specification: {e}")
+    def load_all_specs(self, parallel: bool = True, validate: bool = False,
+                       max_workers: int = 8) -> Dict[str, SpecLoadResult]:
+        """
+        Load and parse every available specification
 
-        return len(issues) == 0, issues
+        Files that are neither cached nor bundled are read and parsed on a
+        thread pool, and each result records how long its agent took so slow
+        or oversized specs stand out.
+
+        Args:
+            parallel: Load on a thread pool (False loads one file at a time)
+            validate: Also run validate_spec's checks on each spec
+            max_workers: Thread pool size
+
+        Returns:
+            Results keyed by agent name, in list_available_agents() order
+        """
+        agents = self.list_available_agents()
+
+        # Only files that must be read and parsed go to the pool; a cached or
+        # bundled spec costs a stat, which the pool's overhead would dwarf
+        results = {}
+        pending = [
+            agent for agent in agents
+            if agent not in self.cache and (self.bundle is None or agent not in self.bundle.entries)
+        ]
+        if parallel and len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending)),
+                                    thread_name_prefix="spec-loader") as pool:
+                for result in pool.map(lambda agent: self._load_one(agent, validate), pending):
+                    results[result.agent_name] = result
+
+        return {
+            agent: results.get(agent) or self._load_one(agent, validate)
+            for agent in agents
+        }
+
+    def validate_all_specs(self, parallel: bool = True, max_workers: int = 8) -> Dict[str, SpecLoadResult]:
+        """
+        Validate every available specification (see load_all_specs)
+
+        Returns:
+            Results keyed by agent name; result.valid and result.issues
+            hold the outcome
+        """
+        return self.load_all_specs(parallel=parallel, validate=True, max_workers=max_workers)
+
+    def _load_one(self, agent_name: str, validate: bool) -> SpecLoadResult:
+        """Load, parse and optionally validate one agent, timing it"""
+        started = time.perf_counter()
+        spec = None
+        size = 0
+        error = None
+        issues = []
+
+        try:
+            size = len(self._get_entry(agent_name).content.encode("utf-8"))
+            spec = self.parse_agent_spec(agent_name)
+            if validate:
+                issues = self._spec_issues(spec)
+        except Exception as e:
+            error = f"Error parsing specification: {e}"
+
+        return SpecLoadResult(
+            agent_name=agent_name,
+            spec=spec,
+            size_bytes=size,
+            parse_time_ms=(time.perf_counter() - started) * 1000,
+            error=error,
+            issues=issues
+        )
 
     def export_all_specs(self, output_path: str = None) -> str:
         """Export all agent specifications to a JSON file"""
@@ -356,14 +768,11 @@ Return appropriate JSON output based on your function.
             output_path = "agent_specifications.json"
 
         all_specs = {}
-        agents = self.list_available_agents()
-
-        for agent in agents:
-            try:
-                spec = self.parse_agent_spec(agent)
-                all_specs[agent] = spec.to_dict()
-            except Exception as e:
-                print(f"Error exporting {agent}: {e}")
+        for agent, result in self.load_all_specs().items():
+            if result.error:
+                print(f"Error exporting {agent}: {result.error}")
+            else:
+                all_specs[agent] = result.spec.to_dict()
 
         with open(output_path, 'w') as f:
             json.dump(all_specs, f, indent=2)
@@ -373,39 +782,41 @@ Return appropriate JSON output based on your function.
 
 # Model selection helper
 class ModelSelector:
-    """Select appropriate model based on agent requirements"""
+    """
+    Select appropriate model based on agent requirements
+
+    Routing comes from a RoutingTable (see model_routing.py) merged from
+    model_routing.overrides, the model_preferences agent lists and the spec
+    frontmatter, in that order of precedence.
+    """
+
+    def __init__(self, config: Dict = None, routing_table: RoutingTable = None,
+                 loader: "AgentSpecLoader" = None):
+        """
+        Initialize model selector
 
-    def __init__(self):
-        """Initialize model selector"""
+        Args:
+            config: task_integration config; model_preferences and
+                model_routing default to task_integration.json's
+            routing_table: Prebuilt table (config and loader are then unused)
+            loader: Loader for frontmatter models (a default one if None)
+        """
+        if routing_table is None:
+            config = config or {}
+            if "model_preferences" not in config:
+                config = {**load_routing_config(), **config}
+
+            frontmatter = None
+            if (config.get("model_routing") or {}).get("use_frontmatter", True):
+                frontmatter = frontmatter_models(loader or AgentSpecLoader())
+            routing_table = build_routing_table(config, frontmatter)
+
+        self.routing_table = routing_table
         self.model_mapping = {
-            "haiku": [
-                "keyword-researcher", "grammar-checker", "readability-scorer",
-                "link-validator", "command-demonstrator", "solution-provider",
-                "twitter-formatter", "linkedin-adapter", "instagram-packager",
-                "metrics-collector"
-            ],
-            "sonnet": [
-                "topic-scout", "source-gatherer", "competitor-analyzer",
-                "fact-verifier", "angle-definer", "audience-profiler",
-                "template-selector", "outline-builder", "intro-writer",
-                "body-writer", "conclusion-writer", "quote-integrator",
-                "code-example-writer", "api-documenter", "error-handler",
-                "step-sequencer", "exercise-designer", "style-editor",
-                "flow-optimizer", "ai-prompt-engineer", "chart-designer",
-                "infographic-planner", "thumbnail-creator", "diagram-sketcher",
-                "content-atomizer", "newsletter-curator", "trend-spotter"
-            ],
-            "opus": [
-                "content-planner", "spec-writer", "concept-explainer",
-                "improvement-advisor"
-            ]
+            model: list(routing_table.agents_for_model(model)) for model in routing_table.tiers
         }
-
-        # Reverse mapping for quick lookup
-        self.agent_to_model = {}
-        for model, agents in self.model_mapping.items():
-            for agent in agents:
-                self.agent_to_model[agent] = model
+        # Agent to model lookup (read-only)
+        self.agent_to_model = routing_table.models
 
     def get_model_for_agent(self, agent_name: str) -> str:
         """
@@ -417,12 +828,19 @@ class ModelSelector:
         Returns:
             Model name (haiku, sonnet, or opus)
         """
-        return self.agent_to_model.get(agent_name, "sonnet")
+        return self.routing_table.model_for(agent_name)
 
     def get_agents_for_model(self, model: str) -> List[str]:
         """Get all agents that use a specific model"""
         return self.model_mapping.get(model, [])
 
+    def get_max_tokens(self, agent_name: str, model: str = None) -> int:
+        """Completion token budget for an agent's call on model (its routed tier by default)"""
+        return self.routing_table.max_tokens(agent_name, model)
+
+    def get_cost_per_1k_tokens(self, agent_name: str, model: str = None) -> float:
+        """USD per 1k tokens for an agent's call on model (its routed tier by default)"""
+        return self.routing_table.cost_per_1k_tokens(agent_name, model)
 
 if __name__ == "__main__":
     # Test the specification loader
@@ -451,6 +869,19 @@ if __name__ == "__main__":
     if issues:
         print(f"  Issues: {issues}")
 
+    # Validate the whole catalog
+    print("\nValidating all specifications...")
+    started = time.perf_counter()
+    results = loader.validate_all_specs()
+    elapsed = (time.perf_counter() - started) * 1000
+    invalid = [result for result in results.values() if not result.valid]
+    slowest = max(results.values(), key=lambda result: result.parse_time_ms, default=None)
+    print(f"  {len(results) - len(invalid)}/{len(results)} valid in {elapsed:.1f}ms")
+    if slowest:
+        print(f"  Slowest: {slowest.agent_name} ({slowest.parse_time_ms:.2f}ms, {slowest.size_bytes} bytes)")
+    for result in invalid:
+        print(f"  {result.agent_name}: {result.error or result.issues}")
+
     # Test model selector
     print("\nTesting Model Selector...")
     selector = ModelSelector()
@@ -458,6 +889,8 @@ if __name__ == "__main__":
     for agent in ["keyword-researcher", "body-writer", "spec-writer"]:
         model = selector.get_model_for_agent(agent)
         print(f"  {agent}: {model}")
+    for agent, sources in sorted(selector.routing_table.conflicts().items()):
+        print(f"  Sources disagree on {agent}: {sources}")
 
     # Export all specifications
     print("\nExporting all specifications...")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Cost Budget
+Run-level cost ceiling with per-call reservations priced by model tier
+"""
+
+import threading
+from typing import Dict, Optional
+
+# Fallback prices (USD per 1k tokens) when model_preferences doesn't set them
+DEFAULT_COST_PER_1K_TOKENS = {"haiku": 0.0008, "sonnet": 0.003, "opus": 0.015}
+
+# What to do with a call that would exceed the budget
+EXCEEDED_ACTIONS = ("mock", "stop")
+
+
+def prices_from_config(config: Dict) -> Dict[str, float]:
+    """USD per 1k tokens per model tier from model_preferences, with defaults"""
+    prices = dict(DEFAULT_COST_PER_1K_TOKENS)
+    for model, preferences in (config.get("model_preferences") or {}).items():
+        if "cost_per_1k_tokens" in preferences:
+            prices[model] = preferences["cost_per_1k_tokens"]
+    return prices
+
+
+def price_tokens(prices: Dict[str, float], model: str, tokens: int) -> float:
+    """Cost in USD of tokens on a model tier (unknown tiers priced as sonnet)"""
+    return tokens / 1000 * prices.get(model, prices.get("sonnet", DEFAULT_COST_PER_1K_TOKENS["sonnet"]))
+
+
+class BudgetReservation:
+    """Estimated cost held against the budget while one call runs"""
+
+    def __init__(self, agent_name: str, model: str, amount: float):
+        """Initialize reservation of amount USD"""
+        self.agent_name = agent_name
+        self.model = model
+        self.amount = amount
+
+
+class BudgetManager:
+    """
+    Hard cost ceiling for a run
+
+    Before a call is dispatched its worst-case cost (prompt plus the
+    model's max_tokens completion) is reserved. A call whose reservation
+    would take committed plus reserved spend past max_cost_per_run is
+    refused, so concurrent calls can't jointly overshoot the ceiling. When
+    the call finishes the reservation is replaced by its actual cost.
+    """
+
+    def __init__(self, max_cost: Optional[float], prices: Dict[str, float] = None,
+                 on_exceeded: str = "mock", routing_table=None):
+        """
+        Initialize budget
+
+        Args:
+            max_cost: Ceiling in USD for the run (None for no ceiling)
+            prices: USD per 1k tokens per model tier
+            on_exceeded: 'mock' to degrade refused calls to mock execution,
+                'stop' to fail them
+            routing_table: RoutingTable whose per-agent prices take
+                precedence over the tier prices
+        """
+        if on_exceeded not in EXCEEDED_ACTIONS:
+            raise ValueError(f"Unknown budget action '{on_exceeded}', expected one of {EXCEEDED_ACTIONS}")
+
+        self.max_cost = max_cost
+        self.prices = dict(DEFAULT_COST_PER_1K_TOKENS)
+        self.prices.update(prices or {})
+        self.on_exceeded = on_exceeded
+        self.routing_table = routing_table
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def from_config(cls, config: Dict, routing_table=None) -> Optional["BudgetManager"]:
+        """Build from budget, performance_limits and model_preferences, or None if disabled"""
+        budget_config = config.get("budget") or {}
+        if not budget_config.get("enabled", False):
+            return None
+
+        return cls(
+            max_cost=(config.get("performance_limits") or {}).get("max_cost_per_run"),
+            prices=prices_from_config(config),
+            on_exceeded=budget_config.get("on_exceeded", "mock"),
+            routing_table=routing_table
+        )
+
+    def reset(self):
+        """Start a new run with nothing spent"""
+        with self._lock:
+            self.spent = 0.0
+            self.reserved = 0.0
+            self.by_model = {}
+            self.by_agent = {}
+            self.refused = 0
+
+    def price(self, model: str, tokens: int) -> float:
+        """Cost in USD of tokens on a model tier"""
+        return price_tokens(self.prices, model, tokens)
+
+    def price_call(self, agent_name: str, model: str, tokens: int) -> float:
+        """Cost in USD of tokens for an agent's call, at its routed price when it has one"""
+        if self.routing_table is not None:
+            return self.routing_table.price(agent_name, model, tokens)
+        return self.price(model, tokens)
+
+    def reserve(self, agent_name: str, model: str, estimated_tokens: int) -> Optional[BudgetReservation]:
+        """
+        Reserve the estimated cost of a call
+
+        Returns:
+            The reservation, or None if it would exceed the budget
+        """
+        amount = self.price_call(agent_name, model, estimated_tokens)
+        with self._lock:
+            if self.max_cost is not None and self.spent + self.reserved + amount > self.max_cost:
+                self.refused += 1
+                return None
+            self.reserved += amount
+        return BudgetReservation(agent_name, model, amount)
+
+    def commit(self, reservation: BudgetReservation, tokens_used: int) -> float:
+        """
+        Replace a reservation with the call's actual cost
+
+        Returns:
+            The actual cost
+        """
+        cost = self.price_call(reservation.agent_name, reservation.model, tokens_used)
+        with self._lock:
+            self.reserved -= reservation.amount
+            self.spent += cost
+            self.by_model[reservation.model] = self.by_model.get(reservation.model, 0.0) + cost
+            self.by_agent[reservation.agent_name] = self.by_agent.get(reservation.agent_name, 0.0) + cost
+        return cost
+
+    def release(self, reservation: BudgetReservation):
+        """Drop a reservation for a call that was never billed"""
+        with self._lock:
+            self.reserved -= reservation.amount
+
+    def remaining(self) -> Optional[float]:
+        """Unreserved budget left in USD (None without a ceiling)"""
+        if self.max_cost is None:
+            return None
+        with self._lock:
+            return max(0.0, self.max_cost - self.spent - self.reserved)
+
+    def get_statistics(self) -> Dict:
+        """Spend against the ceiling"""
+        with self._lock:
+            return {
+                "max_cost": self.max_cost,
+                "spent": round(self.spent, 6),
+                "reserved": round(self.reserved, 6),
+                "remaining": (
+                    None if self.max_cost is None
+                    else round(max(0.0, self.max_cost - self.spent - self.reserved), 6)
+                ),
+                "refused_calls": self.refused,
+                "on_exceeded": self.on_exceeded,
+                "by_model": {model: round(cost, 6) for model, cost in self.by_model.items()},
+                "by_agent": {agent: round(cost, 6) for agent, cost in self.by_agent.items()}
+            }
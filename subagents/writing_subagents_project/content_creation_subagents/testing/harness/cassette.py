@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Execution Cassette
+Record agent responses to an indexed JSONL file and replay them offline
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CASSETTE_MODES = ("off", "record", "replay")
+
+# What replay does for a call that was never recorded
+MISS_ACTIONS = ("error", "live")
+
+
+class Cassette:
+    """
+    Append-only JSONL recording of agent executions
+
+    Each line holds one response (output, success, error, latency and token
+    counts) under the execution's cache key. On open the file is scanned
+    once to index the byte offset of every entry, and entries are read with
+    a seek on demand, so replaying a large cassette doesn't load it whole.
+
+    A key recorded several times (e.g. a failure followed by a successful
+    retry) replays its entries in recorded order, then keeps serving the
+    last one, so a replayed run sees the same sequence as the recorded one.
+    Every line carries the id of the recording session that wrote it; when
+    a later session records a key again, its entries replace the earlier
+    session's rather than queueing behind them. compact() drops the
+    replaced lines from the file.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open (or create on first record) a cassette
+
+        Args:
+            path: JSONL file
+        """
+        self.path = Path(path)
+        self.session = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._index = {}
+        self._cursors = {}
+        self._session_keys = set()
+        self.stats = {"recorded": 0, "replayed": 0, "misses": 0, "superseded": 0}
+        self._build_index()
+
+    def _build_index(self):
+        """Map every key in the file to the offsets of its latest session's entries"""
+        self._index = {}
+        self.stats["superseded"] = 0
+        if not self.path.exists():
+            return
+
+        sessions = {}
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    key = entry["key"]
+                    session = entry.get("session")
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    # Torn final line from an interrupted recording
+                    pass
+                else:
+                    if key in self._index and sessions[key] == session:
+                        self._index[key].append(offset)
+                    else:
+                        self.stats["superseded"] += len(self._index.get(key, ()))
+                        self._index[key] = [offset]
+                        sessions[key] = session
+                offset += len(line)
+
+    def __len__(self) -> int:
+        return sum(len(offsets) for offsets in self._index.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def record(self, key: str, entry: Dict):
+        """Append a response under key, replacing entries from earlier sessions"""
+        line = (json.dumps(
+            {"key": key, "session": self.session, "recorded_at": time.time(), **entry}, default=str
+        ) + "\n").encode("utf-8")
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'ab') as f:
+                offset = f.tell()
+                f.write(line)
+            if key in self._session_keys:
+                self._index[key].append(offset)
+            else:
+                self.stats["superseded"] += len(self._index.get(key, ()))
+                self._index[key] = [offset]
+                self._cursors.pop(key, None)
+                self._session_keys.add(key)
+            self.stats["recorded"] += 1
+
+    def compact(self) -> int:
+        """
+        Rewrite the file without replaced entries
+
+        Returns:
+            Number of lines dropped
+        """
+        with self._lock:
+            dropped = self.stats["superseded"]
+            if not dropped:
+                return 0
+
+            live = sorted(offset for offsets in self._index.values() for offset in offsets)
+            temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(self.path, 'rb') as source, open(temp_path, 'wb') as target:
+                for offset in live:
+                    source.seek(offset)
+                    target.write(source.readline())
+            os.replace(temp_path, self.path)
+
+            self._build_index()
+            self._cursors.clear()
+            return dropped
+
+    def play(self, key: str) -> Optional[Dict]:
+        """
+        Return the next recorded response for key
+
+        Returns:
+            The recorded entry, or None if key was never recorded
+        """
+        with self._lock:
+            offsets = self._index.get(key)
+            if not offsets:
+                self.stats["misses"] += 1
+                return None
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            offset = offsets[min(position, len(offsets) - 1)]
+            self.stats["replayed"] += 1
+
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def rewind(self):
+        """Restart every key's replay sequence from its first entry"""
+        with self._lock:
+            self._cursors.clear()
+
+    def keys(self) -> List[str]:
+        """Recorded keys"""
+        return list(self._index)
+
+    def get_statistics(self) -> Dict:
+        """Size and record/replay counters"""
+        return {
+            "path": str(self.path),
+            "keys": len(self._index),
+            "entries": len(self),
+            **self.stats
+        }
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Mock Outputs
+Canned agent outputs shared by the mock backend and the stand-in server
+"""
+
+from typing import Any, Dict
+
+# Input key marking a multi-input prompt built by execute_agent_batch
+BATCH_INPUTS_KEY = "_batch_inputs"
+
+
+def generate_mock_response(agent_name: str, input_data: Dict) -> Any:
+    """Mock output for an execution, as a keyed list for batched inputs"""
+    if BATCH_INPUTS_KEY in input_data:
+        return [
+            {"key": key, "output": generate_mock_output(agent_name, entry_input)}
+            for key, entry_input in input_data[BATCH_INPUTS_KEY].items()
+        ]
+    return generate_mock_output(agent_name, input_data)
+
+
+def generate_mock_output(agent_name: str, input_data: Dict) -> Dict:
+    """Generate appropriate mock output based on agent type"""
+    # Agent-specific mock outputs
+    mock_outputs = {
+        "keyword-researcher": {
+            "primary_keyword": f"test keyword for {input_data.get('topic', 'topic')}",
+            "long_tail": ["long tail 1", "long tail 2", "long tail 3"],
+            "search_volume": "medium",
+            "difficulty": "medium"
+        },
+        "topic-scout": {
+            "trending_topics": ["trend 1", "trend 2", "trend 3"],
+            "content_gaps": ["gap 1", "gap 2"],
+            "opportunities": ["opportunity 1", "opportunity 2"]
+        },
+        "source-gatherer": {
+            "sources": [
+                "https://source1.com",
+                "https://source2.com",
+                "https://source3.com",
+                "https://source4.com",
+                "https://source5.com"
+            ],
+            "key_points": ["point 1", "point 2", "point 3"]
+        },
+        "body-writer": {
+            "body_content": f"Generated content for {input_data.get('outline', ['topic'])[0]}...",
+            "sections_written": input_data.get("sections", ["section 1", "section 2"])
+        },
+        "grammar-checker": {
+            "corrected_content": input_data.get("content", "corrected text"),
+            "errors_found": ["error 1", "error 2"]
+        },
+        "content-atomizer": {
+            "key_points": ["key point 1", "key point 2", "key point 3"],
+            "snippets": ["snippet 1", "snippet 2"]
+        }
+    }
+
+    # Return specific mock or generic
+    if agent_name in mock_outputs:
+        return mock_outputs[agent_name]
+    else:
+        return {
+            "status": "completed",
+            "output": f"Mock output for {agent_name}",
+            "data": input_data
+        }
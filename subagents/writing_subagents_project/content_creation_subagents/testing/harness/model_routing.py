@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Model Routing
+Immutable agent-to-model routing table merged from overrides, config and spec frontmatter
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from budget import DEFAULT_COST_PER_1K_TOKENS, prices_from_config
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config" / "task_integration.json"
+
+DEFAULT_MODEL = "sonnet"
+
+# Completion budget for a tier whose model_preferences don't set max_tokens
+DEFAULT_MAX_TOKENS = 2000
+
+# Route sources, highest precedence first
+ROUTE_SOURCES = ("override", "config", "frontmatter", "default")
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """Settings shared by every agent on a model tier"""
+    max_tokens: int
+    cost_per_1k_tokens: float
+
+
+@dataclass(frozen=True)
+class AgentRoute:
+    """Resolved model and limits for one agent"""
+    agent_name: str
+    model: str
+    source: str  # One of ROUTE_SOURCES
+    max_tokens: int
+    cost_per_1k_tokens: float
+    candidates: Tuple[Tuple[str, str], ...] = ()  # (source, model) for every source that named a model
+
+    @property
+    def conflicting(self) -> bool:
+        """Whether the sources that named a model disagree"""
+        return len({model for _, model in self.candidates}) > 1
+
+
+class RoutingTable:
+    """
+    Read-only routing of agents to model tiers
+
+    Built once from the merged sources; lookups are single dict probes on
+    MappingProxyType views, so the scheduler, rate limiter and budget can
+    call them per execution. The table pickles to plain dicts and rebuilds
+    its views on load, so it can be handed to worker processes (e.g. as a
+    ProcessPoolExecutor initializer argument) or inherited across fork.
+    """
+
+    def __init__(self, routes: Mapping[str, AgentRoute], tiers: Mapping[str, ModelTier],
+                 default_model: str = DEFAULT_MODEL):
+        """
+        Initialize table
+
+        Args:
+            routes: Route per agent name
+            tiers: Settings per model tier
+            default_model: Tier for agents without a route
+        """
+        self._routes = MappingProxyType(dict(routes))
+        self._tiers = MappingProxyType(dict(tiers))
+        self.default_model = default_model
+
+        self._models = MappingProxyType({agent: route.model for agent, route in self._routes.items()})
+        by_model = {}
+        for agent, model in sorted(self._models.items()):
+            by_model.setdefault(model, []).append(agent)
+        self._agents_by_model = MappingProxyType({model: tuple(agents) for model, agents in by_model.items()})
+
+    def __getstate__(self) -> Dict:
+        return {"routes": dict(self._routes), "tiers": dict(self._tiers), "default_model": self.default_model}
+
+    def __setstate__(self, state: Dict):
+        self.__init__(**state)
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def __contains__(self, agent_name: str) -> bool:
+        return agent_name in self._routes
+
+    @property
+    def routes(self) -> Mapping[str, AgentRoute]:
+        """Read-only route per agent"""
+        return self._routes
+
+    @property
+    def models(self) -> Mapping[str, str]:
+        """Read-only model tier per agent"""
+        return self._models
+
+    @property
+    def tiers(self) -> Mapping[str, ModelTier]:
+        """Read-only settings per model tier"""
+        return self._tiers
+
+    def route_for(self, agent_name: str) -> Optional[AgentRoute]:
+        """Route for an agent, or None if it isn't in the table"""
+        return self._routes.get(agent_name)
+
+    def model_for(self, agent_name: str) -> str:
+        """Model tier for an agent"""
+        return self._models.get(agent_name, self.default_model)
+
+    def agents_for_model(self, model: str) -> Tuple[str, ...]:
+        """Agents routed to a model tier"""
+        return self._agents_by_model.get(model, ())
+
+    def max_tokens(self, agent_name: str, model: str = None) -> int:
+        """
+        Completion token budget for an agent's call
+
+        Args:
+            agent_name: Agent name
+            model: Tier the call runs on, when it differs from the agent's
+                routed tier (e.g. a cascade escalation); the tier's limit
+                applies then instead of the agent's own
+        """
+        route = self._routes.get(agent_name)
+        if route is not None and (model is None or model == route.model):
+            return route.max_tokens
+        tier = self._tiers.get(model or self.default_model)
+        return tier.max_tokens if tier is not None else DEFAULT_MAX_TOKENS
+
+    def cost_per_1k_tokens(self, agent_name: str, model: str = None) -> float:
+        """USD per 1k tokens for an agent's call (see max_tokens for model)"""
+        route = self._routes.get(agent_name)
+        if route is not None and (model is None or model == route.model):
+            return route.cost_per_1k_tokens
+        tier = self._tiers.get(model or self.default_model) or self._tiers.get(self.default_model)
+        return tier.cost_per_1k_tokens if tier is not None else DEFAULT_COST_PER_1K_TOKENS[DEFAULT_MODEL]
+
+    def price(self, agent_name: str, model: str, tokens: int) -> float:
+        """Cost in USD of tokens for an agent's call on model"""
+        return tokens / 1000 * self.cost_per_1k_tokens(agent_name, model)
+
+    def conflicts(self) -> Dict[str, Dict[str, str]]:
+        """Agents whose sources disagree, with the model each source named"""
+        return {
+            agent: dict(route.candidates)
+            for agent, route in self._routes.items()
+            if route.conflicting
+        }
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly view of the table"""
+        return {
+            "default_model": self.default_model,
+            "tiers": {model: vars(tier).copy() for model, tier in self._tiers.items()},
+            "routes": {
+                agent: {
+                    "model": route.model,
+                    "source": route.source,
+                    "max_tokens": route.max_tokens,
+                    "cost_per_1k_tokens": route.cost_per_1k_tokens
+                }
+                for agent, route in self._routes.items()
+            },
+            "conflicts": self.conflicts()
+        }
+
+
+def load_routing_config(config_path: str = None) -> Dict:
+    """
+    Load the task_integration block that model routing is built from
+
+    Returns:
+        The block, or an empty dict if the config can't be read
+    """
+    path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+    try:
+        with open(path, 'r') as f:
+            return dict(json.load(f).get("task_integration", {}))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: could not load model routing config from {path}: {e}")
+        return {}
+
+
+def frontmatter_models(loader) -> Dict[str, str]:
+    """
+    Model named in each available spec's frontmatter
+
+    Args:
+        loader: AgentSpecLoader to read specs through
+
+    Returns:
+        Model per agent, for specs whose frontmatter names one
+    """
+    models = {}
+    for agent_name in loader.list_available_agents():
+        model = loader.get_agent_metadata(agent_name).get("model")
+        if isinstance(model, str) and model.strip():
+            models[agent_name] = model.strip().lower()
+    return models
+
+
+def build_routing_table(config: Dict, frontmatter: Mapping[str, str] = None,
+                        overrides: Mapping[str, object] = None) -> RoutingTable:
+    """
+    Merge routing sources into a table
+
+    Precedence, highest first: overrides (model_routing.overrides in the
+    config, then the overrides argument on top), the agents lists in
+    model_preferences, the spec frontmatter, and default_model. Overrides
+    map an agent to a tier name or to a dict with model and optionally
+    max_tokens and cost_per_1k_tokens for that agent alone.
+
+    Args:
+        config: task_integration config
+        frontmatter: Model per agent from spec frontmatter
+        overrides: Extra overrides taking precedence over the config's
+
+    Returns:
+        The routing table
+    """
+    routing_config = config.get("model_routing") or {}
+    default_model = routing_config.get("default_model", DEFAULT_MODEL)
+    preferences = config.get("model_preferences") or {}
+
+    prices = prices_from_config(config)
+    tiers = {
+        model: ModelTier(
+            max_tokens=(preferences.get(model) or {}).get("max_tokens", DEFAULT_MAX_TOKENS),
+            cost_per_1k_tokens=prices[model]
+        )
+        for model in {**prices, **preferences}
+    }
+
+    config_models = {}
+    for model, model_preferences in preferences.items():
+        for agent_name in model_preferences.get("agents", []):
+            config_models.setdefault(agent_name, model)
+
+    merged_overrides = {}
+    for source in (routing_config.get("overrides") or {}, overrides or {}):
+        for agent_name, override in source.items():
+            merged_overrides[agent_name] = override if isinstance(override, dict) else {"model": override}
+
+    for agent_name, override in merged_overrides.items():
+        if override.get("model") is not None and override["model"] not in tiers:
+            raise ValueError(f"Unknown model '{override['model']}' in routing override for {agent_name}")
+
+    frontmatter = {
+        agent_name: model for agent_name, model in (frontmatter or {}).items() if model in tiers
+    }
+
+    routes = {}
+    for agent_name in sorted({*merged_overrides, *config_models, *frontmatter}):
+        override = merged_overrides.get(agent_name, {})
+        candidates = tuple(
+            (source, model) for source, model in (
+                ("override", override.get("model")),
+                ("config", config_models.get(agent_name)),
+                ("frontmatter", frontmatter.get(agent_name))
+            )
+            if model is not None
+        )
+        source, model = candidates[0] if candidates else ("default", default_model)
+        tier = tiers[model]
+        routes[agent_name] = AgentRoute(
+            agent_name=agent_name,
+            model=model,
+            source=source,
+            max_tokens=override.get("max_tokens", tier.max_tokens),
+            cost_per_1k_tokens=override.get("cost_per_1k_tokens", tier.cost_per_1k_tokens),
+            candidates=candidates
+        )
+
+    return RoutingTable(routes, tiers, default_model)
+
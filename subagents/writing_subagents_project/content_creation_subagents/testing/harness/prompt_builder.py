@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Prompt Builder
+Agent prompts as a stable, cacheable prefix plus a per-input suffix
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from serialization import InputSerializer
+
+# Provider-side prompt cache marker for the prefix block
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+class AgentPrompt:
+    """A built prompt: the agent's shared prefix followed by this call's suffix"""
+
+    def __init__(self, prefix: str, suffix: str):
+        """Initialize from prefix and suffix text"""
+        self.prefix = prefix
+        self.suffix = suffix
+
+    @property
+    def text(self) -> str:
+        """The complete prompt"""
+        return self.prefix + self.suffix
+
+
+class PromptBuilder:
+    """
+    Assembles agent prompts so every call to an agent shares a prefix
+
+    Everything that depends only on the agent (role line, specification and
+    instructions) goes into the prefix, and only the input goes into the
+    suffix. The prefix is built once per agent, spec and prompt kind and the
+    same string object is reused afterwards, so it is byte-identical across
+    calls and a provider-side prompt cache can serve it. Batched prompts
+    have their own prefix since their instructions differ.
+    """
+
+    def __init__(self, cache_control: Optional[Dict] = None, serializer: InputSerializer = None):
+        """
+        Initialize builder
+
+        Args:
+            cache_control: Marker attached to the prefix block by
+                to_messages() (None to omit it)
+            serializer: Serializer for inputs (shared with the cache keys)
+        """
+        self.cache_control = cache_control
+        self.serializer = serializer or InputSerializer()
+        self._prefixes = {}
+        self._lock = threading.Lock()
+        self.stats = {"prefixes_built": 0, "prefix_reuses": 0, "prefix_chars_reused": 0}
+
+    @classmethod
+    def from_config(cls, config: Dict, serializer: InputSerializer = None) -> "PromptBuilder":
+        """Build from prompt_caching config"""
+        caching = config.get("prompt_caching") or {}
+        return cls(
+            cache_control=dict(EPHEMERAL_CACHE_CONTROL) if caching.get("enabled", True) else None,
+            serializer=serializer
+        )
+
+    def prefix(self, agent_name: str, agent_spec: str, batch: bool = False) -> str:
+        """Return the memoised prefix for an agent's single or batched prompts"""
+        key = (agent_name, agent_spec, batch)
+        prefix = self._prefixes.get(key)
+        if prefix is not None:
+            self.stats["prefix_reuses"] += 1
+            self.stats["prefix_chars_reused"] += len(prefix)
+            return prefix
+
+        prefix = self._build_prefix(agent_name, agent_spec, batch)
+        with self._lock:
+            # Keep the first string built so concurrent builders share one object
+            prefix = self._prefixes.setdefault(key, prefix)
+            self.stats["prefixes_built"] += 1
+        return prefix
+
+    def build(self, agent_name: str, agent_spec: str, input_data: Any,
+              batch_size: Optional[int] = None) -> AgentPrompt:
+        """
+        Build the prompt for one call
+
+        Args:
+            agent_name: Agent name
+            agent_spec: Agent specification
+            input_data: The call's input (keyed inputs for a batch)
+            batch_size: Number of keyed inputs when this is a batched prompt
+        """
+        batch = batch_size is not None
+        return AgentPrompt(
+            self.prefix(agent_name, agent_spec, batch),
+            self.suffix(input_data, batch_size)
+        )
+
+    def suffix(self, input_data: Any, batch_size: Optional[int] = None) -> str:
+        """Per-call part of the prompt, with the input as minified JSON"""
+        if batch_size is None:
+            return "## Input Data\n" + self.serializer.serialize(input_data).minified
+        return (
+            "## Input Data\n"
+            f"Process each of the following {batch_size} inputs independently.\n"
+            + self.serializer.minified_mapping(input_data)
+        )
+
+    def to_messages(self, prompt: AgentPrompt) -> Dict[str, List[Dict]]:
+        """
+        Messages-API shaped request body for a prompt
+
+        The prefix is sent as the system block, carrying cache_control so the
+        provider caches it, and the suffix as the user message.
+        """
+        system_block = {"type": "text", "text": prompt.prefix}
+        if self.cache_control is not None:
+            system_block["cache_control"] = self.cache_control
+        return {
+            "system": [system_block],
+            "messages": [{"role": "user", "content": [{"type": "text", "text": prompt.suffix}]}]
+        }
+
+    def invalidate(self, agent_name: Optional[str] = None):
+        """Drop memoised prefixes for one agent, or all of them"""
+        with self._lock:
+            if agent_name is None:
+                self._prefixes.clear()
+            else:
+                for key in [key for key in self._prefixes if key[0] == agent_name]:
+                    del self._prefixes[key]
+
+    def get_statistics(self) -> Dict:
+        """Prefix reuse counters"""
+        return {"cached_prefixes": len(self._prefixes), **self.stats}
+
+    @staticmethod
+    def _build_prefix(agent_name: str, agent_spec: str, batch: bool) -> str:
+        """Role line, specification and instructions for an agent"""
+        if batch:
+            instructions = [
+                f"Process each input according to your role as {agent_name}.",
+                'Return a JSON array with one element per input: {"key": <input key>, "output": <JSON output>}.',
+                "Each output must be in the expected JSON format with all required fields present."
+            ]
+        else:
+            instructions = [
+                f"Process the input according to your role as {agent_name}.",
+                "Return output in the expected JSON format.",
+                "Ensure all required fields are present."
+            ]
+
+        prompt_parts = [
+            f"You are the {agent_name} agent.",
+            "",
+            "## Agent Specification",
+            agent_spec,
+            "",
+            "## Instructions",
+            *instructions,
+            "",
+            ""
+        ]
+        return "\n".join(prompt_parts)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Rate Limiter
+Per-model token buckets and concurrency governors for agent executions
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Optional
+
+# Fallback limits per model tier when model_preferences doesn't specify them
+DEFAULT_RATE_LIMITS = {
+    "haiku": {"requests_per_minute": 1000, "tokens_per_minute": 400000, "max_concurrency": 16},
+    "sonnet": {"requests_per_minute": 500, "tokens_per_minute": 160000, "max_concurrency": 8},
+    "opus": {"requests_per_minute": 200, "tokens_per_minute": 80000, "max_concurrency": 4}
+}
+
+
+class TokenBucket:
+    """
+    Continuously refilling token bucket
+
+    Holds at most one minute's worth of tokens so a quiet period allows a
+    burst no larger than the provider's per-minute limit. The level may go
+    negative when a request turns out larger than reserved; later callers
+    then wait for the debt to refill.
+    """
+
+    def __init__(self, per_minute: float, capacity: float = None):
+        """Initialize a full bucket refilling at per_minute"""
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        """Add tokens accrued since the last update"""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def available(self) -> float:
+        """Tokens currently available"""
+        self._refill()
+        return self.level
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until amount tokens are available (0 if available now)"""
+        self._refill()
+        # Requests larger than the bucket could never be satisfied; cap them
+        amount = min(amount, self.capacity)
+        if self.level >= amount:
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (amount - self.level) / self.rate
+
+    def consume(self, amount: float):
+        """Remove tokens (may leave the bucket in debt)"""
+        self._refill()
+        self.level -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        """Return unused tokens"""
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimitLease:
+    """Reservation held by one execution while it runs"""
+
+    def __init__(self, limiter: Optional["ModelRateLimiter"], model: str, reserved_tokens: int):
+        """Initialize lease for reserved_tokens on model"""
+        self.limiter = limiter
+        self.model = model
+        self.reserved_tokens = reserved_tokens
+        self.tokens_used = None
+
+    def settle(self, tokens_used: int):
+        """Record the actual token usage of the execution"""
+        self.tokens_used = tokens_used
+
+    async def __aenter__(self) -> "RateLimitLease":
+        if self.limiter:
+            await self.limiter.acquire(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.limiter:
+            self.limiter.release(self)
+        return False
+
+
+class ModelRateLimiter:
+    """
+    Rate limiter with separate request, token and concurrency budgets per model
+
+    Callers queue in FIFO order per model until both the requests/min and
+    tokens/min buckets can cover them and a concurrency slot is free, so
+    throttling delays work instead of failing it. Tiers are independent: a
+    saturated opus bucket never holds up haiku calls.
+    """
+
+    def __init__(self, limits: Dict[str, Dict] = None):
+        """
+        Initialize limiter
+
+        Args:
+            limits: Mapping of model name to requests_per_minute,
+                tokens_per_minute and max_concurrency
+        """
+        self.limits = {model: dict(values) for model, values in DEFAULT_RATE_LIMITS.items()}
+        for model, values in (limits or {}).items():
+            self.limits.setdefault(model, dict(DEFAULT_RATE_LIMITS["sonnet"])).update(values)
+
+        self._models = {}
+
+    def limit(self, model: str, estimated_tokens: int) -> RateLimitLease:
+        """Return an async context manager that holds a rate-limited slot"""
+        return RateLimitLease(self, model, estimated_tokens)
+
+    def _state(self, model: str) -> Dict:
+        """Return the buckets and counters for a model, creating them on first use"""
+        state = self._models.get(model)
+        if state is None:
+            limits = self.limits.setdefault(model, dict(DEFAULT_RATE_LIMITS["sonnet"]))
+            state = {
+                "requests": TokenBucket(limits["requests_per_minute"]),
+                "tokens": TokenBucket(limits["tokens_per_minute"]),
+                "max_concurrency": limits["max_concurrency"],
+                "slots": None,
+                "queue": None,
+                "loop": None,
+                "in_flight": 0,
+                "waiting": 0,
+                "peak_in_flight": 0,
+                "acquired": 0,
+                "throttled": 0,
+                "total_wait_time": 0.0
+            }
+            self._models[model] = state
+
+        # Asyncio primitives are bound to the loop that first uses them
+        loop = asyncio.get_running_loop()
+        if state["loop"] is not loop:
+            state["slots"] = asyncio.Semaphore(state["max_concurrency"])
+            state["queue"] = asyncio.Lock()
+            state["loop"] = loop
+
+        return state
+
+    async def acquire(self, lease: RateLimitLease):
+        """Wait until lease fits in its model's concurrency, request and token budgets"""
+        state = self._state(lease.model)
+        start = time.monotonic()
+        state["waiting"] += 1
+
+        try:
+            await state["slots"].acquire()
+            try:
+                # FIFO: one waiter at a time drains the buckets
+                async with state["queue"]:
+                    throttled = False
+                    while True:
+                        wait = max(
+                            state["requests"].wait_time(1),
+                            state["tokens"].wait_time(lease.reserved_tokens)
+                        )
+                        if wait <= 0:
+                            break
+                        throttled = True
+                        await asyncio.sleep(wait)
+
+                    state["requests"].consume(1)
+                    state["tokens"].consume(lease.reserved_tokens)
+            except BaseException:
+                state["slots"].release()
+                raise
+        finally:
+            state["waiting"] -= 1
+
+        state["in_flight"] += 1
+        state["peak_in_flight"] = max(state["peak_in_flight"], state["in_flight"])
+        state["acquired"] += 1
+        state["total_wait_time"] += time.monotonic() - start
+        if throttled:
+            state["throttled"] += 1
+
+    def release(self, lease: RateLimitLease):
+        """Free the concurrency slot and reconcile reserved against actual tokens"""
+        state = self._models[lease.model]
+        state["in_flight"] -= 1
+        state["slots"].release()
+
+        if lease.tokens_used is not None:
+            difference = lease.reserved_tokens - lease.tokens_used
+            if difference > 0:
+                state["tokens"].refund(difference)
+            elif difference < 0:
+                state["tokens"].consume(-difference)
+
+    def get_statistics(self) -> Dict:
+        """Live bucket occupancy per model"""
+        stats = {}
+        for model, state in self._models.items():
+            stats[model] = {
+                "requests_available": round(state["requests"].available(), 2),
+                "requests_per_minute": self.limits[model]["requests_per_minute"],
+                "tokens_available": round(state["tokens"].available(), 2),
+                "tokens_per_minute": self.limits[model]["tokens_per_minute"],
+                "in_flight": state["in_flight"],
+                "peak_in_flight": state["peak_in_flight"],
+                "max_concurrency": state["max_concurrency"],
+                "waiting": state["waiting"],
+                "acquired": state["acquired"],
+                "throttled": state["throttled"],
+                "avg_wait_time": state["total_wait_time"] / max(1, state["acquired"])
+            }
+        return stats
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit tuned at runtime with additive-increase/multiplicative-decrease
+
+    Every healthy completion grows the limit by increase/limit, i.e. by about
+    `increase` slots per round of `limit` completions. A completion counts as
+    healthy when it succeeded and its latency is within latency_tolerance of
+    the fastest latency seen so far. Throttling errors and timeouts cut the
+    limit by decrease_factor, at most once per congestion event: only calls
+    dispatched after the previous cut can trigger another one. Other errors
+    and slow calls hold the limit where it is.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 64,
+                 increase: float = 1.0, decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0):
+        """Initialize limiter starting at initial concurrent slots"""
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(self.maximum, max(self.minimum, initial)))
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peak_limit = self.limit
+        self.min_latency = None
+        self.last_decrease = 0.0
+        self.stats = {"increases": 0, "decreases": 0, "held": 0}
+        self._waiters = deque()
+
+    async def acquire(self) -> float:
+        """
+        Wait for a free slot
+
+        Returns:
+            Monotonic dispatch time, to pass back to release()
+        """
+        if self.in_flight < int(self.limit) and not self._waiters:
+            self._take_slot()
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over just as we were cancelled; give it back
+                self.in_flight -= 1
+                self._wake_waiters()
+            else:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+
+        return time.monotonic()
+
+    def release(self, started_at: float, outcome: str):
+        """
+        Free a slot and adjust the limit
+
+        Args:
+            started_at: Value returned by acquire()
+            outcome: 'success', 'error', 'throttled', 'timeout' or 'deadline'
+        """
+        now = time.monotonic()
+        latency = now - started_at
+        self.in_flight -= 1
+
+        if outcome in ("throttled", "timeout", "deadline"):
+            if started_at >= self.last_decrease:
+                self.limit = max(self.minimum, self.limit * self.decrease_factor)
+                self.last_decrease = now
+                self.stats["decreases"] += 1
+        elif outcome == "success":
+            if self.min_latency is None or latency < self.min_latency:
+                self.min_latency = latency
+
+            if latency <= self.min_latency * self.latency_tolerance:
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+                self.peak_limit = max(self.peak_limit, self.limit)
+                self.stats["increases"] += 1
+            else:
+                self.stats["held"] += 1
+        else:
+            self.stats["held"] += 1
+
+        self._wake_waiters()
+
+    def _take_slot(self):
+        """Account for a newly occupied slot"""
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _wake_waiters(self):
+        """Hand free slots to queued waiters in FIFO order"""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._take_slot()
+            waiter.set_result(None)
+
+    def get_statistics(self) -> Dict:
+        """Current limit, occupancy and adjustment counters"""
+        return {
+            "limit": int(self.limit),
+            "peak_limit": int(self.peak_limit),
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "waiting": len(self._waiters),
+            "min_latency": self.min_latency,
+            **self.stats
+        }
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Result Cache
+Persistent on-disk cache tier for Task executor results
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+
+
+class DiskResultCache:
+    """
+    Disk-backed result cache shared across runs and worker processes
+
+    Each entry is one JSON file named after its cache key and sharded by the
+    first two characters of the key. Entries expire ttl_seconds after the
+    created_at recorded in them, however often they are hit, and the
+    directory is kept under max_size_mb by evicting the least recently used
+    entries (a hit refreshes the file's mtime, which only orders eviction).
+    Writes go to a temporary file in the target directory and are published
+    with os.replace, so concurrent workers never observe a partially
+    written entry.
+    """
+
+    TEMP_PREFIX = ".tmp-"
+    STALE_TEMP_SECONDS = 300
+
+    # created_at is written right after the key, so it sits in the file's head
+    HEADER_BYTES = 256
+    CREATED_AT_PATTERN = re.compile(rb'"created_at":\s*([0-9.eE+-]+)')
+
+    def __init__(self, cache_directory: str, ttl_seconds: float = 3600, max_size_mb: float = 100):
+        """Initialize the cache rooted at cache_directory"""
+        self.cache_dir = Path(cache_directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+
+        self._lock = threading.Lock()
+        self._size_bytes = None  # Computed on first write
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "writes": 0,
+            "evictions": 0
+        }
+
+    def _path_for(self, key: str) -> Path:
+        """Return the file path for a cache key"""
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached data, or None if missing, expired or unreadable
+        """
+        path = self._path_for(key)
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError):
+            # Corrupt entry; drop it so the next write replaces it cleanly
+            self._remove(path)
+            self._count("misses")
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            self._count("expired")
+            self._count("misses")
+            return None
+
+        # Refresh mtime so eviction treats this entry as recently used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        self._count("hits")
+        return entry.get("data")
+
+    def put(self, key: str, data: Dict):
+        """
+        Atomically store an entry
+
+        Args:
+            key: Cache key
+            data: JSON-serializable payload
+        """
+        path = self._path_for(key)
+        payload = json.dumps({
+            "key": key,
+            "created_at": time.time(),
+            "data": data
+        }, default=str).encode("utf-8")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=self.TEMP_PREFIX, suffix=".json")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            try:
+                previous_size = path.stat().st_size
+            except OSError:
+                previous_size = 0
+            os.replace(temp_path, path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+        with self._lock:
+            self.stats["writes"] += 1
+            if self._size_bytes is None:
+                self._size_bytes = sum(size for _, size, _ in self._scan())
+            else:
+                self._size_bytes += len(payload) - previous_size
+            over_budget = self._size_bytes > self.max_size_bytes
+
+        if over_budget:
+            self.evict()
+
+    def evict(self, target_ratio: float = 0.9) -> int:
+        """
+        Remove expired entries, then least recently used ones until the cache
+        fits in target_ratio of its size budget
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        entries = sorted(self._scan())  # Least recently used first
+        total = sum(size for _, size, _ in entries)
+        target = self.max_size_bytes * target_ratio
+        removed = 0
+
+        live = []
+        for mtime, size, path in entries:
+            # An entry is never used before it is written, so created_at <=
+            # mtime and only recently used entries need their head read
+            if now - mtime > self.ttl_seconds or now - self._created_at(path, mtime) > self.ttl_seconds:
+                if self._remove(path):
+                    removed += 1
+                total -= size
+            else:
+                live.append((size, path))
+
+        for size, path in live:
+            if total <= target:
+                break
+            if self._remove(path):
+                removed += 1
+            total -= size
+
+        with self._lock:
+            self._size_bytes = total
+            self.stats["evictions"] += removed
+
+        return removed
+
+    def clear(self):
+        """Remove every cached entry"""
+        for _, _, path in self._scan():
+            self._remove(path)
+        with self._lock:
+            self._size_bytes = 0
+
+    def size_bytes(self) -> int:
+        """Current on-disk size of the cache"""
+        return sum(size for _, size, _ in self._scan())
+
+    def get_statistics(self) -> Dict:
+        """Get cache statistics"""
+        with self._lock:
+            stats = dict(self.stats)
+            size = self._size_bytes
+        stats["size_bytes"] = size if size is not None else self.size_bytes()
+        stats["max_size_bytes"] = self.max_size_bytes
+        return stats
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every entry, reaping stale temp files"""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+
+        now = time.time()
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed by another worker
+
+            if path.name.startswith(self.TEMP_PREFIX):
+                # Leftover from a writer that died mid-write
+                if now - stat.st_mtime > self.STALE_TEMP_SECONDS:
+                    self._remove(path)
+                continue
+
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        return entries
+
+    def _created_at(self, path: Path, default: float) -> float:
+        """When an entry was written, read from the head of its file (default if unreadable)"""
+        try:
+            with open(path, 'rb') as f:
+                head = f.read(self.HEADER_BYTES)
+        except OSError:
+            return default
+
+        match = self.CREATED_AT_PATTERN.search(head)
+        if match is None:
+            return default
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return default
+
+    def _remove(self, path: Path) -> bool:
+        """Delete an entry, tolerating concurrent removal"""
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def _count(self, stat: str):
+        """Increment a statistics counter"""
+        with self._lock:
+            self.stats[stat] += 1
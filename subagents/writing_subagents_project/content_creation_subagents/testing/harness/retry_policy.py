@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Retry Policy
+Exponential backoff with jitter and circuit breakers for agent executions
+"""
+
+import random
+import time
+from typing import Dict, Optional
+
+# Outcomes (see ClaudeTaskExecutor._classify_outcome) that are worth retrying
+RETRYABLE_OUTCOMES = ("throttled", "timeout", "deadline", "error")
+
+# Outcomes that say nothing about the backend's health; a deadline
+# expiry is the caller's time limit (often spent queueing), not a failure
+NEUTRAL_OUTCOMES = ("cancelled", "budget_exhausted", "cassette_miss", "deadline")
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter
+
+    The n-th retry waits up to base_delay * multiplier**n seconds, capped at
+    max_delay. With full jitter the actual wait is drawn uniformly from zero
+    to that bound, which spreads out retries from calls that failed together
+    so they don't hit a recovering tier in lockstep. 'equal' jitter keeps
+    half the bound fixed and randomizes the rest; 'none' disables jitter.
+    """
+
+    JITTER_MODES = ("full", "equal", "none")
+
+    def __init__(self, max_retries: int = 2, base_delay: float = 1.0, multiplier: float = 2.0,
+                 max_delay: float = 30.0, jitter: str = "full", rng: random.Random = None):
+        """
+        Initialize policy
+
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff bound for the first retry, in seconds
+            multiplier: Growth factor of the bound per retry
+            max_delay: Upper limit on any single wait
+            jitter: 'full', 'equal' or 'none'
+            rng: Random source (for reproducible delays)
+        """
+        if jitter not in self.JITTER_MODES:
+            raise ValueError(f"Unknown jitter mode '{jitter}', expected one of {self.JITTER_MODES}")
+
+        self.max_retries = max(0, int(max_retries))
+        self.base_delay = max(0.0, base_delay)
+        self.multiplier = max(1.0, multiplier)
+        self.max_delay = max(0.0, max_delay)
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "RetryPolicy":
+        """
+        Build a policy from executor config
+
+        retry_attempts (total attempts, first one included) sets the retry
+        count, as it always has; error_handling.max_retries (retries after
+        the first attempt) is only read when retry_attempts is absent.
+        """
+        error_handling = config.get("error_handling") or {}
+        if "retry_attempts" in config:
+            max_retries = config["retry_attempts"] - 1
+        else:
+            max_retries = error_handling.get("max_retries", 1)
+
+        return cls(
+            max_retries=max_retries,
+            base_delay=error_handling.get("retry_delay_seconds", 1.0),
+            multiplier=error_handling.get("backoff_multiplier", 2.0),
+            max_delay=error_handling.get("max_retry_delay_seconds", 30.0),
+            jitter=error_handling.get("jitter", "full")
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        """Total attempts including the first"""
+        return self.max_retries + 1
+
+    def backoff_bound(self, retry: int) -> float:
+        """Upper bound of the wait before the given retry (0-based)"""
+        return min(self.max_delay, self.base_delay * self.multiplier ** retry)
+
+    def delay(self, retry: int) -> float:
+        """Seconds to wait before the given retry (0-based)"""
+        bound = self.backoff_bound(retry)
+        if self.jitter == "full":
+            return self.rng.uniform(0, bound)
+        if self.jitter == "equal":
+            return bound / 2 + self.rng.uniform(0, bound / 2)
+        return bound
+
+    def should_retry(self, outcome: str, retry: int) -> bool:
+        """Whether an attempt with this outcome gets another try"""
+        return outcome in RETRYABLE_OUTCOMES and retry < self.max_retries
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker
+
+    The circuit opens after failure_threshold consecutive failures and
+    rejects calls until reset_timeout has passed. It then lets up to
+    half_open_max_calls trial calls through: a success closes the circuit,
+    a failure opens it again for another reset_timeout.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 half_open_max_calls: int = 1):
+        """Initialize a closed circuit"""
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial_calls = 0
+        self.stats = {"opened": 0, "rejected": 0, "successes": 0, "failures": 0}
+
+    def allow(self) -> bool:
+        """Admit a call, or reject it while the circuit is open"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.stats["rejected"] += 1
+                return False
+            self.state = self.HALF_OPEN
+            self.trial_calls = 0
+
+        if self.state == self.HALF_OPEN:
+            if self.trial_calls >= self.half_open_max_calls:
+                self.stats["rejected"] += 1
+                return False
+            self.trial_calls += 1
+
+        return True
+
+    def record(self, outcome: str):
+        """
+        Record the outcome of an admitted call
+
+        Args:
+            outcome: 'success', a failure outcome, or a neutral outcome
+                ('cancelled', 'budget_exhausted', 'deadline') for a call that
+                ended without telling us anything about the backend
+        """
+        if self.state == self.HALF_OPEN:
+            self.trial_calls = max(0, self.trial_calls - 1)
+
+        if outcome in NEUTRAL_OUTCOMES:
+            return
+
+        if outcome == "success":
+            self.stats["successes"] += 1
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            return
+
+        self.stats["failures"] += 1
+        self.consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self._open()
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits a trial call"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def _open(self):
+        """Trip the circuit"""
+        if self.state != self.OPEN:
+            self.stats["opened"] += 1
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+
+    def get_statistics(self) -> Dict:
+        """Current state and counters"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "retry_after": round(self.retry_after(), 2),
+            **self.stats
+        }
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers per agent and per model tier
+
+    A call must pass both its agent's breaker and its model's breaker, so a
+    tier outage trips every agent on that tier at once while a single broken
+    agent only trips itself.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 half_open_max_calls: int = 1, model_failure_threshold: int = None):
+        """
+        Initialize registry
+
+        Args:
+            failure_threshold: Consecutive failures that trip an agent breaker
+            reset_timeout: Seconds an open breaker rejects calls
+            half_open_max_calls: Trial calls allowed while half-open
+            model_failure_threshold: Consecutive failures that trip a model
+                breaker (defaults to twice failure_threshold, since a tier
+                sees the failures of all its agents)
+        """
+        self.failure_threshold = failure_threshold
+        self.model_failure_threshold = model_failure_threshold or 2 * failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self.agents = {}
+        self.models = {}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> Optional["CircuitBreakerRegistry"]:
+        """Build from error_handling.circuit_breaker, or None if disabled"""
+        breaker_config = (config.get("error_handling") or {}).get("circuit_breaker") or {}
+        if not breaker_config.get("enabled", False):
+            return None
+
+        return cls(
+            failure_threshold=breaker_config.get("failure_threshold", 5),
+            reset_timeout=breaker_config.get("reset_timeout_seconds", 30.0),
+            half_open_max_calls=breaker_config.get("half_open_max_calls", 1),
+            model_failure_threshold=breaker_config.get("model_failure_threshold")
+        )
+
+    def _breaker(self, registry: Dict, key: str, threshold: int) -> CircuitBreaker:
+        """Return the breaker for key, creating it on first use"""
+        breaker = registry.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(threshold, self.reset_timeout, self.half_open_max_calls)
+            registry[key] = breaker
+        return breaker
+
+    def allow(self, agent_name: str, model: str) -> Optional[str]:
+        """
+        Admit a call through both breakers
+
+        Returns:
+            None if admitted, otherwise the reason for rejecting it
+        """
+        model_breaker = self._breaker(self.models, model, self.model_failure_threshold)
+        if not model_breaker.allow():
+            return f"Circuit open for model {model} (retry in {model_breaker.retry_after():.1f}s)"
+
+        agent_breaker = self._breaker(self.agents, agent_name, self.failure_threshold)
+        if not agent_breaker.allow():
+            # Hand back the model trial slot we just took
+            model_breaker.record("cancelled")
+            return f"Circuit open for agent {agent_name} (retry in {agent_breaker.retry_after():.1f}s)"
+
+        return None
+
+    def record(self, agent_name: str, model: str, outcome: str):
+        """Record the outcome of a call admitted by allow()"""
+        self._breaker(self.models, model, self.model_failure_threshold).record(outcome)
+        self._breaker(self.agents, agent_name, self.failure_threshold).record(outcome)
+
+    def get_statistics(self) -> Dict:
+        """Breaker state per model and per agent, omitting idle closed agents"""
+        return {
+            "models": {model: breaker.get_statistics() for model, breaker in self.models.items()},
+            "agents": {
+                agent: breaker.get_statistics()
+                for agent, breaker in self.agents.items()
+                if breaker.state != CircuitBreaker.CLOSED or breaker.stats["failures"]
+            }
+        }
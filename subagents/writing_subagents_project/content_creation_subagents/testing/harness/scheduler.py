@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Task Scheduler
+Priority and deadline-aware ordering of agent executions
+"""
+
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Agents whose regressions block a release; run_regression_suite covers these
+CRITICAL_AGENTS = [
+    "spec-writer",
+    "body-writer",
+    "grammar-checker",
+    "content-atomizer"
+]
+
+# Higher tiers have the longest tail latency, so they start first
+DEFAULT_MODEL_PRIORITY = {"opus": 2, "sonnet": 1, "haiku": 0}
+
+# Expected seconds per call before an agent has any execution history
+DEFAULT_EXPECTED_DURATION = {"opus": 20.0, "sonnet": 8.0, "haiku": 3.0}
+
+CRITICAL_PRIORITY_BOOST = 10
+
+
+class TaskScheduler:
+    """
+    Priority queue of agent tasks
+
+    Tasks are ordered by, in turn:
+      1. priority, highest first: an explicit AgentTask.priority, otherwise
+         a boost for critical agents plus the model tier's priority
+      2. deadline, earliest first: enqueue time plus AgentTask.timeout,
+         quantized to deadline_resolution so near-simultaneous enqueues tie
+      3. expected duration, longest first, so long jobs start early and
+         short ones fill in around them
+      4. enqueue order
+    """
+
+    def __init__(self, model_for_agent: Callable[[str], str],
+                 expected_duration_for_agent: Callable[[str], Optional[float]] = None,
+                 critical_agents: Iterable[str] = None,
+                 model_priority: Dict[str, int] = None,
+                 deadline_resolution: float = 1.0):
+        """
+        Initialize scheduler
+
+        Args:
+            model_for_agent: Returns the model tier for an agent name
+            expected_duration_for_agent: Returns the observed mean duration
+                for an agent, or None when there is no history yet
+            critical_agents: Agents that get a priority boost
+            model_priority: Priority per model tier
+            deadline_resolution: Seconds per deadline bucket
+        """
+        self.model_for_agent = model_for_agent
+        self.expected_duration_for_agent = expected_duration_for_agent or (lambda agent: None)
+        self.critical_agents = set(CRITICAL_AGENTS if critical_agents is None else critical_agents)
+        self.model_priority = dict(DEFAULT_MODEL_PRIORITY)
+        self.model_priority.update(model_priority or {})
+        self.deadline_resolution = max(deadline_resolution, 1e-6)
+
+        self._heap = []
+        self._sequence = itertools.count()
+
+    def priority_for(self, agent_name: str, explicit: Optional[int] = None) -> int:
+        """Return the scheduling priority for an agent"""
+        if explicit is not None:
+            return explicit
+
+        priority = self.model_priority.get(self.model_for_agent(agent_name), 0)
+        if agent_name in self.critical_agents:
+            priority += CRITICAL_PRIORITY_BOOST
+        return priority
+
+    def expected_duration(self, agent_name: str) -> float:
+        """Return the expected duration of one call for an agent"""
+        observed = self.expected_duration_for_agent(agent_name)
+        if observed is not None:
+            return observed
+        return DEFAULT_EXPECTED_DURATION.get(self.model_for_agent(agent_name), 8.0)
+
+    def sort_key(self, task, now: float = None) -> tuple:
+        """Return the ordering key for a task (smallest runs first)"""
+        now = time.time() if now is None else now
+        deadline = now + getattr(task, "timeout", 30)
+        return (
+            -self.priority_for(task.agent_name, getattr(task, "priority", None)),
+            int(deadline / self.deadline_resolution),
+            -self.expected_duration(task.agent_name),
+            next(self._sequence)
+        )
+
+    def push(self, task, item=None):
+        """Enqueue a task, optionally carrying item to return from pop() instead"""
+        heapq.heappush(self._heap, (self.sort_key(task), task if item is None else item))
+
+    def pop(self):
+        """Dequeue the task (or its item) that should start next"""
+        return heapq.heappop(self._heap)[1]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def order(self, tasks: Iterable) -> List:
+        """Return tasks sorted into execution order"""
+        now = time.time()
+        return [task for _, task in sorted(((self.sort_key(task, now), task) for task in tasks),
+                                           key=lambda entry: entry[0])]
+
+    def order_agents(self, agent_names: Iterable[str]) -> List[str]:
+        """Return agent names sorted by priority, then longest expected duration"""
+        return sorted(
+            agent_names,
+            key=lambda agent: (-self.priority_for(agent), -self.expected_duration(agent))
+        )
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Section Extraction Benchmark
+Compare the single-pass section scanner with the regex implementation it replaced
+"""
+
+import re
+import time
+from typing import Callable, Dict, List
+
+from agent_spec_loader import AgentSpecLoader
+
+# The implementation _extract_markdown_sections used before the section index
+LEGACY_SECTION_PATTERNS = {
+    "description": r'##?\s*Description\s*\n(.*?)(?=\n##?\s|\Z)',
+    "prompt": r'##?\s*Prompt\s*\n(.*?)(?=\n##?\s|\Z)',
+    "examples": r'##?\s*Examples?\s*\n(.*?)(?=\n##?\s|\Z)',
+    "guardrails": r'##?\s*Guardrails?\s*\n(.*?)(?=\n##?\s|\Z)',
+    "instructions": r'##?\s*Instructions?\s*\n(.*?)(?=\n##?\s|\Z)'
+}
+
+
+def legacy_extract_markdown_sections(content: str) -> Dict[str, str]:
+    """Frontmatter re.sub followed by one DOTALL search per section"""
+    sections = {}
+    content = re.sub(r'^---\s*\n.*?\n---\s*\n', '', content, flags=re.DOTALL)
+
+    for section_name, pattern in LEGACY_SECTION_PATTERNS.items():
+        match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+        if match:
+            sections[section_name] = match.group(1).strip()
+
+    if "prompt" not in sections:
+        sections["prompt"] = content.strip()
+
+    return sections
+
+
+def synthetic_spec(target_bytes: int = 1024 * 1024, spec_sections: bool = True) -> str:
+    """
+    A large spec made of many level two sections with nested subsections
+
+    With spec_sections the five specification sections come last, so every
+    legacy search has to walk the whole document before it matches.
+    """
+    paragraph = (
+        "The agent reviews the supplied material, notes the claims that need "
+        "support and records every source it relied on.\n"
+    ) * 4
+    parts = ["---", "name: synthetic-agent", "description: Synthetic benchmark spec", "model: sonnet", "---", ""]
+    size = 0
+    index = 0
+    while size < target_bytes:
+        block = f"## Topic Area {index}\n{paragraph}\n### Details {index}\n{paragraph}"
+        parts.append(block)
+        size += len(block)
+        index += 1
+
+    if spec_sections:
+        for heading in ("Description", "Prompt", "Examples", "Guardrails", "Instructions"):
+            parts.append(f"## {heading}\n{paragraph}")
+    return "\n".join(parts)
+
+
+def time_call(function: Callable[[str], Dict], documents: List[str], repeat: int) -> float:
+    """Best-of-repeat seconds to run function over every document"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for document in documents:
+            function(document)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(repeat: int = 5) -> List[Dict]:
+    """
+    Time both implementations on the real specs and on synthetic 1MB specs
+
+    Returns:
+        One row per corpus with timings, speedup and output mismatches
+    """
+    loader = AgentSpecLoader(use_bundle=False)
+    real_specs = [loader.load_agent_spec(agent) for agent in loader.list_available_agents()]
+    corpora = {
+        f"{len(real_specs)} agent specs": (real_specs, repeat * 20),
+        "1MB spec, sections last": ([synthetic_spec()], repeat),
+        "1MB spec, no spec sections": ([synthetic_spec(spec_sections=False)], repeat)
+    }
+
+    rows = []
+    for label, (documents, runs) in corpora.items():
+        mismatches = sum(
+            1 for document in documents
+            if legacy_extract_markdown_sections(document) != loader._extract_markdown_sections(document)
+        )
+        legacy = time_call(legacy_extract_markdown_sections, documents, runs)
+        indexed = time_call(loader._extract_markdown_sections, documents, runs)
+        rows.append({
+            "corpus": label,
+            "bytes": sum(len(document.encode("utf-8")) for document in documents),
+            "legacy_ms": legacy * 1000,
+            "indexed_ms": indexed * 1000,
+            "speedup": legacy / indexed if indexed else float("inf"),
+            "mismatches": mismatches
+        })
+    return rows
+
+
+def main():
+    """Print the benchmark table"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark markdown section extraction")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per corpus (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'Corpus':<28} {'Bytes':>10} {'Regex ms':>10} {'Index ms':>10} {'Speedup':>8} {'Mismatch':>9}")
+    for row in run_benchmark(args.repeat):
+        print(f"{row['corpus']:<28} {row['bytes']:>10,} {row['legacy_ms']:>10.2f} "
+              f"{row['indexed_ms']:>10.2f} {row['speedup']:>7.1f}x {row['mismatches']:>9}")
+
+
+if __name__ == "__main__":
+    main()
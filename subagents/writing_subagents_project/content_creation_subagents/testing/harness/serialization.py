@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Input Serialization
+Minified and canonical JSON for agent inputs, serialized once per execution
+"""
+
+import contextvars
+import hashlib
+import json
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+# No whitespace after separators; indentation only costs prompt tokens
+COMPACT_SEPARATORS = (",", ":")
+
+# (input, serialization) pinned for the execution running in this context
+_PINNED_INPUT = contextvars.ContextVar("pinned_input", default=None)
+
+
+def minified_json(data: Any) -> str:
+    """JSON without insignificant whitespace, keys in their original order"""
+    return json.dumps(data, separators=COMPACT_SEPARATORS, ensure_ascii=False, default=str)
+
+
+def canonical_json(data: Any) -> str:
+    """Minified JSON with sorted keys, identical for equal inputs"""
+    return json.dumps(data, separators=COMPACT_SEPARATORS, ensure_ascii=False, default=str,
+                      sort_keys=True)
+
+
+class SerializedInput:
+    """Both serializations of one input"""
+
+    __slots__ = ("minified", "canonical", "_digest")
+
+    def __init__(self, minified: str, canonical: str):
+        """Initialize from the minified (prompt) and canonical (hashing) forms"""
+        self.minified = minified
+        self.canonical = canonical
+        self._digest = None
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the canonical form"""
+        if self._digest is None:
+            self._digest = hashlib.sha256(self.canonical.encode("utf-8")).hexdigest()
+        return self._digest
+
+
+def serialize_input(data: Any) -> SerializedInput:
+    """Serialize an input for prompts and cache keys"""
+    minified = minified_json(data)
+    # Scalars have no keys to sort
+    canonical = canonical_json(data) if isinstance(data, (dict, list)) else minified
+    return SerializedInput(minified, canonical)
+
+
+class InputSerializer:
+    """
+    Serializes each execution's input once
+
+    One execution serializes its input for the cache key, the prompt and
+    several token counts. The executor pins the input's serialization for
+    the length of the execution (an AgentTask's own, or one computed when
+    the execution starts) and serialize() hands it back for that object.
+    Pins live in a context variable, so concurrent executions each see
+    their own, and nothing outlives the execution: an input dict mutated
+    between two calls is serialized afresh rather than served a stale form.
+    """
+
+    def __init__(self):
+        """Initialize counters"""
+        self.stats = {"serialized": 0, "reused": 0}
+
+    def serialize(self, data: Any) -> SerializedInput:
+        """Return the pinned serialization of data, or compute it"""
+        pinned = _PINNED_INPUT.get()
+        if pinned is not None and pinned[0] is data:
+            self.stats["reused"] += 1
+            return pinned[1]
+
+        self.stats["serialized"] += 1
+        return serialize_input(data)
+
+    @contextmanager
+    def pinned(self, data: Any, serialized: SerializedInput = None) -> Iterator[SerializedInput]:
+        """
+        Pin data's serialization for the code run inside the block
+
+        Args:
+            data: Input of the execution
+            serialized: Serialization computed elsewhere (e.g. cached on an
+                AgentTask); computed now if None
+
+        Yields:
+            The pinned serialization
+        """
+        if serialized is None:
+            serialized = self.serialize(data)
+        token = _PINNED_INPUT.set((data, serialized))
+        try:
+            yield serialized
+        finally:
+            _PINNED_INPUT.reset(token)
+
+    def minified_mapping(self, keyed_inputs: Dict[str, Any]) -> str:
+        """Minified JSON object of keyed inputs"""
+        return "{" + ",".join(
+            f"{minified_json(key)}:{self.serialize(value).minified}"
+            for key, value in keyed_inputs.items()
+        ) + "}"
+
+    def get_statistics(self) -> Dict:
+        """Serialization and reuse counters"""
+        return dict(self.stats)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Spec Bundle
+Precompiled snapshot of every parsed agent specification
+"""
+
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agent_spec_loader import AgentSpecLoader, AgentSpecification, compute_spec_hash
+from token_accounting import TokenCounter
+
+BUNDLE_FORMAT_VERSION = 3
+
+# Build artifact; .cache/ is not checked in. Plain JSON, so loading a
+# bundle can never run code, whoever wrote the file
+DEFAULT_BUNDLE_PATH = Path(__file__).parent.parent / ".cache" / "spec_bundle.json"
+
+
+@dataclass
+class SpecBundleEntry:
+    """One compiled spec and the file state it was compiled from"""
+    agent_name: str
+    filename: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    token_count: int
+    content: str
+    spec: AgentSpecification
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly form"""
+        return {**vars(self), "spec": self.spec.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SpecBundleEntry":
+        """Rebuild from to_dict() output"""
+        return cls(**{**data, "spec": AgentSpecification(**data["spec"])})
+
+
+@dataclass
+class SpecBundle:
+    """
+    Parsed specs for a whole optimized_versions directory
+
+    An entry is only served while its source file is unchanged: a file
+    whose mtime and size still match is trusted outright, and one whose
+    stat changed is re-read and trusted only if its content hash still
+    matches (e.g. after a checkout that rewrote identical files). Stale
+    entries are reported and the loader falls back to parsing the file.
+    """
+    source_dir: str
+    built_at: float
+    entries: Dict[str, SpecBundleEntry] = field(default_factory=dict)
+    version: int = BUNDLE_FORMAT_VERSION
+
+    def is_fresh(self, entry: SpecBundleEntry) -> bool:
+        """Whether entry still matches its source file"""
+        path = Path(self.source_dir) / entry.filename
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+
+        if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+            return True
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return compute_spec_hash(f.read()) == entry.content_hash
+        except OSError:
+            return False
+
+    def stale_agents(self) -> List[str]:
+        """Agents whose source file changed or disappeared since the build"""
+        return [name for name, entry in self.entries.items() if not self.is_fresh(entry)]
+
+    def to_dict(self) -> Dict:
+        """JSON-friendly form"""
+        return {
+            "version": self.version,
+            "source_dir": self.source_dir,
+            "built_at": self.built_at,
+            "entries": {name: entry.to_dict() for name, entry in self.entries.items()}
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SpecBundle":
+        """Rebuild from to_dict() output"""
+        return cls(
+            source_dir=data["source_dir"],
+            built_at=data["built_at"],
+            entries={name: SpecBundleEntry.from_dict(entry) for name, entry in data["entries"].items()},
+            version=data["version"]
+        )
+
+
+def build_spec_bundle(loader: AgentSpecLoader = None, output_path: Path = None,
+                      token_counter: TokenCounter = None) -> SpecBundle:
+    """
+    Compile every spec file the loader can see into a bundle file
+
+    Args:
+        loader: Loader whose optimized_versions directory is compiled
+        output_path: Bundle file (defaults to DEFAULT_BUNDLE_PATH)
+        token_counter: Counter for per-spec token counts
+
+    Returns:
+        The bundle that was written
+    """
+    loader = loader or AgentSpecLoader(use_bundle=False)
+    output_path = Path(output_path or DEFAULT_BUNDLE_PATH)
+    token_counter = token_counter or TokenCounter()
+
+    bundle = SpecBundle(source_dir=str(loader.optimized_dir.resolve()), built_at=time.time())
+    for path in sorted(loader.optimized_dir.glob("*.md")):
+        stat = path.stat()
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        agent_name = path.stem.replace("-agent", "").replace("_agent", "")
+        bundle.entries[agent_name] = SpecBundleEntry(
+            agent_name=agent_name,
+            filename=path.name,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=compute_spec_hash(content),
+            token_count=token_counter.count_spec(content),
+            content=content,
+            spec=loader.parse_spec_content(agent_name, content)
+        )
+
+    # Publish atomically so a loader never reads a half-written bundle
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=output_path.parent, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(bundle.to_dict(), f, ensure_ascii=False, default=str)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    return bundle
+
+
+def load_spec_bundle(path: Path = None) -> Optional[SpecBundle]:
+    """
+    Read a bundle
+
+    Returns:
+        The bundle, or None if missing, unreadable or from another format version
+    """
+    path = Path(path or DEFAULT_BUNDLE_PATH)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable spec bundle {path}: {e}")
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != BUNDLE_FORMAT_VERSION:
+        print(f"Warning: ignoring spec bundle {path} from another format version; rebuild it")
+        return None
+
+    try:
+        return SpecBundle.from_dict(data)
+    except (KeyError, TypeError, AttributeError) as e:
+        print(f"Warning: ignoring malformed spec bundle {path}: {e}")
+        return None
+
+
+def main():
+    """Build or inspect the spec bundle"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile agent specs into a spec bundle")
+    parser.add_argument("command", choices=["build", "info"], help="Build the bundle or report on it")
+    parser.add_argument("--specs", help="Directory containing optimized_versions (defaults to the loader's)")
+    parser.add_argument("--output", help=f"Bundle file (defaults to {DEFAULT_BUNDLE_PATH})")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        started = time.perf_counter()
+        bundle = build_spec_bundle(AgentSpecLoader(args.specs, use_bundle=False), args.output)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"Compiled {len(bundle.entries)} specs from {bundle.source_dir} "
+              f"to {args.output or DEFAULT_BUNDLE_PATH} in {elapsed:.1f}ms")
+        return
+
+    started = time.perf_counter()
+    bundle = load_spec_bundle(args.output)
+    elapsed = (time.perf_counter() - started) * 1000
+    if bundle is None:
+        print("No spec bundle; run: python spec_bundle.py build")
+        return
+
+    stale = bundle.stale_agents()
+    print(f"Bundle: {len(bundle.entries)} specs from {bundle.source_dir}, loaded in {elapsed:.2f}ms")
+    print(f"Tokens: {sum(entry.token_count for entry in bundle.entries.values())}")
+    print(f"Stale: {', '.join(stale) if stale else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Spec Watcher
+Hot reload of edited agent specifications for long-running harness processes
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from agent_spec_loader import AgentSpecLoader, SpecChangeEvent
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+WATCH_BACKENDS = ("auto", "polling", "watchdog")
+
+
+class SpecWatcher:
+    """
+    Keeps an AgentSpecLoader's cache in step with the spec files on disk
+
+    The polling backend calls loader.refresh() every interval_seconds,
+    which stats each cached spec and re-reads only the ones that changed.
+    The watchdog backend (inotify and friends, when the watchdog package is
+    installed) refreshes just the agent whose file an event names. Either
+    way the loader publishes a SpecChangeEvent per changed spec, so
+    subscribers such as ClaudeTaskExecutor.on_spec_change can drop
+    dependent cache entries.
+    """
+
+    def __init__(self, loader: AgentSpecLoader, interval_seconds: float = 1.0, backend: str = "auto"):
+        """
+        Initialize watcher
+
+        Args:
+            loader: Loader whose cache is kept fresh
+            interval_seconds: Polling interval
+            backend: 'polling', 'watchdog', or 'auto' (watchdog when installed)
+        """
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(f"Unknown spec watch backend: {backend}")
+        if backend == "watchdog" and not WATCHDOG_AVAILABLE:
+            print("Warning: watchdog is not installed; polling spec files instead")
+        if backend == "auto":
+            backend = "watchdog" if WATCHDOG_AVAILABLE else "polling"
+        elif backend == "watchdog" and not WATCHDOG_AVAILABLE:
+            backend = "polling"
+
+        self.loader = loader
+        self.interval_seconds = interval_seconds
+        self.backend = backend
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._observer = None
+        self.stats = {"polls": 0, "file_events": 0, "changes": 0, "last_change_at": None}
+
+    @classmethod
+    def from_config(cls, loader: AgentSpecLoader, config: Dict) -> Optional["SpecWatcher"]:
+        """Build from spec_reload config, or None when watching is disabled"""
+        reload_config = config.get("spec_reload") or {}
+        if not reload_config.get("watch", False):
+            return None
+        return cls(
+            loader,
+            interval_seconds=reload_config.get("interval_seconds", 1.0),
+            backend=reload_config.get("backend", "auto")
+        )
+
+    def poll_once(self) -> List[SpecChangeEvent]:
+        """Refresh every cached spec now"""
+        self.stats["polls"] += 1
+        return self._record(self.loader.refresh())
+
+    def _record(self, events: List[SpecChangeEvent]) -> List[SpecChangeEvent]:
+        """Count published changes"""
+        if events:
+            self.stats["changes"] += len(events)
+            self.stats["last_change_at"] = time.time()
+        return events
+
+    def _on_file_event(self, path: str):
+        """Refresh the agent a filesystem event refers to"""
+        path = Path(path)
+        if path.suffix != ".md":
+            return
+        self.stats["file_events"] += 1
+        agent_name = path.stem.replace("-agent", "").replace("_agent", "")
+        self._record(self.loader.refresh([agent_name]))
+
+    def _run(self):
+        """Polling loop"""
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Warning: spec refresh failed: {e}")
+
+    def start(self) -> "SpecWatcher":
+        """Start watching in the background"""
+        if self._thread is not None or self._observer is not None:
+            return self
+
+        self._stop.clear()
+        if self.backend == "watchdog":
+            self._observer = Observer()
+            self._observer.schedule(_SpecEventHandler(self), str(self.loader.optimized_dir), recursive=False)
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._thread = threading.Thread(target=self._run, name="spec-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching"""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SpecWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def get_statistics(self) -> Dict:
+        """Watcher counters"""
+        return {"backend": self.backend, "interval_seconds": self.interval_seconds, **self.stats}
+
+
+if WATCHDOG_AVAILABLE:
+    class _SpecEventHandler(FileSystemEventHandler):
+        """Forwards spec file events to a SpecWatcher"""
+
+        def __init__(self, watcher: SpecWatcher):
+            super().__init__()
+            self.watcher = watcher
+
+        def on_any_event(self, event):
+            if event.is_directory:
+                return
+            self.watcher._on_file_event(event.src_path)
+            # Editors that save by renaming report the spec under dest_path
+            dest_path = getattr(event, "dest_path", None)
+            if dest_path:
+                self.watcher._on_file_event(dest_path)
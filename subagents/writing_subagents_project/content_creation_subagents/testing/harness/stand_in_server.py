@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Stand-in LLM Server
+Local messages-style HTTP backend with realistic latency and failure modes
+"""
+
+import json
+import math
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict, replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from mock_outputs import generate_mock_response
+from token_accounting import HeuristicTokenizer
+
+
+@dataclass
+class LatencyProfile:
+    """
+    Latency and failure behaviour of one model tier
+
+    Base latency is lognormal with the given median and sigma; with
+    probability tail_probability it is multiplied by tail_multiplier to
+    model the slow tail. Prompt and output tokens add a proportional delay
+    on top. Each request independently fails with the given rates.
+    """
+    median_ms: float = 800.0
+    sigma: float = 0.5
+    tail_probability: float = 0.02
+    tail_multiplier: float = 5.0
+    ms_per_1k_prompt_tokens: float = 20.0
+    ms_per_output_token: float = 10.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    timeout_rate: float = 0.0
+    hang_seconds: float = 60.0
+    malformed_rate: float = 0.0
+    error_rate: float = 0.0
+
+
+# Rough shape of the three tiers: haiku fast and tight, opus slow with a long tail
+DEFAULT_PROFILES = {
+    "haiku": LatencyProfile(median_ms=400, sigma=0.35, ms_per_output_token=4),
+    "sonnet": LatencyProfile(median_ms=1200, sigma=0.5, ms_per_output_token=12),
+    "opus": LatencyProfile(median_ms=3000, sigma=0.7, tail_probability=0.05, ms_per_output_token=30)
+}
+
+
+class StandInBackend:
+    """Request handling and sampling, independent of the HTTP plumbing"""
+
+    def __init__(self, profiles: Dict[str, LatencyProfile] = None, seed: Optional[int] = None,
+                 time_scale: float = 1.0):
+        """
+        Initialize backend
+
+        Args:
+            profiles: Latency profile per model tier (defaults to DEFAULT_PROFILES)
+            seed: Seed for reproducible latencies and failures
+            time_scale: Multiplier on every simulated delay (e.g. 0.01 for fast runs)
+        """
+        self.profiles = dict(DEFAULT_PROFILES)
+        self.profiles.update(profiles or {})
+        self.time_scale = time_scale
+        self.tokenizer = HeuristicTokenizer()
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "succeeded": 0,
+            "throttled": 0,
+            "timed_out": 0,
+            "malformed": 0,
+            "errors": 0,
+            "in_flight": 0,
+            "peak_in_flight": 0
+        }
+
+    def profile_for(self, model: str) -> LatencyProfile:
+        """Profile for a model name ('haiku' or a full name containing it)"""
+        model = (model or "").lower()
+        for tier, profile in self.profiles.items():
+            if tier in model:
+                return profile
+        return self.profiles.get("sonnet", LatencyProfile())
+
+    def _count(self, key: str, delta: int = 1):
+        """Bump a counter"""
+        with self._lock:
+            self.stats[key] += delta
+            if key == "in_flight":
+                self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.stats["in_flight"])
+
+    def _draw(self, profile: LatencyProfile) -> Dict:
+        """Sample the fate and base latency of one request"""
+        with self._lock:
+            failure = self._rng.random()
+            base_ms = profile.median_ms * math.exp(self._rng.gauss(0, profile.sigma))
+            if self._rng.random() < profile.tail_probability:
+                base_ms *= profile.tail_multiplier
+
+        for fate, rate in (("throttle", profile.throttle_rate), ("timeout", profile.timeout_rate),
+                           ("malformed", profile.malformed_rate), ("error", profile.error_rate)):
+            if failure < rate:
+                return {"fate": fate, "base_ms": base_ms}
+            failure -= rate
+        return {"fate": "ok", "base_ms": base_ms}
+
+    def _sleep(self, milliseconds: float):
+        """Simulated work"""
+        time.sleep(milliseconds / 1000 * self.time_scale)
+
+    def handle_messages(self, request: Dict):
+        """
+        Serve one /v1/messages request
+
+        The agent is identified by metadata.agent_name and its output is
+        generated from metadata.input, so responses match what the mock
+        backend would produce.
+
+        Returns:
+            (status, headers, body bytes)
+        """
+        self._count("requests")
+        self._count("in_flight")
+        try:
+            profile = self.profile_for(request.get("model"))
+            draw = self._draw(profile)
+
+            if draw["fate"] == "throttle":
+                self._count("throttled")
+                return 429, {"Retry-After": str(profile.retry_after_seconds)}, _error_body(
+                    "rate_limit_error", "Rate limited by stand-in server")
+
+            if draw["fate"] == "timeout":
+                self._count("timed_out")
+                self._sleep(profile.hang_seconds * 1000)
+                return 504, {}, _error_body("timeout_error", "Upstream request timed out")
+
+            prompt_text = _request_text(request)
+            prompt_tokens = self.tokenizer.count(prompt_text)
+            metadata = request.get("metadata") or {}
+            output = generate_mock_response(metadata.get("agent_name", "unknown"), metadata.get("input") or {})
+            output_text = json.dumps(output)
+            output_tokens = min(self.tokenizer.count(output_text), request.get("max_tokens") or 4096)
+
+            self._sleep(
+                draw["base_ms"]
+                + prompt_tokens / 1000 * profile.ms_per_1k_prompt_tokens
+                + output_tokens * profile.ms_per_output_token
+            )
+
+            if draw["fate"] == "error":
+                self._count("errors")
+                return 500, {}, _error_body("api_error", "Internal stand-in server error")
+
+            if draw["fate"] == "malformed":
+                self._count("malformed")
+                # Cut the body off mid-document, as a dropped connection would
+                body = _message_body(request, output_text, prompt_tokens, output_tokens)
+                return 200, {}, body[:max(1, len(body) // 2)]
+
+            self._count("succeeded")
+            return 200, {}, _message_body(request, output_text, prompt_tokens, output_tokens)
+        finally:
+            self._count("in_flight", -1)
+
+    def get_statistics(self) -> Dict:
+        """Request counters and the active profiles"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["profiles"] = {tier: asdict(profile) for tier, profile in self.profiles.items()}
+        stats["time_scale"] = self.time_scale
+        return stats
+
+
+def _request_text(request: Dict) -> str:
+    """All prompt text of a messages request"""
+    parts = []
+    system = request.get("system")
+    if isinstance(system, str):
+        parts.append(system)
+    elif isinstance(system, list):
+        parts.extend(block.get("text", "") for block in system if isinstance(block, dict))
+
+    for message in request.get("messages") or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(block.get("text", "") for block in content if isinstance(block, dict))
+    return "\n".join(parts)
+
+
+def _message_body(request: Dict, output_text: str, prompt_tokens: int, output_tokens: int) -> bytes:
+    """Successful messages response"""
+    return json.dumps({
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": request.get("model"),
+        "content": [{"type": "text", "text": output_text}],
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": prompt_tokens, "output_tokens": output_tokens}
+    }).encode("utf-8")
+
+
+def _error_body(error_type: str, message: str) -> bytes:
+    """Error response in the messages API shape"""
+    return json.dumps({"type": "error", "error": {"type": error_type, "message": message}}).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front end for a StandInBackend (set as server.backend)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send(200, {}, b'{"status":"ok"}')
+        elif self.path == "/stats":
+            self._send(200, {}, json.dumps(self.server.backend.get_statistics()).encode("utf-8"))
+        else:
+            self._send(404, {}, _error_body("not_found_error", f"No route for {self.path}"))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length)
+
+        if self.path != "/v1/messages":
+            self._send(404, {}, _error_body("not_found_error", f"No route for {self.path}"))
+            return
+
+        try:
+            request = json.loads(raw)
+        except ValueError:
+            self._send(400, {}, _error_body("invalid_request_error", "Request body is not JSON"))
+            return
+
+        status, headers, body = self.server.backend.handle_messages(request)
+        self._send(status, headers, body)
+
+    def _send(self, status: int, headers: Dict, body: bytes):
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            # Client gave up (e.g. its own timeout fired first)
+            pass
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class StandInServer:
+    """
+    Threaded local HTTP server around a StandInBackend
+
+    Usage:
+        with StandInServer(seed=1, time_scale=0.1) as server:
+            executor = ClaudeTaskExecutor({
+                "enabled": True,
+                "fallback_to_mock": False,
+                "backend_url": server.url
+            })
+    """
+
+    def __init__(self, backend: StandInBackend = None, host: str = "127.0.0.1", port: int = 0,
+                 verbose: bool = False, **backend_kwargs):
+        """
+        Initialize server (port 0 picks a free port)
+
+        Args:
+            backend: Backend to serve (built from backend_kwargs if None)
+        """
+        self.backend = backend or StandInBackend(**backend_kwargs)
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.backend = self.backend
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        """Serve in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, name="stand-in-server", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    """Run the stand-in server in the foreground"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stand-in LLM server for the SubAgent harness")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, help="Seed for reproducible latencies and failures")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiplier on all simulated delays")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Fraction of requests that hang")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="Fraction of truncated JSON responses")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500 responses")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    failure_rates = {
+        "throttle_rate": args.throttle_rate,
+        "timeout_rate": args.timeout_rate,
+        "malformed_rate": args.malformed_rate,
+        "error_rate": args.error_rate
+    }
+    profiles = {tier: replace(profile, **failure_rates) for tier, profile in DEFAULT_PROFILES.items()}
+
+    server = StandInServer(
+        StandInBackend(profiles, seed=args.seed, time_scale=args.time_scale),
+        host=args.host, port=args.port, verbose=args.verbose
+    )
+    print(f"Stand-in LLM server listening on {server.url} (Ctrl+C to stop)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,38 @@ Wrapper for Claude Code Task tool integration
 """
 
 import json
+import math
 import time
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator, AsyncIterator
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
 import subprocess
 import sys
+import threading
+import weakref
+import http.client
+from collections import deque
+
+from result_cache import DiskResultCache
+from agent_spec_loader import ModelSelector, compute_spec_hash
+from budget import BudgetManager, price_tokens, prices_from_config
+from cassette import CASSETTE_MODES, MISS_ACTIONS, Cassette
+from mock_outputs import BATCH_INPUTS_KEY, generate_mock_output, generate_mock_response
+from prompt_builder import AgentPrompt, PromptBuilder
+from rate_limiter import AdaptiveConcurrencyLimiter, ModelRateLimiter, RateLimitLease
+from retry_policy import CircuitBreakerRegistry, RetryPolicy
+from scheduler import CRITICAL_AGENTS, TaskScheduler
+from serialization import InputSerializer, SerializedInput, serialize_input
+from token_accounting import TokenCounter, TokenLedger, get_tokenizer
+from transport import Transport, create_transport
+from validator import OutputValidator, SchemaValidator, load_schemas
+
+# Testing root; relative paths in the integration config resolve against it
+TESTING_ROOT = Path(__file__).parent.parent
+DEFAULT_CONFIG_PATH = TESTING_ROOT / "config" / "task_integration.json"
+DEFAULT_SCHEMAS_PATH = TESTING_ROOT / "schemas" / "validation_schemas.json"
 
 @dataclass
 class AgentTask:
@@ -22,6 +46,14 @@ class AgentTask:
     input_data: Dict
     subagent_type: str = "general-purpose"
     timeout: int = 30
+    priority: Optional[int] = None  # None derives priority from agent and model
+    _serialized: Optional[SerializedInput] = field(default=None, init=False, repr=False, compare=False)
+
+    def serialized(self) -> SerializedInput:
+        """Minified and canonical JSON of input_data, computed once per task"""
+        if self._serialized is None:
+            self._serialized = serialize_input(self.input_data)
+        return self._serialized
 
 @dataclass
 class TaskResult:
@@ -33,6 +65,11 @@ class TaskResult:
     error: Optional[str] = None
     agent_name: Optional[str] = None
     timestamp: str = ""
+    timed_out: bool = False
+    model: Optional[str] = None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    degraded: bool = False  # Mock output served because the cost budget refused the call
 
     def __post_init__(self):
         if not self.timestamp:
@@ -40,7 +77,15 @@ class TaskResult:
 
 
 class ClaudeTaskExecutor:
-    """Wrapper for Claude Code Task tool integration"""
+    """
+    Wrapper for Claude Code Task tool integration
+
+    Executions run as coroutines on a single event loop. The public methods
+    of this class are blocking wrappers that submit work to a private
+    background loop, so they can be called from any thread (including the
+    orchestrator's worker threads). Use AsyncClaudeTaskExecutor to drive the
+    same engine directly from your own event loop.
+    """
 
     def __init__(self, config: Dict = None):
         """Initialize Task executor with configuration"""
@@ -49,15 +94,85 @@ class ClaudeTaskExecutor:
             default_config.update(config)
         self.config = default_config
         self.task_history = []
+        self.agent_latencies = {}
         self.execution_cache = {}
+        self.result_cache = self._create_result_cache()
+        self.cassette = self._create_cassette()
+        self.transport = create_transport(self.config)
+        self.model_selector = ModelSelector(self.config)
+        self.rate_limiter = self._create_rate_limiter()
+        self.concurrency_limiter = self._create_concurrency_limiter()
+        self.retry_policy = RetryPolicy.from_config(self.config)
+        self.circuit_breakers = CircuitBreakerRegistry.from_config(self.config)
+        self._spec_hashes = {}
+        self._inflight = {}
+
+        # Token counting and per-agent/phase/model usage
+        token_config = self.config.get("token_accounting") or {}
+        self.token_counter = TokenCounter(get_tokenizer(token_config.get("tokenizer", "auto")))
+        self.token_ledger = TokenLedger()
+
+        # Inputs are serialized once and shared by cache keys and prompts;
+        # per-agent prompt prefixes are built once and reused byte-for-byte
+        self.serializer = InputSerializer()
+        self.prompt_builder = PromptBuilder.from_config(self.config, self.serializer)
+
+        # Run-level cost ceiling (performance_limits.max_cost_per_run)
+        self.model_prices = prices_from_config(self.config)
+        self.budget = BudgetManager.from_config(self.config, self.model_selector.routing_table)
+
+        # Model cascade: output checks (loaded on first use) and per-agent escalations
+        self.cascade_stats = {}
+        self._output_schemas = None
+        self._output_validator = None
+
+        # Run-level time budget and cooperative cancellation
+        self._run_deadline = None
+        self._cancel_requested = False
+        self._active_dispatches = set()
         self.mock_mode = self.config.get("fallback_to_mock", True)
         self.stats = {
             "total_executions": 0,
             "successful_executions": 0,
             "failed_executions": 0,
+            "timed_out_executions": 0,
+            "cancelled_executions": 0,
+            "retries": 0,
+            "circuit_rejections": 0,
+            "token_limit_rejections": 0,
+            "token_limit_violations": 0,
+            "budget_rejections": 0,
+            "budget_degraded": 0,
+            "cassette_recorded": 0,
+            "cassette_replayed": 0,
+            "cassette_misses": 0,
+            "batched_calls": 0,
+            "batched_inputs": 0,
+            "batch_fallbacks": 0,
+            "hedges_fired": 0,
+            "hedges_won": 0,
+            "hedge_tokens_wasted": 0,
+            "cache_hits": 0,
+            "coalesced_executions": 0,
             "total_tokens": 0,
-            "total_time": 0
+            "total_time": 0,
+            "current_concurrency": 0,
+            "peak_concurrency": 0,
+            "concurrency_limit": self.config["max_parallel_tasks"],
+            "peak_concurrency_limit": self.config["max_parallel_tasks"]
         }
+        self._in_flight = 0
+        # Tasks whose request got past every queue and went out
+        self._sent_tasks = weakref.WeakSet()
+
+        # Concurrency primitives are bound to the loop that first uses them
+        self._semaphore = None
+        self._semaphore_loop = None
+
+        # Background loop backing the blocking API (started lazily)
+        self._loop = None
+        self._loop_thread = None
+        self._loop_lock = threading.Lock()
 
     def _default_config(self) -> Dict:
         """Return default configuration"""
@@ -65,14 +180,212 @@ class ClaudeTaskExecutor:
             "enabled": True,
             "fallback_to_mock": True,
             "timeout_seconds": 30,
+            "backend_url": None,  # messages-style HTTP backend, e.g. stand_in_server.py
             "retry_attempts": 2,
             "parallel_execution": True,
             "max_parallel_tasks": 4,
             "cache_results": True,
-            "verbose": False
+            "coalesce_requests": True,
+            "verbose": False,
+            "mock_execution_delay": 0.1,
+            "performance_limits": {
+                "max_tokens_per_test": 5000,
+                "max_total_time": 3600,
+                "max_cost_per_run": 1.0
+            },
+            "budget": {
+                "enabled": True,
+                "on_exceeded": "mock",
+                "apply_to_mock": False
+            },
+            "prompt_caching": {
+                "enabled": True
+            },
+            "transport": {
+                "backend": "auto",
+                "max_connections": 20,
+                "max_connections_per_host": 10,
+                "keepalive_expiry_seconds": 30,
+                "http2": True
+            },
+            "cassette": {
+                "mode": "off",
+                "path": "data/cassettes/agent_executions.jsonl",
+                "replay_latency": False,
+                "latency_scale": 1.0,
+                "on_miss": "error"
+            },
+            "token_accounting": {
+                "tokenizer": "auto"
+            },
+            "error_handling": {
+                "retry_delay_seconds": 1,
+                "backoff_multiplier": 2,
+                "max_retry_delay_seconds": 30,
+                "jitter": "full",
+                "circuit_breaker": {
+                    "enabled": True,
+                    "failure_threshold": 5,
+                    "reset_timeout_seconds": 30,
+                    "half_open_max_calls": 1
+                }
+            },
+            "rate_limiting": {
+                "enabled": True,
+                "apply_to_mock": False
+            },
+            "scheduling": {
+                "enabled": True,
+                "critical_agents": CRITICAL_AGENTS,
+                "model_priority": {"opus": 2, "sonnet": 1, "haiku": 0},
+                "deadline_resolution_seconds": 1.0
+            },
+            "prompt_batching": {
+                "enabled": True,
+                "min_fixtures": 6,
+                "max_batch_size": 10
+            },
+            "cascade": {
+                "enabled": False,
+                "tiers": ["haiku", "sonnet", "opus"],
+                "cap_at_assigned_tier": True,
+                "schemas_path": None
+            },
+            "hedging": {
+                "enabled": False,
+                "percentile": 95,
+                "min_samples": 5,
+                "models": ["opus"]
+            },
+            "adaptive_concurrency": {
+                "enabled": False,
+                "min_concurrency": 1,
+                "max_concurrency": 64,
+                "additive_increase": 1,
+                "decrease_factor": 0.5,
+                "latency_tolerance": 2.0
+            },
+            "cache_configuration": {
+                "enabled": True,
+                "ttl_seconds": 3600,
+                "max_cache_size_mb": 100,
+                "cache_directory": ".cache/task_results"
+            }
         }
 
-    def execute_agent(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
+    def _create_result_cache(self) -> Optional[DiskResultCache]:
+        """Create the persistent cache tier described by cache_configuration"""
+        cache_config = self.config.get("cache_configuration") or {}
+        if not self.config["cache_results"] or not cache_config.get("enabled", False):
+            return None
+
+        cache_dir = Path(cache_config.get("cache_directory", ".cache/task_results"))
+        if not cache_dir.is_absolute():
+            cache_dir = TESTING_ROOT / cache_dir
+
+        return DiskResultCache(
+            cache_dir,
+            ttl_seconds=cache_config.get("ttl_seconds", 3600),
+            max_size_mb=cache_config.get("max_cache_size_mb", 100)
+        )
+
+    def _create_cassette(self) -> Optional[Cassette]:
+        """Open the record/replay cassette when cassette.mode is record or replay"""
+        cassette_config = self.config.get("cassette") or {}
+        mode = cassette_config.get("mode", "off")
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {CASSETTE_MODES}")
+        on_miss = cassette_config.get("on_miss", "error")
+        if on_miss not in MISS_ACTIONS:
+            raise ValueError(f"Unknown cassette on_miss '{on_miss}', expected one of {MISS_ACTIONS}")
+        if mode == "off":
+            return None
+
+        path = Path(cassette_config.get("path", "data/cassettes/agent_executions.jsonl"))
+        if not path.is_absolute():
+            path = TESTING_ROOT / path
+        return Cassette(path)
+
+    def use_cassette(self, mode: str, path: str = None):
+        """
+        Switch record/replay mode
+
+        Args:
+            mode: 'off', 'record' or 'replay'
+            path: Cassette file (defaults to cassette.path)
+        """
+        cassette_config = dict(self.config.get("cassette") or {})
+        cassette_config["mode"] = mode
+        if path:
+            cassette_config["path"] = path
+        self.config["cassette"] = cassette_config
+        if self.cassette is not None:
+            self.cassette.compact()
+        self.cassette = self._create_cassette()
+
+    def _recording(self) -> bool:
+        """Whether executions are being recorded to the cassette"""
+        return self.cassette is not None and self.config["cassette"]["mode"] == "record"
+
+    def _create_rate_limiter(self) -> Optional[ModelRateLimiter]:
+        """Create per-model rate limits from model_preferences"""
+        if not (self.config.get("rate_limiting") or {}).get("enabled", False):
+            return None
+
+        limit_keys = ("requests_per_minute", "tokens_per_minute", "max_concurrency")
+        limits = {}
+        for model, preferences in (self.config.get("model_preferences") or {}).items():
+            limits[model] = {key: preferences[key] for key in limit_keys if key in preferences}
+
+        return ModelRateLimiter(limits)
+
+    def _create_concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Create the AIMD limiter that replaces the fixed max_parallel_tasks bound"""
+        adaptive = self.config.get("adaptive_concurrency") or {}
+        if not adaptive.get("enabled", False):
+            return None
+
+        return AdaptiveConcurrencyLimiter(
+            initial=adaptive.get("initial_concurrency", self.config["max_parallel_tasks"]),
+            minimum=adaptive.get("min_concurrency", 1),
+            maximum=adaptive.get("max_concurrency", 64),
+            increase=adaptive.get("additive_increase", 1),
+            decrease_factor=adaptive.get("decrease_factor", 0.5),
+            latency_tolerance=adaptive.get("latency_tolerance", 2.0)
+        )
+
+    def create_scheduler(self) -> Optional[TaskScheduler]:
+        """Create a task scheduler from the scheduling config, or None if disabled"""
+        scheduling = self.config.get("scheduling") or {}
+        if not scheduling.get("enabled", False):
+            return None
+
+        return TaskScheduler(
+            model_for_agent=self.model_selector.routing_table.model_for,
+            expected_duration_for_agent=self.get_expected_duration,
+            critical_agents=scheduling.get("critical_agents", CRITICAL_AGENTS),
+            model_priority=scheduling.get("model_priority"),
+            deadline_resolution=scheduling.get("deadline_resolution_seconds", 1.0)
+        )
+
+    def get_expected_duration(self, agent_name: str) -> Optional[float]:
+        """Mean duration of recent executions of an agent, or None without history"""
+        latencies = self.agent_latencies.get(agent_name)
+        if not latencies:
+            return None
+        return sum(latencies) / len(latencies)
+
+    def get_latency_percentile(self, agent_name: str, percentile: float) -> Optional[float]:
+        """Nearest-rank percentile of recent execution times of an agent, or None without history"""
+        latencies = self.agent_latencies.get(agent_name)
+        if not latencies:
+            return None
+        ordered = sorted(latencies)
+        rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def execute_agent(self, agent_name: str, agent_spec: str, input_data: Dict,
+                      timeout: float = None) -> TaskResult:
         """
         Execute agent via Claude Task tool
 
@@ -80,27 +393,258 @@ class ClaudeTaskExecutor:
             agent_name: Name of the agent to execute
             agent_spec: Agent specification/prompt
             input_data: Input data for the agent
+            timeout: Seconds before the call is cancelled
+                (uses timeout_seconds from config if None)
 
         Returns:
             TaskResult with execution details
         """
+        return self._run_sync(self._execute_agent(agent_name, agent_spec, input_data, timeout))
+
+    async def _execute_agent(self, agent_name: str, agent_spec: str, input_data: Dict,
+                             timeout: float = None, model: str = None,
+                             serialized: SerializedInput = None) -> TaskResult:
+        """
+        Execute a single agent on the running event loop
+
+        model pins the execution to one tier; without it the agent runs on
+        its assigned tier, or through the cascade when that is enabled.
+        serialized is the input's serialization when the caller already has
+        one (an AgentTask's); otherwise it is computed once for this call.
+        """
+        with self.serializer.pinned(input_data, serialized):
+            return await self._execute_pinned(agent_name, agent_spec, input_data, timeout, model)
+
+    async def _execute_pinned(self, agent_name: str, agent_spec: str, input_data: Dict,
+                              timeout: float = None, model: str = None) -> TaskResult:
+        """Execute a single agent with its input's serialization pinned"""
+        if model is None:
+            if (self.config.get("cascade") or {}).get("enabled", False):
+                return await self._execute_cascade(agent_name, agent_spec, input_data, timeout)
+            model = self.model_selector.get_model_for_agent(agent_name)
+
         start_time = time.time()
         self.stats["total_executions"] += 1
 
-        # Check cache if enabled
-        cache_key = self._get_cache_key(agent_name, input_data)
-        if self.config["cache_results"] and cache_key in self.execution_cache:
-            if self.config["verbose"]:
-                print(f"  ↺ Using cached result for {agent_name}")
-            return self.execution_cache[cache_key]
+        # Check cache if enabled; recording skips it so every call reaches
+        # the backend and lands on the cassette
+        cache_key = self._get_cache_key(agent_name, input_data, agent_spec, model)
+        if self.config["cache_results"] and not self._recording():
+            cached = await self._lookup_cache(cache_key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                if self.config["verbose"]:
+                    print(f"  ↺ Using cached result for {agent_name}")
+                return cached
+
+            if self.config["coalesce_requests"]:
+                return await self._execute_single_flight(
+                    cache_key, agent_name, agent_spec, input_data, start_time, timeout, model
+                )
+
+        return await self._run_execution(
+            cache_key, agent_name, agent_spec, input_data, start_time, timeout, model
+        )
 
+    async def _execute_single_flight(self, cache_key: str, agent_name: str, agent_spec: str,
+                                     input_data: Dict, start_time: float,
+                                     timeout: float = None, model: str = None) -> TaskResult:
+        """
+        Execute once per cache key, sharing the result with concurrent callers
+
+        The first caller for a key becomes the leader and runs the execution;
+        callers arriving while it is in flight await the leader's future
+        instead of paying for a duplicate execution.
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            inflight = self._inflight.get(cache_key)
+            if inflight is None or inflight.get_loop() is not loop:
+                break
+
+            result = await asyncio.shield(inflight)
+            if result is not None:
+                self.stats["coalesced_executions"] += 1
+                if self.config["verbose"]:
+                    print(f"  ⇉ Joined in-flight execution for {agent_name}")
+                return result
+            # Leader was cancelled before producing a result; try again
+
+        future = loop.create_future()
+        self._inflight[cache_key] = future
         try:
-            # Attempt real Task tool execution
-            if self.config["enabled"] and not self.mock_mode:
-                result = self._execute_real_task(agent_name, agent_spec, input_data)
+            result = await self._run_execution(
+                cache_key, agent_name, agent_spec, input_data, start_time, timeout, model
+            )
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                future.set_result(None)
+            if self._inflight.get(cache_key) is future:
+                del self._inflight[cache_key]
+
+    async def _execute_cascade(self, agent_name: str, agent_spec: str, input_data: Dict,
+                               timeout: float = None) -> TaskResult:
+        """
+        Run an agent on the cheapest tier first, escalating on a failed check
+
+        Each tier's output is checked against the agent's output schema and
+        OutputValidator; the first tier that passes is accepted. By default
+        the cascade stops at the agent's assigned tier, so haiku agents run
+        exactly as before and opus agents try haiku and sonnet first. The
+        last tier's result is returned even if it fails the check.
+        """
+        tiers = self.get_cascade_tiers(agent_name)
+        agent_stats = self.cascade_stats.setdefault(agent_name, {
+            "executions": 0,
+            "escalated": 0,
+            "escalations": 0,
+            "accepted": {}
+        })
+        agent_stats["executions"] += 1
+
+        for index, model in enumerate(tiers):
+            result = await self._execute_agent(agent_name, agent_spec, input_data, timeout, model=model)
+
+            if index == len(tiers) - 1:
+                break
+            if self._classify_outcome(result) == "cancelled" or self._run_budget_exhausted():
+                break
+
+            if result.success:
+                passed, errors = self.check_output(agent_name, result.output)
+                if passed:
+                    break
+                reason = "; ".join(errors[:3])
             else:
-                # Fallback to mock execution
-                result = self._execute_mock_task(agent_name, agent_spec, input_data)
+                reason = result.error
+
+            if index == 0:
+                agent_stats["escalated"] += 1
+            agent_stats["escalations"] += 1
+            if self.config["verbose"]:
+                print(f"  ⇡ {agent_name}: escalating {model} → {tiers[index + 1]} ({reason})")
+
+        if result.success:
+            agent_stats["accepted"][model] = agent_stats["accepted"].get(model, 0) + 1
+        return result
+
+    def get_cascade_tiers(self, agent_name: str) -> List[str]:
+        """Model tiers an agent's cascade tries, cheapest first"""
+        cascade = self.config.get("cascade") or {}
+        assigned = self.model_selector.get_model_for_agent(agent_name)
+        tiers = list(cascade.get("tiers", ["haiku", "sonnet", "opus"]))
+
+        if assigned not in tiers:
+            return [assigned]
+        if cascade.get("cap_at_assigned_tier", True):
+            tiers = tiers[:tiers.index(assigned) + 1]
+        return tiers
+
+    def check_output(self, agent_name: str, output: Any) -> Tuple[bool, List[str]]:
+        """
+        Check an agent's output against its output schema and OutputValidator
+
+        Returns:
+            Tuple of (passed, list_of_errors)
+        """
+        if self._output_schemas is None:
+            schemas_path = (self.config.get("cascade") or {}).get("schemas_path") or DEFAULT_SCHEMAS_PATH
+            self._output_schemas = load_schemas(Path(schemas_path)).get("agent_validation", {})
+            self._output_validator = OutputValidator()
+
+        errors = []
+        schema = self._output_schemas.get(agent_name, {}).get("output_schema")
+        if schema:
+            _, schema_errors = SchemaValidator(schema).validate(output)
+            errors.extend(schema_errors)
+
+        is_valid, report = self._output_validator.validate_output(agent_name, output)
+        if not is_valid:
+            errors.extend(
+                f"{check}: {details.get('details')}"
+                for check, details in report["checks"].items()
+                if not details["passed"]
+            )
+
+        return not errors, errors
+
+    def _count_prompt_tokens(self, agent_name: str, agent_spec: str, input_data: Dict) -> int:
+        """Tokens in the prompt for an execution, with the shared prefix's count memoised"""
+        prompt = self._build_prompt(agent_name, agent_spec, input_data)
+        return self.token_counter.count_prefix(prompt.prefix) + self.token_counter.count(prompt.suffix)
+
+    def _get_token_limit(self, input_data: Dict) -> Optional[int]:
+        """max_tokens_per_test for an execution, scaled by the inputs a batched prompt carries"""
+        limit = (self.config.get("performance_limits") or {}).get("max_tokens_per_test")
+        if not limit:
+            return None
+        return limit * max(1, len(input_data.get(BATCH_INPUTS_KEY, ())))
+
+    def _run_budget_exhausted(self) -> bool:
+        """Whether the run-level time budget has been used up"""
+        return self._run_deadline is not None and time.monotonic() >= self._run_deadline
+
+    async def _run_execution(self, cache_key: str, agent_name: str, agent_spec: str,
+                             input_data: Dict, start_time: float,
+                             timeout: float = None, model: str = None,
+                             batch_size: int = 1) -> TaskResult:
+        """
+        Dispatch an execution and record statistics, cache and history
+
+        A multi-input call (batch_size > 1) is left out of the agent's
+        latency samples, which hedging and the scheduler read as the
+        duration of a single call.
+        """
+        model = model or self.model_selector.get_model_for_agent(agent_name)
+        token_limit = self._get_token_limit(input_data)
+        if token_limit:
+            prompt_tokens = self._count_prompt_tokens(agent_name, agent_spec, input_data)
+            if prompt_tokens > token_limit:
+                # The prompt alone is over budget; don't pay for the call.
+                # Checked before the breakers so a rejection never holds a
+                # half-open trial slot
+                self.stats["failed_executions"] += 1
+                self.stats["token_limit_rejections"] += 1
+                return TaskResult(
+                    success=False,
+                    output=None,
+                    execution_time=time.time() - start_time,
+                    tokens_used=0,
+                    error=f"Prompt exceeds max_tokens_per_test ({prompt_tokens} > {token_limit})",
+                    agent_name=agent_name,
+                    model=model
+                )
+
+        if self.circuit_breakers is not None:
+            rejection = self.circuit_breakers.allow(agent_name, model)
+            if rejection:
+                # Fail fast instead of spending a slot on a tier that is down
+                self.stats["failed_executions"] += 1
+                self.stats["circuit_rejections"] += 1
+                return TaskResult(
+                    success=False,
+                    output=None,
+                    execution_time=time.time() - start_time,
+                    tokens_used=0,
+                    error=rejection,
+                    agent_name=agent_name,
+                    model=model
+                )
+
+        outcome = "cancelled"
+        try:
+            result = await self._run_with_deadline(agent_name, agent_spec, input_data, timeout, model)
+            result.model = model
+            outcome = self._classify_outcome(result)
+
+            if result.tokens_used:
+                self.stats["total_tokens"] += result.tokens_used
+                self.token_ledger.record(agent_name, model, result.prompt_tokens, result.completion_tokens)
+                if token_limit and result.tokens_used > token_limit:
+                    self.stats["token_limit_violations"] += 1
 
             # Update statistics
             execution_time = time.time() - start_time
@@ -111,22 +655,31 @@ class ClaudeTaskExecutor:
                 self.stats["successful_executions"] += 1
             else:
                 self.stats["failed_executions"] += 1
+                if result.timed_out:
+                    self.stats["timed_out_executions"] += 1
 
-            # Cache result if enabled
-            if self.config["cache_results"]:
-                self.execution_cache[cache_key] = result
+            # Cache result if enabled; failures are never cached so a retry
+            # really runs the agent again, and budget-degraded mock output
+            # is never cached so a later run with budget gets the real model
+            if (self.config["cache_results"] and result.success and not result.degraded
+                    and cache_key is not None):
+                await self._store_cache(cache_key, result)
 
             # Store in history
+            if batch_size == 1:
+                self.agent_latencies.setdefault(agent_name, deque(maxlen=100)).append(execution_time)
             self.task_history.append({
                 "agent": agent_name,
                 "timestamp": datetime.now().isoformat(),
                 "success": result.success,
-                "execution_time": execution_time
+                "execution_time": execution_time,
+                "batch_size": batch_size
             })
 
             return result
 
         except Exception as e:
+            outcome = "error"
             self.stats["failed_executions"] += 1
             return TaskResult(
                 success=False,
@@ -134,10 +687,505 @@ class ClaudeTaskExecutor:
                 execution_time=time.time() - start_time,
                 tokens_used=0,
                 error=str(e),
-                agent_name=agent_name
+                agent_name=agent_name,
+                model=model
             )
 
-    def _execute_real_task(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
+        finally:
+            if self.circuit_breakers is not None:
+                self.circuit_breakers.record(agent_name, model, outcome)
+
+    async def _run_with_deadline(self, agent_name: str, agent_spec: str, input_data: Dict,
+                                 timeout: float = None, model: str = None) -> TaskResult:
+        """
+        Run one dispatch under its per-task deadline
+
+        The deadline is the smaller of the task timeout and what is left of
+        the run-level budget (performance_limits.max_total_time). It covers
+        queueing for rate limits and concurrency slots as well as the call
+        itself. On expiry the dispatch is cancelled, which releases its
+        slot, and a result marked timed_out is returned. cancel_all()
+        cancels active dispatches the same way.
+        """
+        if self._cancel_requested:
+            return self._cancelled_result(agent_name)
+
+        timeout = self._effective_timeout(timeout)
+        if timeout <= 0:
+            return self._timeout_result(agent_name, 0, "Run time budget exhausted")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        dispatch = asyncio.ensure_future(
+            self._dispatch_hedged(agent_name, agent_spec, input_data, deadline, model)
+        )
+        self._active_dispatches.add(dispatch)
+
+        try:
+            return await asyncio.wait_for(dispatch, timeout)
+        except asyncio.TimeoutError:
+            if self.config["verbose"]:
+                print(f"  ⏱ {agent_name} timed out after {timeout:.1f}s")
+            return self._timeout_result(agent_name, timeout)
+        except asyncio.CancelledError:
+            if not (self._cancel_requested and dispatch.cancelled()):
+                raise  # Our caller was cancelled, not just the dispatch
+            return self._cancelled_result(agent_name)
+        finally:
+            self._active_dispatches.discard(dispatch)
+
+    def _get_hedge_delay(self, agent_name: str, model: str = None) -> Optional[float]:
+        """
+        Seconds to wait before hedging a call, or None to never hedge it
+
+        Only agents on the configured model tiers with at least min_samples
+        recent executions are hedged; the delay is their latency percentile.
+        """
+        hedging = self.config.get("hedging") or {}
+        if not hedging.get("enabled", False):
+            return None
+
+        model = model or self.model_selector.get_model_for_agent(agent_name)
+        if model not in hedging.get("models", ["opus"]):
+            return None
+
+        if len(self.agent_latencies.get(agent_name, ())) < hedging.get("min_samples", 5):
+            return None
+
+        return self.get_latency_percentile(agent_name, hedging.get("percentile", 95))
+
+    async def _dispatch_hedged(self, agent_name: str, agent_spec: str, input_data: Dict,
+                               deadline: float = None, model: str = None) -> TaskResult:
+        """
+        Dispatch, firing one duplicate request if the call runs past the
+        agent's latency percentile
+
+        Whichever request succeeds first wins and the other is cancelled.
+        The loser's completion tokens, or the prompt it already sent if it
+        was cancelled mid-flight, are reported as hedge_tokens_wasted. A
+        loser cancelled while still queued for a slot or rate limit
+        capacity never sent anything and costs nothing.
+        """
+        hedge_delay = self._get_hedge_delay(agent_name, model)
+        if hedge_delay is None:
+            return await self._dispatch_limited(agent_name, agent_spec, input_data, deadline, model)
+
+        primary = asyncio.ensure_future(
+            self._dispatch_limited(agent_name, agent_spec, input_data, deadline, model)
+        )
+        requests = [primary]
+        try:
+            done, _ = await asyncio.wait(requests, timeout=hedge_delay)
+            if done:
+                return primary.result()
+
+            if self.config["verbose"]:
+                print(f"  ⑂ Hedging {agent_name} after {hedge_delay:.2f}s")
+            self.stats["hedges_fired"] += 1
+            requests.append(asyncio.ensure_future(
+                self._dispatch_limited(agent_name, agent_spec, input_data, deadline, model)
+            ))
+
+            # Prefer the first success; fall back to the last failure
+            pending = set(requests)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((request for request in requests
+                               if request in done and request.result().success), None)
+                if winner is None and not pending:
+                    winner = next(request for request in requests if request in done)
+                if winner is not None:
+                    break
+
+            if winner is not primary:
+                self.stats["hedges_won"] += 1
+            for request in requests:
+                if request is not winner:
+                    self.stats["hedge_tokens_wasted"] += self._hedge_waste(
+                        request, agent_name, agent_spec, input_data
+                    )
+            return winner.result()
+        finally:
+            for request in requests:
+                if not request.done():
+                    request.cancel()
+
+    def _hedge_waste(self, request: asyncio.Future, agent_name: str, agent_spec: str,
+                     input_data: Dict) -> int:
+        """Tokens spent by a losing hedge request"""
+        if request.done() and not request.cancelled():
+            return request.result().tokens_used
+        if request not in self._sent_tasks:
+            return 0
+        return self._count_prompt_tokens(agent_name, agent_spec, input_data)
+
+    async def _dispatch_limited(self, agent_name: str, agent_spec: str, input_data: Dict,
+                                deadline: float = None, model: str = None) -> TaskResult:
+        """Dispatch within the concurrency bound, the model's rate limits and the cost budget"""
+        model = model or self.model_selector.get_model_for_agent(agent_name)
+        return await self._dispatch_governed(agent_name, agent_spec, input_data, deadline, model)
+
+    async def _dispatch_budgeted(self, agent_name: str, agent_spec: str, input_data: Dict,
+                                 deadline: float = None, model: str = None) -> TaskResult:
+        """
+        Dispatch under the cost budget
+
+        Runs once the concurrency slot and rate limit lease are held, so
+        only calls about to go out hold a reservation; calls still queued
+        for capacity don't tie up budget they may never spend.
+        """
+        if not self._budget_applies():
+            return await self._dispatch(agent_name, agent_spec, input_data, deadline, model)
+
+        estimated_tokens = self._count_prompt_tokens(agent_name, agent_spec, input_data)
+        reservation = self.budget.reserve(
+            agent_name, model, estimated_tokens + self._get_max_tokens(agent_name, model)
+        )
+        if reservation is None:
+            if self.budget.on_exceeded == "stop":
+                self.stats["budget_rejections"] += 1
+                return TaskResult(
+                    success=False,
+                    output=None,
+                    execution_time=0,
+                    tokens_used=0,
+                    error="Cost budget exhausted (max_cost_per_run)",
+                    agent_name=agent_name,
+                    model=model
+                )
+
+            # Degrade to the free mock backend rather than overspend
+            self.stats["budget_degraded"] += 1
+            if self.config["verbose"]:
+                print(f"  $ Cost budget exhausted, running {agent_name} as mock")
+            # Straight to the mock: degraded output must never be recorded
+            # to the cassette or cached as if the model had produced it
+            result = await self._dispatch_live(agent_name, agent_spec, input_data, deadline, model, use_mock=True)
+            result.degraded = True
+            return result
+
+        try:
+            result = await self._dispatch(agent_name, agent_spec, input_data, deadline, model)
+        except BaseException:
+            self.budget.release(reservation)
+            raise
+
+        self.budget.commit(reservation, result.tokens_used)
+        return result
+
+    def _budget_applies(self) -> bool:
+        """Whether executions are charged against the cost budget"""
+        if self.budget is None:
+            return False
+        return self._uses_real_backend() or self.config["budget"].get("apply_to_mock", False)
+
+    def budget_exhausted(self) -> bool:
+        """Whether the cost budget has started refusing calls in 'stop' mode"""
+        return (
+            self.budget is not None
+            and self.budget.on_exceeded == "stop"
+            and self.budget.refused > 0
+        )
+
+    def get_cost_report(self) -> Dict:
+        """
+        Spend for the run
+
+        Returns:
+            Budget state (actual charged spend) and the estimated cost of
+            every counted token at list prices, mock executions included
+        """
+        usage = self.token_ledger.get_statistics()
+        by_model = {
+            model: round(price_tokens(self.model_prices, model, totals["total_tokens"]), 6)
+            for model, totals in usage["by_model"].items()
+        }
+        return {
+            "budget": self.budget.get_statistics() if self.budget else None,
+            "estimated_cost": {
+                "total": round(sum(by_model.values()), 6),
+                "by_model": by_model
+            }
+        }
+
+    def start_run(self):
+        """
+        Start a run: the run-level time budget (performance_limits.max_total_time)
+        is measured from now, and an earlier cancel_all() no longer applies
+
+        Long-lived executors should call this at the start of every run;
+        without it the budget is measured from the first execution.
+        """
+        max_total_time = (self.config.get("performance_limits") or {}).get("max_total_time")
+        self._run_deadline = time.monotonic() + max_total_time if max_total_time else None
+        self._cancel_requested = False
+
+    def _effective_timeout(self, timeout: float = None) -> float:
+        """Per-task timeout capped by the remaining run-level budget"""
+        if timeout is None:
+            timeout = self.config["timeout_seconds"]
+
+        max_total_time = (self.config.get("performance_limits") or {}).get("max_total_time")
+        if not max_total_time:
+            return timeout
+
+        now = time.monotonic()
+        if self._run_deadline is None:
+            self._run_deadline = now + max_total_time
+        return min(timeout, self._run_deadline - now)
+
+    def _timeout_result(self, agent_name: str, timeout: float, reason: str = None) -> TaskResult:
+        """Build the result for an execution that ran out of time"""
+        return TaskResult(
+            success=False,
+            output=None,
+            execution_time=timeout,
+            tokens_used=0,
+            error=reason or f"Timed out after {timeout:.1f}s",
+            agent_name=agent_name,
+            timed_out=True
+        )
+
+    def _cancelled_result(self, agent_name: str) -> TaskResult:
+        """Build the result for an execution stopped by cancel_all()"""
+        self.stats["cancelled_executions"] += 1
+        return TaskResult(
+            success=False,
+            output=None,
+            execution_time=0,
+            tokens_used=0,
+            error="Cancelled",
+            agent_name=agent_name
+        )
+
+    def cancel_all(self):
+        """
+        Cooperatively cancel the current run
+
+        Active dispatches are cancelled and freed, and executions that have
+        not been dispatched yet return a 'Cancelled' result immediately.
+        Call reset_statistics() to start a new run.
+        """
+        self._cancel_requested = True
+
+        def cancel_active():
+            for dispatch in list(self._active_dispatches):
+                dispatch.cancel()
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        loops = {dispatch.get_loop() for dispatch in list(self._active_dispatches)}
+        for loop in loops:
+            if loop is running_loop:
+                cancel_active()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(cancel_active)
+
+    def _uses_real_backend(self) -> bool:
+        """Whether executions go to the real Task tool rather than the mock"""
+        return self.config["enabled"] and not self.mock_mode
+
+    def _rate_limit(self, model: str, agent_name: str, agent_spec: str, input_data: Dict) -> RateLimitLease:
+        """
+        Reserve rate limit capacity for one execution
+
+        The reservation covers the estimated prompt plus the model's
+        max_tokens completion budget and is reconciled against the actual
+        usage when the lease is settled. Mock executions are only limited
+        when rate_limiting.apply_to_mock is set.
+        """
+        limiter = self.rate_limiter
+        if limiter is not None and not (
+            self._uses_real_backend() or self.config["rate_limiting"].get("apply_to_mock", False)
+        ):
+            limiter = None
+
+        if limiter is None:
+            return RateLimitLease(None, model, 0)
+
+        prompt_tokens = self._count_prompt_tokens(agent_name, agent_spec, input_data)
+        return limiter.limit(model, prompt_tokens + self._get_max_tokens(agent_name, model))
+
+    def _get_max_tokens(self, agent_name: str, model: str) -> int:
+        """Completion token budget for an agent's call on a model tier"""
+        return self.model_selector.routing_table.max_tokens(agent_name, model)
+
+    async def _dispatch_governed(self, agent_name: str, agent_spec: str, input_data: Dict,
+                                 deadline: float = None, model: str = None) -> TaskResult:
+        """
+        Dispatch within the executor-wide concurrency bound
+
+        The bound is either the fixed max_parallel_tasks semaphore or, when
+        adaptive_concurrency is enabled, the AIMD limiter fed with each
+        dispatch's latency and outcome. The model's rate limit lease is
+        taken only once a slot is held, right before the request goes out,
+        so calls queued for a slot don't tie up rate limit capacity.
+        """
+        limiter = self.concurrency_limiter
+        if limiter is None:
+            async with self._get_semaphore():
+                async with self._rate_limit(model, agent_name, agent_spec, input_data) as lease:
+                    result = await self._track_in_flight(
+                        self._dispatch_budgeted(agent_name, agent_spec, input_data, deadline, model)
+                    )
+                    lease.settle(result.tokens_used)
+                return result
+
+        started_at = await limiter.acquire()
+        dispatched = False
+        outcome = "error"
+        try:
+            async with self._rate_limit(model, agent_name, agent_spec, input_data) as lease:
+                # The limiter judges the request itself, not its wait for rate limit capacity
+                started_at = time.monotonic()
+                dispatched = True
+                result = await self._track_in_flight(
+                    self._dispatch_budgeted(agent_name, agent_spec, input_data, deadline, model)
+                )
+                lease.settle(result.tokens_used)
+            outcome = self._classify_outcome(result)
+            return result
+        except asyncio.CancelledError:
+            if dispatched and deadline is not None and asyncio.get_running_loop().time() >= deadline:
+                outcome = "deadline"
+            else:
+                outcome = "cancelled"
+            raise
+        finally:
+            limiter.release(started_at, outcome)
+            self.stats["concurrency_limit"] = int(limiter.limit)
+            self.stats["peak_concurrency_limit"] = int(limiter.peak_limit)
+
+    async def _track_in_flight(self, coro):
+        """Await a dispatch while counting it as in flight"""
+        self._sent_tasks.add(asyncio.current_task())
+        self._in_flight += 1
+        self.stats["current_concurrency"] = self._in_flight
+        self.stats["peak_concurrency"] = max(self.stats["peak_concurrency"], self._in_flight)
+        try:
+            return await coro
+        finally:
+            self._in_flight -= 1
+            self.stats["current_concurrency"] = self._in_flight
+
+    def _classify_outcome(self, result: TaskResult) -> str:
+        """
+        Classify a result as success, throttled, timeout, deadline,
+        cancelled, circuit_open, budget_exhausted, cassette_miss or error
+
+        deadline is an execution that ran out of its task timeout or of the
+        run budget; timeout is one the backend itself reported or gave up on.
+        """
+        if result.success:
+            return "success"
+        if result.timed_out:
+            return "deadline"
+        if result.error == "Cancelled":
+            return "cancelled"
+
+        error = (result.error or "").lower()
+        if error.startswith("circuit open"):
+            return "circuit_open"
+        if error.startswith("cost budget exhausted"):
+            return "budget_exhausted"
+        if error.startswith("cassette miss"):
+            return "cassette_miss"
+        if any(marker in error for marker in ("429", "rate limit", "rate_limit", "overloaded", "throttl")):
+            return "throttled"
+        if "timed out" in error or "timeout" in error:
+            return "timeout"
+        return "error"
+
+    async def _dispatch(self, agent_name: str, agent_spec: str, input_data: Dict,
+                        deadline: float = None, model: str = None) -> TaskResult:
+        """Route an execution to the cassette, the real Task tool or the mock backend"""
+        if self.cassette is not None:
+            return await self._dispatch_cassette(agent_name, agent_spec, input_data, deadline, model)
+        return await self._dispatch_live(agent_name, agent_spec, input_data, deadline, model)
+
+    async def _dispatch_cassette(self, agent_name: str, agent_spec: str, input_data: Dict,
+                                 deadline: float = None, model: str = None) -> TaskResult:
+        """
+        Record a live execution, or replay a recorded one
+
+        Entries are keyed like the result cache (agent, model, spec hash and
+        canonical input), so a replay only matches the exact call that was
+        recorded. Replayed calls return immediately unless replay_latency is
+        set, in which case they take the recorded latency times
+        latency_scale.
+        """
+        cassette_config = self.config["cassette"]
+        model = model or self.model_selector.get_model_for_agent(agent_name)
+        key = self._get_cache_key(agent_name, input_data, agent_spec, model)
+
+        if cassette_config["mode"] == "replay":
+            entry = await asyncio.to_thread(self.cassette.play, key)
+            if entry is not None:
+                self.stats["cassette_replayed"] += 1
+                if cassette_config.get("replay_latency", False):
+                    await asyncio.sleep(entry.get("latency", 0) * cassette_config.get("latency_scale", 1.0))
+                return TaskResult(
+                    success=entry["success"],
+                    output=entry.get("output"),
+                    execution_time=entry.get("latency", 0),
+                    tokens_used=entry.get("tokens_used", 0),
+                    error=entry.get("error"),
+                    agent_name=agent_name,
+                    model=model,
+                    prompt_tokens=entry.get("prompt_tokens", 0),
+                    completion_tokens=entry.get("completion_tokens", 0)
+                )
+
+            self.stats["cassette_misses"] += 1
+            if cassette_config.get("on_miss", "error") == "error":
+                return TaskResult(
+                    success=False,
+                    output=None,
+                    execution_time=0,
+                    tokens_used=0,
+                    error=f"Cassette miss: {agent_name} on {model} was not recorded for this input",
+                    agent_name=agent_name,
+                    model=model
+                )
+            return await self._dispatch_live(agent_name, agent_spec, input_data, deadline, model)
+
+        started = time.perf_counter()
+        result = await self._dispatch_live(agent_name, agent_spec, input_data, deadline, model)
+        latency = time.perf_counter() - started
+
+        try:
+            await asyncio.to_thread(self.cassette.record, key, {
+                "agent_name": agent_name,
+                "model": model,
+                "success": result.success,
+                "output": result.output,
+                "error": result.error,
+                "latency": round(latency, 4),
+                "tokens_used": result.tokens_used,
+                "prompt_tokens": result.prompt_tokens,
+                "completion_tokens": result.completion_tokens
+            })
+            self.stats["cassette_recorded"] += 1
+        except (OSError, TypeError, ValueError) as e:
+            if self.config["verbose"]:
+                print(f"  ⚠ Could not record {agent_name} to cassette: {e}")
+        return result
+
+    async def _dispatch_live(self, agent_name: str, agent_spec: str, input_data: Dict,
+                             deadline: float = None, model: str = None, use_mock: bool = False) -> TaskResult:
+        """Route an execution to the real Task tool or the mock backend"""
+        if self._uses_real_backend() and not use_mock:
+            # Attempt real Task tool execution
+            return await self._execute_real_task(agent_name, agent_spec, input_data, deadline, model)
+
+        # Fallback to mock execution
+        return await self._execute_mock_task(agent_name, agent_spec, input_data)
+
+    async def _execute_real_task(self, agent_name: str, agent_spec: str, input_data: Dict,
+                                 deadline: float = None, model: str = None) -> TaskResult:
         """
         Execute real Task tool invocation
 
@@ -145,113 +1193,166 @@ class ClaudeTaskExecutor:
         For now, it simulates the integration point.
         """
         # Build the Task tool invocation
-        task_prompt = self._build_task_prompt(agent_name, agent_spec, input_data)
+        prompt = self._build_prompt(agent_name, agent_spec, input_data)
 
         # In real implementation, this would use the Task tool
         # For demonstration, we'll prepare the structure
         task_config = {
             "description": f"Test {agent_name}",
-            "prompt": task_prompt,
-            "subagent_type": "general-purpose"
+            "prompt": prompt.text,
+            "subagent_type": "general-purpose",
+            "model": model or self.model_selector.get_model_for_agent(agent_name),
+            # Prefix/suffix split with cache_control for APIs that cache prompts
+            **self.prompt_builder.to_messages(prompt)
         }
 
         if self.config["verbose"]:
             print(f"  → Executing real task for {agent_name}")
             print(f"    Input keys: {list(input_data.keys())}")
 
+        if self.config.get("backend_url"):
+            return await self._execute_backend_request(agent_name, task_config, input_data, deadline)
+
         # Simulate Task tool execution
         # In production, this would be:
         # result = Task(**task_config)
 
         # For now, return mock with real structure
-        return self._execute_mock_task(agent_name, agent_spec, input_data)
+        return await self._execute_mock_task(agent_name, agent_spec, input_data)
+
+    async def _execute_backend_request(self, agent_name: str, task_config: Dict,
+                                       input_data: Dict, deadline: float = None) -> TaskResult:
+        """
+        Send an execution to the messages-style HTTP backend at backend_url
+
+        metadata carries the agent name and raw input so a stand-in server
+        (see stand_in_server.py) can answer like the mock backend would.
+        The request timeout is timeout_seconds capped by what is left of
+        the execution's deadline (a loop.time() value), so the socket gives
+        up when the deadline does instead of outliving the cancelled call.
+        """
+        model = task_config["model"]
+        request = {
+            "model": model,
+            "max_tokens": self._get_max_tokens(agent_name, model),
+            "system": task_config["system"],
+            "messages": task_config["messages"],
+            "metadata": {"agent_name": agent_name, "input": input_data}
+        }
+        url = self.config["backend_url"].rstrip("/") + "/v1/messages"
+
+        timeout = self.config["timeout_seconds"]
+        capped = False
+        if deadline is not None:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return self._timeout_result(agent_name, 0, "Deadline passed before the request was sent")
+            capped = remaining < timeout
+            timeout = min(timeout, remaining)
+
+        try:
+            status, headers, body = await self._ensure_transport().apost_json(url, request, timeout)
+        except TimeoutError as e:
+            if capped:
+                # The execution's deadline ran out, not the backend's patience
+                return self._timeout_result(agent_name, timeout)
+            return self._backend_failure(agent_name, model, f"Backend request timed out or failed: {e}")
+        except (OSError, http.client.HTTPException) as e:
+            return self._backend_failure(agent_name, model, f"Backend request timed out or failed: {e}")
+
+        return self._parse_backend_response(agent_name, model, status, headers, body)
+
+    def _parse_backend_response(self, agent_name: str, model: str, status: int,
+                                headers: Dict, body: bytes) -> TaskResult:
+        """Turn a messages response into a TaskResult, classifying failures by message"""
+        if status == 429:
+            retry_after = headers.get("Retry-After", "?")
+            return self._backend_failure(agent_name, model, f"429 rate limited by backend (retry after {retry_after}s)")
+        if status in (408, 504):
+            return self._backend_failure(agent_name, model, f"Backend timed out (HTTP {status})")
+        if status != 200:
+            return self._backend_failure(agent_name, model, f"Backend error HTTP {status}: {body[:200]!r}")
+
+        try:
+            message = json.loads(body)
+            text = "".join(block.get("text", "") for block in message["content"])
+            usage = message.get("usage") or {}
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return self._backend_failure(agent_name, model, f"Malformed response from backend: {body[:200]!r}")
+
+        try:
+            output = json.loads(text)
+        except ValueError:
+            return self._backend_failure(agent_name, model, f"Agent output is not JSON: {text[:200]!r}")
+
+        prompt_tokens = usage.get("input_tokens", 0)
+        completion_tokens = usage.get("output_tokens", 0)
+        return TaskResult(
+            success=True,
+            output=output,
+            execution_time=0,
+            tokens_used=prompt_tokens + completion_tokens,
+            agent_name=agent_name,
+            model=model,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens
+        )
+
+    @staticmethod
+    def _backend_failure(agent_name: str, model: str, error: str) -> TaskResult:
+        """Failed TaskResult for a backend request"""
+        return TaskResult(
+            success=False,
+            output=None,
+            execution_time=0,
+            tokens_used=0,
+            error=error,
+            agent_name=agent_name,
+            model=model
+        )
 
-    def _execute_mock_task(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
+    async def _execute_mock_task(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
         """Execute mock task for testing without real Task tool"""
-        # Simulate execution delay
-        time.sleep(0.1)
+        # Simulate execution delay without blocking the event loop
+        delay = self.config["mock_execution_delay"]
+        await asyncio.sleep(delay)
 
         # Generate mock output based on agent type
-        mock_output = self._generate_mock_output(agent_name, input_data)
+        mock_output = generate_mock_response(agent_name, input_data)
 
-        # Estimate tokens (rough approximation)
-        tokens = len(json.dumps(input_data)) // 4 + len(json.dumps(mock_output)) // 4
+        # Count what a real call would have billed
+        prompt_tokens = self._count_prompt_tokens(agent_name, agent_spec, input_data)
+        completion_tokens = self.token_counter.count_json(mock_output)
 
         return TaskResult(
             success=True,
             output=mock_output,
-            execution_time=0.1,
-            tokens_used=tokens,
-            agent_name=agent_name
+            execution_time=delay,
+            tokens_used=prompt_tokens + completion_tokens,
+            agent_name=agent_name,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens
         )
 
     def _build_task_prompt(self, agent_name: str, agent_spec: str, input_data: Dict) -> str:
         """Build the complete prompt for Task tool"""
-        prompt_parts = [
-            f"You are the {agent_name} agent.",
-            "",
-            "## Agent Specification",
-            agent_spec,
-            "",
-            "## Input Data",
-            json.dumps(input_data, indent=2),
-            "",
-            "## Instructions",
-            f"Process the input according to your role as {agent_name}.",
-            "Return output in the expected JSON format.",
-            "Ensure all required fields are present."
-        ]
+        return self._build_prompt(agent_name, agent_spec, input_data).text
 
-        return "\n".join(prompt_parts)
+    def _build_prompt(self, agent_name: str, agent_spec: str, input_data: Dict) -> AgentPrompt:
+        """
+        Build the prompt for an execution as shared prefix plus input suffix
+
+        Batched inputs (see execute_agent_batch) get the agent's batch prefix
+        and all keyed inputs in one suffix.
+        """
+        if BATCH_INPUTS_KEY in input_data:
+            keyed_inputs = input_data[BATCH_INPUTS_KEY]
+            return self.prompt_builder.build(agent_name, agent_spec, keyed_inputs, len(keyed_inputs))
+        return self.prompt_builder.build(agent_name, agent_spec, input_data)
 
     def _generate_mock_output(self, agent_name: str, input_data: Dict) -> Dict:
         """Generate appropriate mock output based on agent type"""
-        # Agent-specific mock outputs
-        mock_outputs = {
-            "keyword-researcher": {
-                "primary_keyword": f"test keyword for {input_data.get('topic', 'topic')}",
-                "long_tail": ["long tail 1", "long tail 2", "long tail 3"],
-                "search_volume": "medium",
-                "difficulty": "medium"
-            },
-            "topic-scout": {
-                "trending_topics": ["trend 1", "trend 2", "trend 3"],
-                "content_gaps": ["gap 1", "gap 2"],
-                "opportunities": ["opportunity 1", "opportunity 2"]
-            },
-            "source-gatherer": {
-                "sources": [
-                    "https://source1.com",
-                    "https://source2.com",
-                    "https://source3.com",
-                    "https://source4.com",
-                    "https://source5.com"
-                ],
-                "key_points": ["point 1", "point 2", "point 3"]
-            },
-            "body-writer": {
-                "body_content": f"Generated content for {input_data.get('outline', ['topic'])[0]}...",
-                "sections_written": input_data.get("sections", ["section 1", "section 2"])
-            },
-            "grammar-checker": {
-                "corrected_content": input_data.get("content", "corrected text"),
-                "errors_found": ["error 1", "error 2"]
-            },
-            "content-atomizer": {
-                "key_points": ["key point 1", "key point 2", "key point 3"],
-                "snippets": ["snippet 1", "snippet 2"]
-            }
-        }
-
-        # Return specific mock or generic
-        if agent_name in mock_outputs:
-            return mock_outputs[agent_name]
-        else:
-            return {
-                "status": "completed",
-                "output": f"Mock output for {agent_name}",
-                "data": input_data
-            }
+        return generate_mock_output(agent_name, input_data)
 
     def batch_execute(self, agents: List[AgentTask], parallel: bool = None) -> List[TaskResult]:
         """
@@ -262,86 +1363,403 @@ class ClaudeTaskExecutor:
             parallel: Whether to execute in parallel (uses config if None)
 
         Returns:
-            List of TaskResult objects
+            List of TaskResult objects, in the same order as agents
         """
+        return self._run_sync(self._batch_execute(agents, parallel))
+
+    async def _batch_execute(self, agents: List[AgentTask], parallel: bool = None) -> List[TaskResult]:
+        """Execute multiple agents on the running event loop"""
         if parallel is None:
             parallel = self.config["parallel_execution"]
 
         if parallel and len(agents) > 1:
-            return self._batch_execute_parallel(agents)
+            return await self._batch_execute_parallel(agents)
         else:
-            return self._batch_execute_sequential(agents)
+            return await self._batch_execute_sequential(agents)
 
-    def _batch_execute_sequential(self, agents: List[AgentTask]) -> List[TaskResult]:
+    async def _batch_execute_sequential(self, agents: List[AgentTask]) -> List[TaskResult]:
         """Execute agents sequentially"""
         results = []
 
         for task in agents:
-            result = self.execute_agent(
+            result = await self._execute_agent(
                 agent_name=task.agent_name,
                 agent_spec=task.agent_spec,
-                input_data=task.input_data
+                input_data=task.input_data,
+                timeout=task.timeout,
+                serialized=task.serialized()
             )
             results.append(result)
 
         return results
 
-    def _batch_execute_parallel(self, agents: List[AgentTask]) -> List[TaskResult]:
-        """Execute agents in parallel"""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+    async def _batch_execute_parallel(self, agents: List[AgentTask]) -> List[TaskResult]:
+        """
+        Execute agents concurrently
 
-        results = []
-        max_workers = min(self.config["max_parallel_tasks"], len(agents))
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(
-                    self.execute_agent,
-                    task.agent_name,
-                    task.agent_spec,
-                    task.input_data
-                ): task
-                for task in agents
-            }
+        Every task is scheduled as a coroutine up front; the executor-wide
+        concurrency bound limits how many are dispatched at once, so large
+        batches cost one coroutine per task rather than one thread.
+        """
+        return [
+            result
+            async for _, result in self._iter_batch_execute(agents, ordered=True, window=len(agents))
+        ]
+
+    def iter_batch_execute(self, agents: Iterable[AgentTask], ordered: bool = False,
+                           window: int = None) -> Iterator[Tuple[AgentTask, TaskResult]]:
+        """
+        Execute agents concurrently, yielding results as they finish
+
+        Args:
+            agents: Iterable of AgentTask objects; consumed lazily
+            ordered: Yield in input order instead of completion order
+            window: Maximum tasks scheduled or buffered at once
+                (uses stream_window from config if None)
 
-            for future in as_completed(future_to_task):
-                task = future_to_task[future]
+        Yields:
+            (AgentTask, TaskResult) pairs
+        """
+        loop = self._ensure_loop()
+        stream = self._iter_batch_execute(agents, ordered, window)
+        try:
+            while True:
                 try:
-                    result = future.result(timeout=task.timeout)
-                    results.append(result)
-                except Exception as e:
-                    results.append(TaskResult(
-                        success=False,
-                        output=None,
-                        execution_time=0,
-                        tokens_used=0,
-                        error=str(e),
-                        agent_name=task.agent_name
-                    ))
+                    yield self._run_sync(stream.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            # Cancels anything still in flight if the consumer stops early
+            asyncio.run_coroutine_threadsafe(stream.aclose(), loop).result()
+
+    async def _iter_batch_execute(self, agents: Iterable[AgentTask], ordered: bool = False,
+                                  window: int = None) -> AsyncIterator[Tuple[AgentTask, TaskResult]]:
+        """
+        Stream batch results from the running event loop
+
+        At most `window` tasks are scheduled or held in the reorder buffer
+        at any time and the input iterable is pulled only as slots free up,
+        so memory stays flat however large the batch is. When scheduling is
+        enabled, up to `window` further tasks are read ahead and started in
+        TaskScheduler order rather than input order.
+        """
+        window = max(1, window or self._get_stream_window())
+        source = enumerate(agents)
+        scheduler = self.create_scheduler()
+        completed = asyncio.Queue()
+        pending = {}
+        reorder_buffer = {}
+        next_to_yield = 0
+
+        def next_task():
+            if scheduler is None:
+                return next(source, None)
+            while len(scheduler) < window:
+                entry = next(source, None)
+                if entry is None:
+                    break
+                scheduler.push(entry[1], entry)
+            return scheduler.pop() if len(scheduler) else None
+
+        try:
+            while True:
+                # Top up the window; always keep one task running so a
+                # reorder buffer full of later results cannot stall progress
+                while len(pending) + len(reorder_buffer) < window or not pending:
+                    entry = next_task()
+                    if entry is None:
+                        break
+                    index, task = entry
+                    future = asyncio.ensure_future(self._execute_task_safe(task))
+                    future.add_done_callback(completed.put_nowait)
+                    pending[future] = (index, task)
+
+                if not pending:
+                    return
+
+                future = await completed.get()
+                index, task = pending.pop(future)
+
+                if not ordered:
+                    yield task, future.result()
+                    continue
+
+                reorder_buffer[index] = (task, future.result())
+                while next_to_yield in reorder_buffer:
+                    yield reorder_buffer.pop(next_to_yield)
+                    next_to_yield += 1
+        finally:
+            for future in pending:
+                future.cancel()
+            # Wait for the cancellations to land so no execution outlives
+            # the stream holding a slot, a lease or a budget reservation
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _execute_task_safe(self, task: AgentTask) -> TaskResult:
+        """Execute an AgentTask, converting unexpected exceptions to a failed result"""
+        try:
+            return await self._execute_agent(
+                task.agent_name, task.agent_spec, task.input_data, task.timeout, serialized=task.serialized()
+            )
+        except Exception as e:
+            return TaskResult(
+                success=False,
+                output=None,
+                execution_time=0,
+                tokens_used=0,
+                error=str(e),
+                agent_name=task.agent_name
+            )
+
+    def _get_stream_window(self) -> int:
+        """Default number of tasks kept in flight by streaming batches"""
+        if self.config.get("stream_window"):
+            return self.config["stream_window"]
+
+        concurrency = self.config["max_parallel_tasks"]
+        if self.concurrency_limiter is not None:
+            concurrency = max(concurrency, self.concurrency_limiter.maximum)
+        return 4 * concurrency
+
+    def execute_agent_batch(self, agent_name: str, agent_spec: str, inputs: List[Dict],
+                            timeout: float = None) -> List[TaskResult]:
+        """
+        Execute one agent on several inputs, packing them into shared prompts
+
+        Args:
+            agent_name: Name of the agent to execute
+            agent_spec: Agent specification/prompt
+            inputs: Input data for each execution
+            timeout: Seconds before each batched call is cancelled
+
+        Returns:
+            List of TaskResult objects, in the same order as inputs
+        """
+        return self._run_sync(self._execute_agent_batch(agent_name, agent_spec, inputs, timeout))
+
+    async def _execute_agent_batch(self, agent_name: str, agent_spec: str, inputs: List[Dict],
+                                   timeout: float = None) -> List[TaskResult]:
+        """
+        Batched execution on the running event loop
+
+        Cached inputs are answered from the cache. The rest are sent in
+        chunks of up to prompt_batching.max_batch_size, so the spec is sent
+        once per chunk instead of once per input. Each chunk's keyed JSON
+        array is split back into per-input results, and each result is
+        cached under its single-input key. Inputs whose entry is missing or
+        malformed, or whose chunk failed, are re-run as single calls. Under
+        a model cascade every input runs on its own, since inputs may settle
+        on different tiers.
+        """
+        batching = self.config.get("prompt_batching") or {}
+        max_batch_size = max(1, batching.get("max_batch_size", 10))
+        if (self.config.get("cascade") or {}).get("enabled", False):
+            max_batch_size = 1
+
+        model = self.model_selector.get_model_for_agent(agent_name)
+        results = [None] * len(inputs)
+        pending = []
+
+        for index, input_data in enumerate(inputs):
+            if self.config["cache_results"] and max_batch_size > 1 and not self._recording():
+                cached = await self._lookup_cache(self._get_cache_key(agent_name, input_data, agent_spec, model))
+                if cached is not None:
+                    self.stats["total_executions"] += 1
+                    self.stats["cache_hits"] += 1
+                    results[index] = cached
+                    continue
+            pending.append(index)
+
+        if max_batch_size > 1 and len(pending) > 1:
+            chunks = [pending[i:i + max_batch_size] for i in range(0, len(pending), max_batch_size)]
+            chunk_results = await asyncio.gather(*(
+                self._run_prompt_batch(agent_name, agent_spec, [inputs[i] for i in chunk], timeout, model)
+                for chunk in chunks
+            ))
+            for chunk, batch_results in zip(chunks, chunk_results):
+                for index, result in zip(chunk, batch_results):
+                    results[index] = result
+
+        fallbacks = [index for index in pending if results[index] is None]
+        if max_batch_size > 1:
+            self.stats["batch_fallbacks"] += len(fallbacks)
+        singles = await asyncio.gather(*(
+            self._execute_agent(agent_name, agent_spec, inputs[index], timeout) for index in fallbacks
+        ))
+        for index, result in zip(fallbacks, singles):
+            results[index] = result
 
         return results
 
-    def _get_cache_key(self, agent_name: str, input_data: Dict) -> str:
-        """Generate cache key for agent execution"""
+    async def _run_prompt_batch(self, agent_name: str, agent_spec: str, inputs: List[Dict],
+                                timeout: float = None, model: str = None) -> List[Optional[TaskResult]]:
+        """
+        Run one multi-input call and split its output
+
+        Returns:
+            One TaskResult per input, or None where the entry must fall back
+            to a single call
+        """
+        keys = [f"input-{index}" for index in range(len(inputs))]
+        batch_input = {BATCH_INPUTS_KEY: dict(zip(keys, inputs))}
+
+        self.stats["total_executions"] += 1
+        self.stats["batched_calls"] += 1
+        result = await self._run_execution(
+            None, agent_name, agent_spec, batch_input, time.time(), timeout, model, batch_size=len(inputs)
+        )
+        if not result.success:
+            return [None] * len(inputs)
+
+        outputs = self._split_batch_output(result.output, keys)
+        # Each input's share of the batched call's usage
+        prompt_shares = self._split_tokens(result.prompt_tokens, len(inputs))
+        completion_shares = self._split_tokens(result.completion_tokens, len(inputs))
+        split_results = []
+
+        for key, input_data, prompt_share, completion_share in zip(
+            keys, inputs, prompt_shares, completion_shares
+        ):
+            if key not in outputs:
+                split_results.append(None)
+                continue
+
+            entry = TaskResult(
+                success=True,
+                output=outputs[key],
+                execution_time=result.execution_time,
+                tokens_used=prompt_share + completion_share,
+                agent_name=agent_name,
+                model=result.model,
+                prompt_tokens=prompt_share,
+                completion_tokens=completion_share,
+                degraded=result.degraded
+            )
+            self.stats["batched_inputs"] += 1
+            if self.config["cache_results"] and not result.degraded:
+                await self._store_cache(self._get_cache_key(agent_name, input_data, agent_spec, model), entry)
+            split_results.append(entry)
+
+        return split_results
+
+    def _split_tokens(self, tokens: int, parts: int) -> List[int]:
+        """Even shares of a token count; the last share takes the remainder"""
+        share, remainder = divmod(tokens, parts)
+        return [share] * (parts - 1) + [share + remainder]
+
+    def _split_batch_output(self, output: Any, keys: List[str]) -> Dict[str, Any]:
+        """
+        Map keys to outputs from a batched response
+
+        Accepts the keyed array asked for in the prompt (as a list or JSON
+        text). Entries that are not objects, carry an unknown key or lack an
+        object output are dropped.
+        """
+        if isinstance(output, str):
+            try:
+                output = json.loads(output)
+            except ValueError:
+                return {}
+        if not isinstance(output, list):
+            return {}
+
+        wanted = set(keys)
+        outputs = {}
+        for entry in output:
+            if not isinstance(entry, dict):
+                continue
+            key = entry.get("key")
+            if key in wanted and key not in outputs and isinstance(entry.get("output"), dict):
+                outputs[key] = entry["output"]
+        return outputs
+
+    async def _lookup_cache(self, cache_key: str) -> Optional[TaskResult]:
+        """Look up a result in the memory tier, then the disk tier"""
+        if cache_key in self.execution_cache:
+            return self.execution_cache[cache_key]
+
+        if self.result_cache is None:
+            return None
+
+        data = await asyncio.to_thread(self.result_cache.get, cache_key)
+        if data is None:
+            return None
+
+        result = task_result_from_dict(data)
+        self.execution_cache[cache_key] = result
+        return result
+
+    async def _store_cache(self, cache_key: str, result: TaskResult):
+        """Store a successful result in the memory tier and on disk"""
+        self.execution_cache[cache_key] = result
+
+        if self.result_cache is not None:
+            try:
+                await asyncio.to_thread(self.result_cache.put, cache_key, asdict(result))
+            except (OSError, TypeError, ValueError) as e:
+                if self.config["verbose"]:
+                    print(f"  ⚠ Could not persist cached result: {e}")
+
+    def _get_cache_key(self, agent_name: str, input_data: Dict, agent_spec: str = "",
+                       model: str = None) -> str:
+        """
+        Generate cache key for agent execution
+
+        The key covers the spec content and the model tier as well as the
+        input, so editing one agent's spec only invalidates that agent's
+        entries.
+        """
         import hashlib
-        data_str = f"{agent_name}:{json.dumps(input_data, sort_keys=True)}"
+        model = model or self.model_selector.get_model_for_agent(agent_name)
+        data_str = (
+            f"{agent_name}:{model}:{self._get_spec_hash(agent_spec)}:"
+            f"{self.serializer.serialize(input_data).canonical}"
+        )
         return hashlib.md5(data_str.encode()).hexdigest()
 
+    def _get_spec_hash(self, agent_spec: str) -> str:
+        """Return the memoised content hash of an agent spec"""
+        spec_hash = self._spec_hashes.get(agent_spec)
+        if spec_hash is None:
+            spec_hash = compute_spec_hash(agent_spec)
+            self._spec_hashes[agent_spec] = spec_hash
+        return spec_hash
+
     def retry_on_failure(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
         """Execute with retry logic on failure"""
-        last_error = None
+        return self._run_sync(self._retry_on_failure(agent_name, agent_spec, input_data))
+
+    async def _retry_on_failure(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
+        """
+        Retry loop running on the event loop
 
-        for attempt in range(self.config["retry_attempts"]):
-            if self.config["verbose"] and attempt > 0:
-                print(f"  ↻ Retry attempt {attempt + 1} for {agent_name}")
+        Retries throttled, timed-out and failed executions with exponential
+        backoff and jitter from retry_policy. Stops early when a circuit
+        breaker rejects the call or the wait would overrun the run budget.
+        """
+        policy = self.retry_policy
+        attempts = 0
+        last_error = None
 
-            result = self.execute_agent(agent_name, agent_spec, input_data)
+        for retry in range(policy.max_attempts):
+            attempts += 1
+            result = await self._execute_agent(agent_name, agent_spec, input_data)
 
             if result.success:
                 return result
 
             last_error = result.error
-            time.sleep(1)  # Brief delay between retries
+            if not policy.should_retry(self._classify_outcome(result), retry):
+                break
+
+            delay = policy.delay(retry)
+            if self._run_deadline is not None and time.monotonic() + delay >= self._run_deadline:
+                break
+
+            if self.config["verbose"]:
+                print(f"  ↻ Retry attempt {attempts + 1} for {agent_name} in {delay:.2f}s")
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay)
 
         # All retries failed
         return TaskResult(
@@ -349,7 +1767,7 @@ class ClaudeTaskExecutor:
             output=None,
             execution_time=0,
             tokens_used=0,
-            error=f"Failed after {self.config['retry_attempts']} attempts. Last error: {last_error}",
+            error=f"Failed after {attempts} attempts. Last error: {last_error}",
             agent_name=agent_name
         )
 
@@ -364,12 +1782,127 @@ class ClaudeTaskExecutor:
                 self.stats["total_time"] / max(1, self.stats["total_executions"])
             ),
             "cache_size": len(self.execution_cache),
+            "disk_cache": self.result_cache.get_statistics() if self.result_cache else None,
+            "rate_limits": self.rate_limiter.get_statistics() if self.rate_limiter else {},
+            "token_usage": self.token_ledger.get_statistics(),
+            "prompt_prefix": self.prompt_builder.get_statistics(),
+            "serialization": self.serializer.get_statistics(),
+            "cassette": self.cassette.get_statistics() if self.cassette else None,
+            "transport": self.transport.get_statistics() if self.config.get("backend_url") else None,
+            "cost": self.get_cost_report(),
+            "adaptive_concurrency": (
+                self.concurrency_limiter.get_statistics() if self.concurrency_limiter else None
+            ),
+            "circuit_breakers": (
+                self.circuit_breakers.get_statistics() if self.circuit_breakers else None
+            ),
+            "cascade": {
+                agent: {
+                    **agent_stats,
+                    "escalation_rate": agent_stats["escalated"] / max(1, agent_stats["executions"])
+                }
+                for agent, agent_stats in self.cascade_stats.items()
+            },
             "history_size": len(self.task_history)
         }
 
-    def clear_cache(self):
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the dispatch semaphore for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.config["max_parallel_tasks"])
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop used by the blocking API"""
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="task-executor-loop",
+                    daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
+
+    def _ensure_transport(self) -> Transport:
+        """The HTTP transport, rebuilt if close() shut the previous one down"""
+        with self._loop_lock:
+            if self.transport.closed:
+                self.transport = create_transport(self.config)
+            return self.transport
+
+    def _run_sync(self, coro):
+        """Run a coroutine on the background loop and block for its result"""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._loop_thread:
+            coro.close()
+            raise RuntimeError("Blocking executor API called from its own event loop; use AsyncClaudeTaskExecutor")
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self):
+        """
+        Stop the background event loop, if one was started, close pooled
+        connections and compact the cassette
+
+        The executor stays usable: the next execution starts a fresh loop
+        and transport.
+        """
+        self.transport.close()
+        if self.cassette is not None:
+            self.cassette.compact()
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def clear_cache(self, include_disk: bool = True):
         """Clear execution cache"""
         self.execution_cache.clear()
+        if include_disk and self.result_cache is not None:
+            self.result_cache.clear()
+
+    def invalidate_agent(self, agent_name: str, spec_hash: Optional[str] = None) -> int:
+        """
+        Drop everything derived from an agent's current spec
+
+        Removes the agent's in-memory cached results and memoised prompt
+        prefixes, and forgets the memoised hash of the spec with spec_hash
+        (or every spec of the agent's prefixes when None). Disk cache keys
+        include the spec hash, so entries for the old spec are simply never
+        looked up again and age out with the TTL.
+
+        Returns:
+            Number of cached results dropped
+        """
+        stale_keys = [
+            key for key, result in list(self.execution_cache.items())
+            if result.agent_name == agent_name
+        ]
+        for key in stale_keys:
+            self.execution_cache.pop(key, None)
+
+        self.prompt_builder.invalidate(agent_name)
+        for spec, known_hash in list(self._spec_hashes.items()):
+            if spec_hash is None or known_hash == spec_hash:
+                self._spec_hashes.pop(spec, None)
+
+        return len(stale_keys)
+
+    def on_spec_change(self, event):
+        """AgentSpecLoader subscriber: invalidate an agent whose spec changed"""
+        dropped = self.invalidate_agent(event.agent_name, event.old_hash)
+        if self.config["verbose"]:
+            print(f"  ⟳ Spec {event.kind} for {event.agent_name}; dropped {dropped} cached results")
 
     def reset_statistics(self):
         """Reset execution statistics"""
@@ -377,21 +1910,123 @@ class ClaudeTaskExecutor:
             "total_executions": 0,
             "successful_executions": 0,
             "failed_executions": 0,
+            "timed_out_executions": 0,
+            "cancelled_executions": 0,
+            "retries": 0,
+            "circuit_rejections": 0,
+            "token_limit_rejections": 0,
+            "token_limit_violations": 0,
+            "budget_rejections": 0,
+            "budget_degraded": 0,
+            "cassette_recorded": 0,
+            "cassette_replayed": 0,
+            "cassette_misses": 0,
+            "batched_calls": 0,
+            "batched_inputs": 0,
+            "batch_fallbacks": 0,
+            "hedges_fired": 0,
+            "hedges_won": 0,
+            "hedge_tokens_wasted": 0,
+            "cache_hits": 0,
+            "coalesced_executions": 0,
             "total_tokens": 0,
-            "total_time": 0
+            "total_time": 0,
+            "current_concurrency": self._in_flight,
+            "peak_concurrency": self._in_flight,
+            "concurrency_limit": self.stats["concurrency_limit"],
+            "peak_concurrency_limit": self.stats["concurrency_limit"]
         }
         self.task_history.clear()
+        self.agent_latencies.clear()
+        self.cascade_stats.clear()
+        self.token_ledger.reset()
+        if self.budget is not None:
+            self.budget.reset()
+
+        # A reset starts a new run with a fresh time budget
+        self._run_deadline = None
+        self._cancel_requested = False
+
+
+class AsyncClaudeTaskExecutor(ClaudeTaskExecutor):
+    """
+    Asyncio-native Task executor
+
+    Shares configuration, cache and statistics handling with
+    ClaudeTaskExecutor but exposes the engine as coroutines, so thousands of
+    agent calls can be in flight on one event loop without a thread each.
+    In-flight dispatches are bounded by max_parallel_tasks.
+    """
+
+    async def execute_agent(self, agent_name: str, agent_spec: str, input_data: Dict,
+                            timeout: float = None) -> TaskResult:
+        """Execute agent via Claude Task tool"""
+        return await self._execute_agent(agent_name, agent_spec, input_data, timeout)
+
+    async def batch_execute(self, agents: List[AgentTask], parallel: bool = None) -> List[TaskResult]:
+        """Execute multiple agents, returning results in task order"""
+        return await self._batch_execute(agents, parallel)
+
+    async def execute_agent_batch(self, agent_name: str, agent_spec: str, inputs: List[Dict],
+                                  timeout: float = None) -> List[TaskResult]:
+        """Execute one agent on several inputs, packing them into shared prompts"""
+        return await self._execute_agent_batch(agent_name, agent_spec, inputs, timeout)
+
+    async def retry_on_failure(self, agent_name: str, agent_spec: str, input_data: Dict) -> TaskResult:
+        """Execute with retry logic on failure"""
+        return await self._retry_on_failure(agent_name, agent_spec, input_data)
+
+    def iter_batch_execute(self, agents: Iterable[AgentTask], ordered: bool = False,
+                           window: int = None) -> AsyncIterator[Tuple[AgentTask, TaskResult]]:
+        """Execute agents concurrently, yielding (task, result) pairs as they finish"""
+        return self._iter_batch_execute(agents, ordered, window)
 
 
 # Utility functions
-def create_agent_task(agent_name: str, spec_content: str, test_input: Dict) -> AgentTask:
+def load_task_config(config_path: str = None) -> Dict:
+    """
+    Load executor configuration from task_integration.json
+
+    Args:
+        config_path: Optional path to the config file
+
+    Returns:
+        The task_integration block merged with the top-level
+        cache_configuration and batch_execution sections
+    """
+    path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Warning: could not load task config from {path}: {e}")
+        return {}
+
+    config = dict(data.get("task_integration", {}))
+    for section in ("cache_configuration", "batch_execution"):
+        if section in data:
+            config[section] = data[section]
+
+    return config
+
+
+def task_result_from_dict(data: Dict) -> TaskResult:
+    """Rebuild a TaskResult from its serialized form, ignoring unknown fields"""
+    known = TaskResult.__dataclass_fields__
+    return TaskResult(**{k: v for k, v in data.items() if k in known})
+
+
+def create_agent_task(agent_name: str, spec_content: str, test_input: Dict,
+                      priority: Optional[int] = None) -> AgentTask:
     """Create an AgentTask object"""
     return AgentTask(
         agent_name=agent_name,
         agent_spec=spec_content,
         input_data=test_input,
         subagent_type="general-purpose",
-        timeout=30
+        timeout=30,
+        priority=priority
     )
 
 
@@ -5,6 +5,7 @@ Automated testing orchestration for the 41-agent pipeline
 """
 
 import json
+import math
 import time
 import asyncio
 from typing import Dict, List, Any, Optional, Tuple
@@ -17,6 +18,7 @@ import sys
 # Import local modules
 from test_runner import SubAgentTestRunner, TestResult
 from validator import SchemaValidator, OutputValidator, PipelineValidator, PerformanceValidator
+from scheduler import CRITICAL_AGENTS, TaskScheduler
 
 @dataclass
 class TestConfig:
@@ -60,6 +62,9 @@ class TestOrchestrator:
         # Agent registry (all 41 agents)
         self.all_agents = self._load_agent_registry()
 
+        # Start critical and slow (opus-tier) agents first in parallel phases
+        self.scheduler = self._create_scheduler()
+
     def _load_agent_registry(self) -> Dict[str, List[str]]:
         """Load complete agent registry by phase"""
         return {
@@ -74,6 +79,23 @@ class TestOrchestrator:
             "performance": ["metrics-collector", "trend-spotter", "improvement-advisor"]
         }
 
+    def _create_scheduler(self) -> Optional[TaskScheduler]:
+        """Share the executor's scheduling policy, if Task integration is active"""
+        executor = self.test_runner.task_executor
+        if executor is not None:
+            return executor.create_scheduler()
+        return None
+
+    def close(self):
+        """Release the test runner's executor resources"""
+        self.test_runner.close()
+
+    def __enter__(self) -> "TestOrchestrator":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def run_all_tests(self) -> Dict:
         """
         Run comprehensive tests on all 41 agents
@@ -82,6 +104,7 @@ class TestOrchestrator:
             Comprehensive test report
         """
         self.test_statistics["start_time"] = datetime.now()
+        self.test_runner.start_run()
 
         if self.config.verbose:
             print("\n" + "="*70)
@@ -94,8 +117,15 @@ class TestOrchestrator:
 
         results = {}
 
+        executor = self.test_runner.task_executor
+
         # Test each phase
         for phase, agents in self.all_agents.items():
+            if executor and executor.budget_exhausted():
+                if self.config.verbose:
+                    print(f"\n$ Cost budget exhausted, skipping remaining phases from {phase}")
+                break
+
             if self.config.verbose:
                 print(f"\n▶ Testing Phase: {phase.upper()} ({len(agents)} agents)")
                 print("-"*50)
@@ -106,7 +136,7 @@ class TestOrchestrator:
 
             # Update statistics
             for agent_result in phase_results.values():
-                if agent_result.get("status") == "failed":
+                if agent_result.get("status") in ("failed", "timeout"):
                     self.test_statistics["failed_agents"].append(agent_result.get("agent"))
 
         self.test_statistics["end_time"] = datetime.now()
@@ -128,35 +158,78 @@ class TestOrchestrator:
         phase_results = {}
 
         if self.config.parallel_execution and len(agents) > 1:
+            if self.scheduler:
+                agents = self.scheduler.order_agents(agents)
+
             # Parallel execution
-            with ThreadPoolExecutor(max_workers=min(self.config.max_workers, len(agents))) as executor:
-                future_to_agent = {
-                    executor.submit(self._test_single_agent, agent): agent
-                    for agent in agents
-                }
-
-                for future in as_completed(future_to_agent):
-                    agent = future_to_agent[future]
-                    try:
-                        result = future.result(timeout=self.config.timeout_per_agent)
-                        phase_results[agent] = result
-                    except Exception as e:
-                        phase_results[agent] = {
-                            "agent": agent,
-                            "status": "error",
-                            "error": str(e)
-                        }
-                        if self.config.verbose:
-                            print(f"  ✗ {agent}: ERROR - {e}")
+            phase_results = self._test_agents_parallel(agents)
         else:
             # Sequential execution
             for agent in agents:
-                phase_results[agent] = self._test_single_agent(agent)
+                phase_results[agent] = self._test_single_agent(
+                    agent, time.monotonic() + self.config.timeout_per_agent
+                )
 
         return phase_results
 
-    def _test_single_agent(self, agent_name: str) -> Dict:
-        """Test a single agent with all fixtures"""
+    def _test_agents_parallel(self, agents: List[str]) -> Dict:
+        """
+        Test agents on a thread pool, enforcing timeout_per_agent
+
+        Each agent's clock starts when a worker picks it up, not when it is
+        queued, and every executor call it makes is given what is left of
+        its clock as the call timeout. The executor cancels calls at their
+        deadline on its event loop, which frees their slots, so workers are
+        never stuck behind a hung call. The phase as a whole gets one
+        timeout per wave of workers; agents still queued when that runs out
+        are reported as timed out without being started.
+        """
+        results = {}
+        timeout = self.config.timeout_per_agent
+        workers = min(self.config.max_workers, len(agents))
+        phase_deadline = time.monotonic() + timeout * math.ceil(len(agents) / workers)
+
+        def run(agent: str) -> Dict:
+            started = time.monotonic()
+            if started >= phase_deadline:
+                return self._timeout_report(agent, "Phase time budget exhausted before the agent started")
+            return self._test_single_agent(agent, min(started + timeout, phase_deadline))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_agent = {executor.submit(run, agent): agent for agent in agents}
+            for future in as_completed(future_to_agent):
+                agent = future_to_agent[future]
+                try:
+                    results[agent] = future.result()
+                except Exception as e:
+                    results[agent] = {
+                        "agent": agent,
+                        "status": "error",
+                        "error": str(e)
+                    }
+                    if self.config.verbose:
+                        print(f"  ✗ {agent}: ERROR - {e}")
+
+        return results
+
+    def _timeout_report(self, agent_name: str, error: str) -> Dict:
+        """Report for an agent that ran out of time"""
+        if self.config.verbose:
+            print(f"  ✗ {agent_name}: TIMEOUT - {error}")
+        return {
+            "agent": agent_name,
+            "status": "timeout",
+            "error": error
+        }
+
+    def _test_single_agent(self, agent_name: str, deadline: float = None) -> Dict:
+        """
+        Test a single agent with all fixtures
+
+        Args:
+            agent_name: Agent to test
+            deadline: time.monotonic() its tests and retries must finish by
+        """
         agent_report = {
             "agent": agent_name,
             "status": "pending",
@@ -171,7 +244,7 @@ class TestOrchestrator:
 
         try:
             # Run tests using test runner
-            test_results = self.test_runner.test_individual_agent(agent_name)
+            test_results = self.test_runner.test_individual_agent(agent_name, deadline=deadline)
 
             # Process results
             for result in test_results:
@@ -182,9 +255,9 @@ class TestOrchestrator:
                 else:
                     agent_report["tests_failed"] += 1
 
-                    # Retry if configured
-                    if self.config.retry_on_failure:
-                        retry_result = self._retry_test(agent_name, result)
+                    # Retry if configured; a timed-out test has no time left
+                    if self.config.retry_on_failure and result.status != "timeout":
+                        retry_result = self._retry_test(agent_name, result, deadline)
                         if retry_result and retry_result.status == "pass":
                             agent_report["tests_passed"] += 1
                             agent_report["tests_failed"] -= 1
@@ -209,7 +282,12 @@ class TestOrchestrator:
             self.test_statistics["total_tests_run"] += agent_report["tests_run"]
 
             # Determine overall status
-            if agent_report["tests_failed"] == 0:
+            timed_out = [result for result in test_results if result.status == "timeout"]
+            if timed_out:
+                agent_report["status"] = "timeout"
+                agent_report["error"] = timed_out[0].error_message
+                status_symbol = "✗"
+            elif agent_report["tests_failed"] == 0:
                 agent_report["status"] = "passed"
                 status_symbol = "✓"
             else:
@@ -238,8 +316,9 @@ class TestOrchestrator:
 
         return agent_report
 
-    def _retry_test(self, agent_name: str, failed_result: TestResult) -> Optional[TestResult]:
-        """Retry a failed test"""
+    def _retry_test(self, agent_name: str, failed_result: TestResult,
+                    deadline: float = None) -> Optional[TestResult]:
+        """Retry a failed test within the agent's deadline"""
         for attempt in range(self.config.max_retries):
             if self.config.verbose:
                 print(f"    ↻ Retrying {agent_name}:{failed_result.test_name} (attempt {attempt + 1})")
@@ -247,11 +326,14 @@ class TestOrchestrator:
             # Re-run the specific test
             retry_results = self.test_runner.test_individual_agent(
                 agent_name,
-                failed_result.test_name
+                failed_result.test_name,
+                deadline=deadline
             )
 
             if retry_results and retry_results[0].status == "pass":
                 return retry_results[0]
+            if retry_results and retry_results[0].status == "timeout":
+                break
 
         return None
 
@@ -285,6 +367,7 @@ class TestOrchestrator:
         }
 
         # Run workflow test
+        self.test_runner.start_run()
         test_results = self.test_runner.test_full_pipeline(workflow_type)
 
         # Validate pipeline flow
@@ -294,9 +377,16 @@ class TestOrchestrator:
         workflow_report["pipeline_validation"] = pipeline_report
 
         # Validate performance
+        agent_tokens = {}
+        for r in test_results:
+            agent_tokens.setdefault(r.agent_name, []).append(r.tokens_used)
+
         performance_metrics = {
             "execution_time": sum(r.execution_time for r in test_results),
             "total_tokens": sum(r.tokens_used for r in test_results),
+            "tokens_per_agent": {
+                agent: sum(tokens) / len(tokens) for agent, tokens in agent_tokens.items()
+            },
             "success_rate": len([r for r in test_results if r.status == "pass"]) / max(1, len(test_results))
         }
 
@@ -315,18 +405,14 @@ class TestOrchestrator:
 
     def run_regression_suite(self) -> Dict:
         """Run regression tests on critical agents"""
-        critical_agents = [
-            "spec-writer",
-            "body-writer",
-            "grammar-checker",
-            "content-atomizer"
-        ]
+        critical_agents = list(CRITICAL_AGENTS)
 
         if self.config.verbose:
             print("\n▶ Running Regression Suite")
             print(f"  Testing {len(critical_agents)} critical agents")
 
         regression_results = {}
+        self.test_runner.start_run()
 
         for agent in critical_agents:
             result = self._test_single_agent(agent)
@@ -348,6 +434,7 @@ class TestOrchestrator:
 
         # Benchmark each agent
         sample_agents = ["keyword-researcher", "body-writer", "grammar-checker"]
+        self.test_runner.start_run()
 
         for agent in sample_agents:
             start = time.time()
@@ -407,6 +494,14 @@ class TestOrchestrator:
                 "phases_completed": self.test_statistics["phases_completed"]
             },
             "phase_results": results,
+            "token_usage": (
+                self.test_runner.task_executor.token_ledger.get_statistics()
+                if self.test_runner.task_executor else None
+            ),
+            "cost": (
+                self.test_runner.task_executor.get_cost_report()
+                if self.test_runner.task_executor else None
+            ),
             "failed_agents": self.test_statistics["failed_agents"],
             "execution_log": self.execution_log[-100:],  # Last 100 entries
             "recommendations": self._generate_recommendations(results)
@@ -422,7 +517,7 @@ class TestOrchestrator:
         failing_agents = []
         for phase_results in results.values():
             for agent, result in phase_results.items():
-                if result.get("status") == "failed":
+                if result.get("status") in ("failed", "timeout"):
                     failing_agents.append(agent)
 
         if failing_agents:
@@ -476,6 +571,14 @@ class TestOrchestrator:
         print(f"Success Rate: {summary['success_rate']:.1f}%")
         print(f"Execution Time: {report['test_run']['execution_time']:.2f}s")
 
+        cost = report.get("cost")
+        if cost:
+            print(f"Estimated Cost: ${cost['estimated_cost']['total']:.4f}")
+            budget = cost["budget"]
+            if budget and budget["max_cost"] is not None:
+                print(f"Budget Spent: ${budget['spent']:.4f} of ${budget['max_cost']:.2f}"
+                      f" ({budget['refused_calls']} calls over budget)")
+
         if report["failed_agents"]:
             print("\n⚠ Failed Agents:")
             for agent in report["failed_agents"][:10]:
@@ -500,6 +603,9 @@ def main():
     parser.add_argument("--workflow", help="Test specific workflow")
     parser.add_argument("--regression", action="store_true", help="Run regression suite")
     parser.add_argument("--benchmark", action="store_true", help="Run performance benchmarks")
+    parser.add_argument("--cassette", choices=["record", "replay"],
+                       help="Record agent responses to, or replay them from, the execution cassette")
+    parser.add_argument("--cassette-path", help="Cassette file (defaults to cassette.path in the task config)")
 
     args = parser.parse_args()
 
@@ -511,22 +617,28 @@ def main():
         save_reports=True
     )
 
-    orchestrator = TestOrchestrator(config)
-
-    # Run appropriate tests
-    if args.regression:
-        print("Running regression suite...")
-        orchestrator.run_regression_suite()
-    elif args.benchmark:
-        print("Running performance benchmarks...")
-        report = orchestrator.benchmark_performance()
-        print(json.dumps(report, indent=2, default=str))
-    elif args.workflow:
-        print(f"Testing workflow: {args.workflow}")
-        orchestrator.test_workflow(args.workflow)
-    else:
-        # Run comprehensive tests
-        orchestrator.run_all_tests()
+    with TestOrchestrator(config) as orchestrator:
+        if args.cassette:
+            executor = orchestrator.test_runner.task_executor
+            if executor is None:
+                print("Warning: cassette mode needs Task integration; running without it")
+            else:
+                executor.use_cassette(args.cassette, args.cassette_path)
+
+        # Run appropriate tests
+        if args.regression:
+            print("Running regression suite...")
+            orchestrator.run_regression_suite()
+        elif args.benchmark:
+            print("Running performance benchmarks...")
+            report = orchestrator.benchmark_performance()
+            print(json.dumps(report, indent=2, default=str))
+        elif args.workflow:
+            print(f"Testing workflow: {args.workflow}")
+            orchestrator.test_workflow(args.workflow)
+        else:
+            # Run comprehensive tests
+            orchestrator.run_all_tests()
 
 
 if __name__ == "__main__":
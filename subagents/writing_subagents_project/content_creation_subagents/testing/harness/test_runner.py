@@ -14,19 +14,34 @@ from pathlib import Path
 
 # Import Task executor and agent loader
 try:
-    from task_executor import ClaudeTaskExecutor, TaskResult as TaskExecResult
-    from agent_spec_loader import AgentSpecLoader, ModelSelector
+    from task_executor import ClaudeTaskExecutor, TaskResult as TaskExecResult, load_task_config
+    from agent_spec_loader import AgentSpecLoader
+    from spec_watcher import SpecWatcher
+    from token_accounting import TokenCounter
     TASK_INTEGRATION_AVAILABLE = True
 except ImportError:
     TASK_INTEGRATION_AVAILABLE = False
     print("Warning: Task integration modules not available, using mock execution")
 
+# Agents in each pipeline phase
+PHASE_AGENTS = {
+    "research": ["topic-scout", "source-gatherer", "competitor-analyzer", "fact-verifier", "keyword-researcher"],
+    "strategy": ["content-planner", "angle-definer", "audience-profiler", "spec-writer", "template-selector"],
+    "content": ["outline-builder", "intro-writer", "body-writer", "conclusion-writer", "quote-integrator"],
+    "technical": ["code-example-writer", "api-documenter", "command-demonstrator", "error-handler"],
+    "tutorial": ["step-sequencer", "exercise-designer", "solution-provider", "concept-explainer"],
+    "qa": ["grammar-checker", "style-editor", "flow-optimizer", "readability-scorer", "link-validator"],
+    "visual": ["ai-prompt-engineer", "chart-designer", "infographic-planner", "thumbnail-creator", "diagram-sketcher"],
+    "distribution": ["content-atomizer", "twitter-formatter", "linkedin-adapter", "instagram-packager", "newsletter-curator"],
+    "performance": ["metrics-collector", "trend-spotter", "improvement-advisor"]
+}
+
 @dataclass
 class TestResult:
     """Store test execution results"""
     agent_name: str
     test_name: str
-    status: str  # 'pass', 'fail', 'error'
+    status: str  # 'pass', 'fail', 'error', 'timeout'
     execution_time: float
     tokens_used: int
     input_data: Dict
@@ -69,18 +84,47 @@ class SubAgentTestRunner:
         # Task integration setup
         self.use_task_integration = use_task_integration if use_task_integration is not None else TASK_INTEGRATION_AVAILABLE
         if self.use_task_integration and TASK_INTEGRATION_AVAILABLE:
-            self.task_executor = ClaudeTaskExecutor({
+            executor_config = load_task_config()
+            executor_config.update({
                 "verbose": False,
                 "fallback_to_mock": True,
                 "cache_results": True
             })
+            self.task_executor = ClaudeTaskExecutor(executor_config)
+            self.task_executor.token_ledger.phase_for_agent = self._get_phase_for_agent
+            self.token_counter = self.task_executor.token_counter
             self.spec_loader = AgentSpecLoader()
-            self.model_selector = ModelSelector()
+            self.spec_loader.subscribe(self.task_executor.on_spec_change)
+            self.spec_watcher = SpecWatcher.from_config(self.spec_loader, executor_config)
+            if self.spec_watcher is not None:
+                self.spec_watcher.start()
+            # Share the executor's routing table rather than building another
+            self.model_selector = self.task_executor.model_selector
         else:
             self.task_executor = None
+            self.token_counter = TokenCounter() if TASK_INTEGRATION_AVAILABLE else None
             self.spec_loader = None
+            self.spec_watcher = None
             self.model_selector = None
 
+    def start_run(self):
+        """Start a run, restarting the executor's run-level time budget"""
+        if self.task_executor is not None:
+            self.task_executor.start_run()
+
+    def close(self):
+        """Stop the spec watcher and release the executor's event loop, connections and cassette"""
+        if self.spec_watcher is not None:
+            self.spec_watcher.stop()
+        if self.task_executor is not None:
+            self.task_executor.close()
+
+    def __enter__(self) -> "SubAgentTestRunner":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
     def _load_json(self, path: Path) -> Dict:
         """Load JSON file safely"""
         try:
@@ -93,13 +137,17 @@ class SubAgentTestRunner:
             print(f"Error loading {path}: {e}")
             return {}
 
-    def test_individual_agent(self, agent_name: str, test_case: Optional[str] = None) -> List[TestResult]:
+    def test_individual_agent(self, agent_name: str, test_case: Optional[str] = None,
+                              deadline: Optional[float] = None) -> List[TestResult]:
         """
         Test a single agent with all or specific test fixtures
 
         Args:
             agent_name: Name of the agent to test
             test_case: Optional specific test case name
+            deadline: time.monotonic() by which the agent's tests must
+                finish; each executor call is given what is left of it, and
+                fixtures reached after it report status 'timeout'
 
         Returns:
             List of test results
@@ -117,22 +165,137 @@ class SubAgentTestRunner:
         if test_case:
             agent_fixtures = [f for f in agent_fixtures if f.get("test_name") == test_case]
 
-        # Run each test
-        for fixture in agent_fixtures:
-            result = self._execute_agent_test(agent_name, fixture)
-            results.append(result)
+        # Run each test, packing fixtures into shared prompts when there are enough
+        if self._should_batch_fixtures(agent_fixtures):
+            results = self._execute_agent_tests_batched(agent_name, agent_fixtures, deadline)
+        else:
+            results = [self._execute_agent_test(agent_name, fixture, deadline) for fixture in agent_fixtures]
+
+        for result in results:
             self.test_results.append(result)
             self._update_metrics(result)
 
         return results
 
-    def _execute_agent_test(self, agent_name: str, fixture: Dict) -> TestResult:
+    def _should_batch_fixtures(self, fixtures: List[Dict]) -> bool:
+        """Whether to run an agent's fixtures through batched prompts"""
+        if not (self.use_task_integration and self.task_executor):
+            return False
+
+        batching = self.task_executor.config.get("prompt_batching") or {}
+        return batching.get("enabled", False) and len(fixtures) >= batching.get("min_fixtures", 6)
+
+    def _call_timeout(self, deadline: Optional[float]) -> Optional[float]:
+        """
+        Timeout for one executor call under deadline
+
+        Returns:
+            None without a deadline (the executor's own timeout applies),
+            otherwise what is left of it, at most the executor's timeout
+
+        Raises:
+            TimeoutError: If the deadline has already passed
+        """
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Agent deadline passed before the test started")
+        return min(remaining, self.task_executor.config["timeout_seconds"])
+
+    def _timeout_failure(self, agent_name: str, fixture: Dict, execution_time: float,
+                         error: str) -> TestResult:
+        """Build the TestResult for a fixture that ran out of time"""
+        return TestResult(
+            agent_name=agent_name,
+            test_name=fixture.get("test_name", "unnamed_test"),
+            status="timeout",
+            execution_time=execution_time,
+            tokens_used=0,
+            input_data=fixture.get("input", {}),
+            actual_output=None,
+            expected_output=fixture.get("expected_output", {}),
+            error_message=error
+        )
+
+    def _execute_agent_tests_batched(self, agent_name: str, fixtures: List[Dict],
+                                     deadline: Optional[float] = None) -> List[TestResult]:
+        """
+        Execute an agent's fixtures with multi-input prompts
+
+        Fixtures failing input validation are reported without being sent;
+        the rest go to the executor's execute_agent_batch together.
+
+        Args:
+            agent_name: Name of the agent
+            fixtures: Test fixtures with input and expected output
+            deadline: time.monotonic() the batch must finish by
+
+        Returns:
+            List of TestResult objects, in fixture order
+        """
+        results = [None] * len(fixtures)
+        runnable = []
+
+        for index, fixture in enumerate(fixtures):
+            if self._validate_input(agent_name, fixture.get("input", {})):
+                runnable.append(index)
+            else:
+                results[index] = self._input_validation_failure(agent_name, fixture)
+
+        if runnable:
+            try:
+                timeout = self._call_timeout(deadline)
+            except TimeoutError as e:
+                for index in runnable:
+                    results[index] = self._timeout_failure(agent_name, fixtures[index], 0, str(e))
+                return results
+
+            try:
+                agent_spec = self.spec_loader.load_agent_spec(agent_name)
+                task_results = self.task_executor.execute_agent_batch(
+                    agent_name,
+                    agent_spec,
+                    [fixtures[index].get("input", {}) for index in runnable],
+                    timeout
+                )
+            except Exception as e:
+                print(f"Error in batched Task tool execution for {agent_name}: {e}")
+                task_results = [None] * len(runnable)
+
+            for index, task_result in zip(runnable, task_results):
+                fixture = fixtures[index]
+                input_data = fixture.get("input", {})
+                if task_result is not None and task_result.timed_out:
+                    results[index] = self._timeout_failure(
+                        agent_name, fixture, task_result.execution_time, task_result.error
+                    )
+                    continue
+                if task_result is not None and task_result.success:
+                    actual_output = task_result.output
+                    execution_time = task_result.execution_time
+                    tokens_used = task_result.tokens_used
+                else:
+                    # Fall back to mock on failure
+                    if task_result is not None:
+                        print(f"Task execution failed for {agent_name}, using mock: {task_result.error}")
+                    actual_output = self._simulate_agent_execution(agent_name, input_data)
+                    execution_time = 0
+                    tokens_used = None
+                results[index] = self._evaluate_agent_test(
+                    agent_name, fixture, actual_output, execution_time, tokens_used
+                )
+
+        return results
+
+    def _execute_agent_test(self, agent_name: str, fixture: Dict, deadline: Optional[float] = None) -> TestResult:
         """
         Execute a single test for an agent
 
         Args:
             agent_name: Name of the agent
             fixture: Test fixture with input and expected output
+            deadline: time.monotonic() the test must finish by
 
         Returns:
             TestResult object
@@ -146,52 +309,22 @@ class SubAgentTestRunner:
         try:
             # Validate input against schema
             if not self._validate_input(agent_name, input_data):
-                return TestResult(
-                    agent_name=agent_name,
-                    test_name=test_name,
-                    status="fail",
-                    execution_time=0,
-                    tokens_used=0,
-                    input_data=input_data,
-                    actual_output=None,
-                    expected_output=expected_output,
-                    error_message="Input validation failed"
-                )
+                return self._input_validation_failure(agent_name, fixture)
 
             # Execute agent using Task integration or mock
             if self.use_task_integration and self.task_executor:
-                actual_output = self._execute_with_task_tool(agent_name, input_data)
+                actual_output, tokens_used = self._execute_with_task_tool(agent_name, input_data, deadline)
             else:
                 actual_output = self._simulate_agent_execution(agent_name, input_data)
+                tokens_used = None
 
-            # Validate output
-            is_valid, validation_errors = self._validate_output(agent_name, actual_output)
-
-            # Check if output matches expected
-            matches_expected = self._compare_outputs(actual_output, expected_output)
-
-            execution_time = time.time() - start_time
-
-            # Determine test status
-            if is_valid and matches_expected:
-                status = "pass"
-                error_msg = None
-            else:
-                status = "fail"
-                error_msg = f"Validation: {validation_errors}" if not is_valid else "Output doesn't match expected"
-
-            return TestResult(
-                agent_name=agent_name,
-                test_name=test_name,
-                status=status,
-                execution_time=execution_time,
-                tokens_used=self._estimate_tokens(input_data, actual_output),
-                input_data=input_data,
-                actual_output=actual_output,
-                expected_output=expected_output,
-                error_message=error_msg
+            return self._evaluate_agent_test(
+                agent_name, fixture, actual_output, time.time() - start_time, tokens_used
             )
 
+        except TimeoutError as e:
+            return self._timeout_failure(agent_name, fixture, time.time() - start_time, str(e))
+
         except Exception as e:
             execution_time = time.time() - start_time
             return TestResult(
@@ -206,6 +339,65 @@ class SubAgentTestRunner:
                 error_message=str(e)
             )
 
+    def _evaluate_agent_test(self, agent_name: str, fixture: Dict, actual_output: Any,
+                             execution_time: float, tokens_used: int = None) -> TestResult:
+        """
+        Validate an agent's output for a fixture and build its TestResult
+
+        Args:
+            agent_name: Name of the agent
+            fixture: Test fixture with input and expected output
+            actual_output: Output the agent produced
+            execution_time: Seconds the execution took
+            tokens_used: Tokens billed for the execution (counted from input
+                and output if None, e.g. for simulated executions)
+
+        Returns:
+            TestResult object
+        """
+        input_data = fixture.get("input", {})
+        expected_output = fixture.get("expected_output", {})
+
+        # Validate output
+        is_valid, validation_errors = self._validate_output(agent_name, actual_output)
+
+        # Check if output matches expected
+        matches_expected = self._compare_outputs(actual_output, expected_output)
+
+        # Determine test status
+        if is_valid and matches_expected:
+            status = "pass"
+            error_msg = None
+        else:
+            status = "fail"
+            error_msg = f"Validation: {validation_errors}" if not is_valid else "Output doesn't match expected"
+
+        return TestResult(
+            agent_name=agent_name,
+            test_name=fixture.get("test_name", "unnamed_test"),
+            status=status,
+            execution_time=execution_time,
+            tokens_used=tokens_used if tokens_used is not None else self._estimate_tokens(input_data, actual_output),
+            input_data=input_data,
+            actual_output=actual_output,
+            expected_output=expected_output,
+            error_message=error_msg
+        )
+
+    def _input_validation_failure(self, agent_name: str, fixture: Dict) -> TestResult:
+        """Build the TestResult for a fixture whose input fails its schema"""
+        return TestResult(
+            agent_name=agent_name,
+            test_name=fixture.get("test_name", "unnamed_test"),
+            status="fail",
+            execution_time=0,
+            tokens_used=0,
+            input_data=fixture.get("input", {}),
+            actual_output=None,
+            expected_output=fixture.get("expected_output", {}),
+            error_message="Input validation failed"
+        )
+
     def _validate_input(self, agent_name: str, input_data: Dict) -> bool:
         """Validate input against agent's input schema"""
         schema = self.validation_schemas.get("agent_validation", {}).get(agent_name, {}).get("input_schema")
@@ -292,17 +484,25 @@ class SubAgentTestRunner:
                     return False
         return True
 
-    def _execute_with_task_tool(self, agent_name: str, input_data: Dict) -> Dict:
+    def _execute_with_task_tool(self, agent_name: str, input_data: Dict,
+                                deadline: Optional[float] = None) -> Tuple[Dict, Optional[int]]:
         """
         Execute agent using Claude Task tool integration
 
         Args:
             agent_name: Name of the agent to execute
             input_data: Input data for the agent
+            deadline: time.monotonic() the call must finish by
 
         Returns:
-            Agent output as dictionary
+            Tuple of (agent output, tokens billed or None if the output was
+            simulated)
+
+        Raises:
+            TimeoutError: If the call ran out of time; a timeout is reported
+                rather than papered over with simulated output
         """
+        timeout = self._call_timeout(deadline)
         try:
             # Load agent specification
             agent_spec = self.spec_loader.load_agent_spec(agent_name)
@@ -314,19 +514,24 @@ class SubAgentTestRunner:
             result = self.task_executor.execute_agent(
                 agent_name=agent_name,
                 agent_spec=agent_spec,
-                input_data=input_data
+                input_data=input_data,
+                timeout=timeout
             )
 
+            if result.timed_out:
+                raise TimeoutError(result.error)
             if result.success:
-                return result.output
+                return result.output, result.tokens_used
             else:
                 # Fall back to mock on failure
                 print(f"Task execution failed for {agent_name}, using mock: {result.error}")
-                return self._simulate_agent_execution(agent_name, input_data)
+                return self._simulate_agent_execution(agent_name, input_data), None
 
+        except TimeoutError:
+            raise
         except Exception as e:
             print(f"Error in Task tool execution for {agent_name}: {e}")
-            return self._simulate_agent_execution(agent_name, input_data)
+            return self._simulate_agent_execution(agent_name, input_data), None
 
     def _simulate_agent_execution(self, agent_name: str, input_data: Dict) -> Dict:
         """
@@ -352,7 +557,10 @@ class SubAgentTestRunner:
             return {"status": "completed", "data": "test_output"}
 
     def _estimate_tokens(self, input_data: Any, output_data: Any) -> int:
-        """Estimate token usage for the test"""
+        """Estimate token usage for a simulated test (input plus output)"""
+        if self.token_counter:
+            return self.token_counter.count_json(input_data) + self.token_counter.count_json(output_data)
+
         # Simple estimation: ~4 characters per token
         input_str = json.dumps(input_data) if isinstance(input_data, dict) else str(input_data)
         output_str = json.dumps(output_data) if isinstance(output_data, dict) else str(output_data)
@@ -390,20 +598,16 @@ class SubAgentTestRunner:
 
         return results
 
+    def _get_phase_for_agent(self, agent_name: str) -> str:
+        """Get the phase an agent belongs to"""
+        for phase, agents in PHASE_AGENTS.items():
+            if agent_name in agents:
+                return phase
+        return "unknown"
+
     def _get_phase_agents(self, phase: str) -> List[str]:
         """Get list of agents for a specific phase"""
-        phase_mapping = {
-            "research": ["topic-scout", "source-gatherer", "competitor-analyzer", "fact-verifier", "keyword-researcher"],
-            "strategy": ["content-planner", "angle-definer", "audience-profiler", "spec-writer", "template-selector"],
-            "content": ["outline-builder", "intro-writer", "body-writer", "conclusion-writer", "quote-integrator"],
-            "technical": ["code-example-writer", "api-documenter", "command-demonstrator", "error-handler"],
-            "tutorial": ["step-sequencer", "exercise-designer", "solution-provider", "concept-explainer"],
-            "qa": ["grammar-checker", "style-editor", "flow-optimizer", "readability-scorer", "link-validator"],
-            "visual": ["ai-prompt-engineer", "chart-designer", "infographic-planner", "thumbnail-creator", "diagram-sketcher"],
-            "distribution": ["content-atomizer", "twitter-formatter", "linkedin-adapter", "instagram-packager", "newsletter-curator"],
-            "performance": ["metrics-collector", "trend-spotter", "improvement-advisor"]
-        }
-        return phase_mapping.get(phase, [])
+        return PHASE_AGENTS.get(phase, [])
 
     def test_full_pipeline(self, workflow_type: str = "standard") -> List[TestResult]:
         """
@@ -530,18 +734,19 @@ class SubAgentTestRunner:
 # Main execution
 if __name__ == "__main__":
     # Initialize test runner
-    runner = SubAgentTestRunner()
+    with SubAgentTestRunner() as runner:
+        runner.start_run()
 
-    # Example: Test individual agent
-    print("Testing keyword-researcher agent...")
-    results = runner.test_individual_agent("keyword-researcher")
+        # Example: Test individual agent
+        print("Testing keyword-researcher agent...")
+        results = runner.test_individual_agent("keyword-researcher")
 
-    # Example: Test a pipeline phase
-    print("\nTesting research phase...")
-    phase_results = runner.test_pipeline_segment("research")
+        # Example: Test a pipeline phase
+        print("\nTesting research phase...")
+        phase_results = runner.test_pipeline_segment("research")
 
-    # Generate and save report
-    report = runner.generate_report("test_results.json")
+        # Generate and save report
+        report = runner.generate_report("test_results.json")
 
-    # Print summary
-    runner.print_summary()
\ No newline at end of file
+        # Print summary
+        runner.print_summary()
\ No newline at end of file
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Token Accounting
+Offline token counting and per-agent/phase/model usage ledger
+"""
+
+import json
+import math
+import re
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from agent_spec_loader import compute_spec_hash
+
+# Optional exact tokenizer
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+class HeuristicTokenizer:
+    """
+    Dependency-free approximation of a BPE tokenizer
+
+    Text is split into words (with their leading space), digit runs and
+    single punctuation marks, the same pre-tokenization BPE vocabularies
+    use. Words up to chars_per_token characters count as one token, longer
+    ones one token per chars_per_token characters; digit runs one token per
+    three digits. This tracks real tokenizers far more closely than a flat
+    characters/4 ratio on JSON and markdown, where punctuation is dense.
+    """
+
+    name = "heuristic"
+
+    _PIECES = re.compile(r" ?[A-Za-z]+| ?\d+| ?[^\sA-Za-z\d]|\s+")
+
+    def __init__(self, chars_per_token: int = 6):
+        """Initialize tokenizer"""
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        """Count tokens in text"""
+        tokens = 0
+        for piece in self._PIECES.findall(text):
+            stripped = piece.strip()
+            if not stripped:
+                # Runs of whitespace (indentation) cost about one token per line
+                tokens += max(1, piece.count("\n"))
+            elif stripped.isdigit():
+                tokens += math.ceil(len(stripped) / 3)
+            else:
+                tokens += max(1, math.ceil(len(stripped) / self.chars_per_token))
+        return tokens
+
+
+class TiktokenTokenizer:
+    """Exact BPE counts via tiktoken (optional dependency)"""
+
+    name = "tiktoken"
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        """Initialize with a tiktoken encoding"""
+        if not TIKTOKEN_AVAILABLE:
+            raise ImportError("tiktoken is not installed")
+        self.encoding = tiktoken.get_encoding(encoding)
+
+    def count(self, text: str) -> int:
+        """Count tokens in text"""
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+
+def get_tokenizer(name: str = "auto", **kwargs):
+    """
+    Create a tokenizer by name
+
+    Args:
+        name: 'heuristic', 'tiktoken', or 'auto' (tiktoken when installed,
+            otherwise heuristic)
+
+    Returns:
+        Object with a count(text) -> int method
+    """
+    if name == "auto":
+        name = "tiktoken" if TIKTOKEN_AVAILABLE else "heuristic"
+
+    if name == "tiktoken":
+        return TiktokenTokenizer(**kwargs)
+    if name == "heuristic":
+        return HeuristicTokenizer(**kwargs)
+    raise ValueError(f"Unknown tokenizer '{name}'")
+
+
+class TokenCounter:
+    """
+    Token counting with memoised spec counts
+
+    Agent specs are the bulk of every prompt and rarely change, so their
+    counts are cached by content hash; inputs and outputs are counted on
+    each call.
+    """
+
+    def __init__(self, tokenizer=None):
+        """Initialize with a tokenizer (auto-selected if None)"""
+        self.tokenizer = tokenizer or get_tokenizer()
+        self._spec_counts = {}
+        self._prefix_counts = {}
+        self._lock = threading.Lock()
+
+    def count(self, text: str) -> int:
+        """Count tokens in text"""
+        return self.tokenizer.count(text) if text else 0
+
+    def count_json(self, data: Any) -> int:
+        """Count tokens in the JSON serialization of data"""
+        if isinstance(data, str):
+            return self.count(data)
+        return self.count(json.dumps(data, default=str))
+
+    def count_spec(self, spec: str) -> int:
+        """Count tokens in an agent spec, memoised by content hash"""
+        key = compute_spec_hash(spec)
+        count = self._spec_counts.get(key)
+        if count is None:
+            count = self.count(spec)
+            with self._lock:
+                self._spec_counts[key] = count
+        return count
+
+    def count_prefix(self, prefix: str) -> int:
+        """
+        Count tokens in a shared prompt prefix
+
+        Prefixes are reused verbatim (see PromptBuilder), so they are
+        memoised by the string itself rather than re-hashed per call.
+        """
+        count = self._prefix_counts.get(prefix)
+        if count is None:
+            count = self.count(prefix)
+            with self._lock:
+                self._prefix_counts[prefix] = count
+        return count
+
+
+class TokenLedger:
+    """
+    Running totals of prompt and completion tokens
+
+    Usage is aggregated per agent, per pipeline phase and per model tier.
+    Recording is thread-safe so the orchestrator's worker threads can share
+    one ledger.
+    """
+
+    def __init__(self, phase_for_agent: Callable[[str], str] = None):
+        """
+        Initialize ledger
+
+        Args:
+            phase_for_agent: Returns the pipeline phase of an agent
+        """
+        self.phase_for_agent = phase_for_agent
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear all totals"""
+        with self._lock:
+            self.totals = self._empty()
+            self.by_agent = {}
+            self.by_phase = {}
+            self.by_model = {}
+
+    @staticmethod
+    def _empty() -> Dict:
+        """Empty usage record"""
+        return {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+
+    def record(self, agent_name: str, model: str, prompt_tokens: int, completion_tokens: int,
+               phase: Optional[str] = None):
+        """Add one call's usage"""
+        if phase is None:
+            phase = self.phase_for_agent(agent_name) if self.phase_for_agent else "unknown"
+
+        with self._lock:
+            for bucket in (
+                self.totals,
+                self.by_agent.setdefault(agent_name, self._empty()),
+                self.by_phase.setdefault(phase, self._empty()),
+                self.by_model.setdefault(model, self._empty())
+            ):
+                bucket["calls"] += 1
+                bucket["prompt_tokens"] += prompt_tokens
+                bucket["completion_tokens"] += completion_tokens
+                bucket["total_tokens"] += prompt_tokens + completion_tokens
+
+    def get_statistics(self) -> Dict:
+        """Snapshot of all aggregates"""
+        with self._lock:
+            return {
+                "totals": dict(self.totals),
+                "by_agent": {key: dict(value) for key, value in self.by_agent.items()},
+                "by_phase": {key: dict(value) for key, value in self.by_phase.items()},
+                "by_model": {key: dict(value) for key, value in self.by_model.items()}
+            }
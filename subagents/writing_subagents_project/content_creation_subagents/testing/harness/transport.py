@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - HTTP Transport
+Pooled keep-alive connections for the real execution path
+"""
+
+import asyncio
+import http.client
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# Optional HTTP/2-capable client
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+TRANSPORT_BACKENDS = ("auto", "stdlib", "httpx")
+
+# Errors from reusing a connection the server already closed
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError
+)
+
+
+class PoolStats:
+    """Thread-safe pool counters shared by both transports"""
+
+    def __init__(self):
+        """Initialize counters"""
+        self._lock = threading.Lock()
+        self.counters = {
+            "requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "connections_discarded": 0,
+            "in_use": 0,
+            "peak_in_use": 0,
+            "waits": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0
+        }
+
+    def add(self, key: str, delta=1):
+        """Bump a counter"""
+        with self._lock:
+            self.counters[key] += delta
+            if key == "in_use":
+                self.counters["peak_in_use"] = max(self.counters["peak_in_use"], self.counters["in_use"])
+
+    def waited(self, seconds: float):
+        """Record a request that had to wait for a free connection"""
+        with self._lock:
+            self.counters["waits"] += 1
+            self.counters["total_wait_time"] += seconds
+            self.counters["max_wait_time"] = max(self.counters["max_wait_time"], seconds)
+
+    def snapshot(self) -> Dict:
+        """Counters plus saturation (share of requests that waited for a connection)"""
+        with self._lock:
+            stats = dict(self.counters)
+        stats["saturation"] = round(stats["waits"] / max(1, stats["requests"]), 4)
+        stats["total_wait_time"] = round(stats["total_wait_time"], 4)
+        stats["max_wait_time"] = round(stats["max_wait_time"], 4)
+        return stats
+
+
+class ConnectionPool:
+    """
+    Bounded keep-alive pool of http.client connections
+
+    At most max_connections_per_host connections exist per (scheme, host,
+    port) and at most max_connections overall; a request beyond either
+    limit waits for a connection to be returned. Idle connections are
+    reused last-in-first-out and dropped after keepalive_expiry seconds.
+    """
+
+    def __init__(self, max_connections: int = 20, max_connections_per_host: int = 10,
+                 keepalive_expiry: float = 30.0):
+        """Initialize an empty pool"""
+        self.max_connections = max(1, max_connections)
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.keepalive_expiry = keepalive_expiry
+
+        self._condition = threading.Condition()
+        self._idle = {}
+        self._open = {}
+        self._total_open = 0
+        self.stats = PoolStats()
+
+    def _create(self, origin: Tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+        """Open a connection to origin"""
+        scheme, host, port = origin
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        self.stats.add("connections_opened")
+        return connection_class(host, port, timeout=timeout)
+
+    def acquire(self, origin: Tuple[str, str, int], timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take a connection for origin, waiting while the pool is at its limits
+
+        Returns:
+            (connection, reused)
+
+        Raises:
+            TimeoutError: No connection came free within timeout seconds
+        """
+        started = time.monotonic()
+        waited = False
+        with self._condition:
+            while True:
+                idle = self._idle.get(origin)
+                now = time.monotonic()
+                while idle:
+                    connection, returned_at = idle.pop()
+                    if now - returned_at <= self.keepalive_expiry:
+                        self.stats.add("connections_reused")
+                        break
+                    self._discard_locked(origin, connection)
+                else:
+                    connection = None
+
+                if connection is None and (
+                    self._open.get(origin, 0) < self.max_connections_per_host
+                    and self._total_open < self.max_connections
+                ):
+                    self._open[origin] = self._open.get(origin, 0) + 1
+                    self._total_open += 1
+                    connection = self._create(origin, timeout)
+                    reused = False
+                elif connection is not None:
+                    reused = True
+
+                if connection is not None:
+                    if waited:
+                        self.stats.waited(time.monotonic() - started)
+                    self.stats.add("in_use")
+                    connection.timeout = timeout
+                    if connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                    return connection, reused
+
+                # At the overall limit with room for this origin: make room by
+                # closing another origin's idle connection
+                if (
+                    self._total_open >= self.max_connections
+                    and self._open.get(origin, 0) < self.max_connections_per_host
+                    and self._evict_idle_locked()
+                ):
+                    continue
+                waited = True
+                remaining = None if timeout is None else timeout - (time.monotonic() - started)
+                if remaining is not None and remaining <= 0:
+                    self.stats.waited(time.monotonic() - started)
+                    raise TimeoutError(
+                        f"Timed out after {timeout:.1f}s waiting for a connection to {origin[1]}:{origin[2]}"
+                    )
+                self._condition.wait(remaining)
+
+    def release(self, origin: Tuple[str, str, int], connection: http.client.HTTPConnection,
+                reusable: bool):
+        """Return a connection, keeping it for reuse when the server allows it"""
+        with self._condition:
+            self.stats.add("in_use", -1)
+            if reusable:
+                self._idle.setdefault(origin, deque()).append((connection, time.monotonic()))
+            else:
+                self._discard_locked(origin, connection)
+            # Waiters may be for different origins, so wake them all to recheck
+            self._condition.notify_all()
+
+    def _discard_locked(self, origin: Tuple[str, str, int], connection: http.client.HTTPConnection):
+        """Close a connection and free its slot (caller holds the lock)"""
+        connection.close()
+        self._open[origin] -= 1
+        self._total_open -= 1
+        self.stats.add("connections_discarded")
+
+    def _evict_idle_locked(self) -> bool:
+        """Close the oldest idle connection (caller holds the lock)"""
+        oldest = None
+        for origin, idle in self._idle.items():
+            if idle and (oldest is None or idle[0][1] < self._idle[oldest][0][1]):
+                oldest = origin
+        if oldest is None:
+            return False
+        connection, _ = self._idle[oldest].popleft()
+        self._discard_locked(oldest, connection)
+        return True
+
+    def close(self):
+        """Close all idle connections"""
+        with self._condition:
+            for origin, idle in self._idle.items():
+                while idle:
+                    self._discard_locked(origin, idle.pop()[0])
+
+    def get_statistics(self) -> Dict:
+        """Pool counters, limits and current occupancy"""
+        with self._condition:
+            idle = sum(len(connections) for connections in self._idle.values())
+            open_connections = self._total_open
+        return {
+            "backend": "stdlib",
+            "max_connections": self.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "open": open_connections,
+            "idle": idle,
+            **self.stats.snapshot()
+        }
+
+
+class StdlibTransport:
+    """JSON over HTTP/1.1 keep-alive using a ConnectionPool"""
+
+    def __init__(self, max_connections: int = 20, max_connections_per_host: int = 10,
+                 keepalive_expiry: float = 30.0):
+        """Initialize transport"""
+        self.pool = ConnectionPool(max_connections, max_connections_per_host, keepalive_expiry)
+
+    @property
+    def stats(self) -> PoolStats:
+        """The pool's counters"""
+        return self.pool.stats
+
+    def post_json(self, url: str, payload: Dict, timeout: float) -> Tuple[int, Dict, bytes]:
+        """
+        POST JSON and return (status, headers, body)
+
+        A request that fails on a reused connection the server has since
+        closed is retried once on a fresh connection.
+        """
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        body = json.dumps(payload, default=str).encode("utf-8")
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+        self.pool.stats.add("requests")
+        for attempt in range(2):
+            connection, reused = self.pool.acquire(origin, timeout)
+            reusable = False
+            try:
+                connection.request("POST", path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+                reusable = not response.will_close
+                return response.status, dict(response.getheaders()), data
+            except _STALE_CONNECTION_ERRORS:
+                if reused and attempt == 0:
+                    continue
+                raise
+            finally:
+                self.pool.release(origin, connection, reusable)
+
+    def close(self):
+        """Close pooled connections"""
+        self.pool.close()
+
+    def get_statistics(self) -> Dict:
+        """Pool metrics"""
+        return self.pool.get_statistics()
+
+
+class HttpxTransport:
+    """
+    JSON over httpx, with HTTP/2 multiplexing when the h2 package is installed
+
+    httpx.Limits has no per-host bound, so max_connections_per_host is
+    enforced here with a semaphore per (scheme, host, port) capping the
+    requests in flight to each host; over HTTP/2 those share one
+    connection as streams. max_connections is passed to httpx as the
+    overall connection limit.
+    """
+
+    def __init__(self, max_connections: int = 20, max_connections_per_host: int = 10,
+                 keepalive_expiry: float = 30.0, http2: bool = True):
+        """Initialize transport"""
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is not installed")
+
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        try:
+            self.client = httpx.Client(http2=http2, limits=limits)
+            self.http2 = http2
+        except ImportError:
+            # http2=True needs the optional h2 package
+            self.client = httpx.Client(limits=limits)
+            self.http2 = False
+        self.max_connections = max_connections
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.stats = PoolStats()
+
+        self._host_lock = threading.Lock()
+        self._host_slots = {}
+
+    def _slots_for(self, url: str) -> threading.BoundedSemaphore:
+        """The in-flight request semaphore for url's host"""
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        with self._host_lock:
+            slots = self._host_slots.get(origin)
+            if slots is None:
+                slots = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._host_slots[origin] = slots
+            return slots
+
+    def post_json(self, url: str, payload: Dict, timeout: float) -> Tuple[int, Dict, bytes]:
+        """POST JSON and return (status, headers, body)"""
+        self.stats.add("requests")
+        slots = self._slots_for(url)
+        if not slots.acquire(blocking=False):
+            started = time.monotonic()
+            acquired = slots.acquire(timeout=timeout)
+            self.stats.waited(time.monotonic() - started)
+            if not acquired:
+                raise TimeoutError(f"Timed out after {timeout:.1f}s waiting for a connection to {url}")
+
+        self.stats.add("in_use")
+        try:
+            response = self.client.post(url, json=payload, timeout=timeout)
+            return response.status_code, dict(response.headers), response.content
+        except httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        finally:
+            self.stats.add("in_use", -1)
+            slots.release()
+
+    def close(self):
+        """Close the client and its connections"""
+        self.client.close()
+
+    def get_statistics(self) -> Dict:
+        """Request counters (httpx manages the pool itself)"""
+        return {
+            "backend": "httpx",
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            **self.stats.snapshot()
+        }
+
+
+class Transport:
+    """
+    Blocking transport plus an async entry point for the event loop
+
+    Requests run on a dedicated thread pool sized to the per-host connection
+    limit (executions all go to the one backend host), so async executions
+    never queue behind unrelated work on the loop's default executor and
+    never park threads waiting for a connection the host can't get.
+    """
+
+    def __init__(self, client, max_workers: int):
+        """Wrap a StdlibTransport or HttpxTransport"""
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self._threads = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="transport")
+        self._lock = threading.Lock()
+        self._busy = 0
+        self.closed = False
+
+    def _check_open(self):
+        """Refuse requests once close() has run"""
+        if self.closed:
+            raise RuntimeError("Transport is closed; create a new one with create_transport()")
+
+    def post_json(self, url: str, payload: Dict, timeout: float) -> Tuple[int, Dict, bytes]:
+        """POST JSON from the calling thread"""
+        self._check_open()
+        return self.client.post_json(url, payload, timeout)
+
+    async def apost_json(self, url: str, payload: Dict, timeout: float) -> Tuple[int, Dict, bytes]:
+        """
+        POST JSON without blocking the running event loop
+
+        A request submitted while every thread is busy counts as a pool wait,
+        for the time it spends queued.
+        """
+        self._check_open()
+        with self._lock:
+            saturated = self._busy >= self.max_workers
+            self._busy += 1
+        submitted = time.monotonic()
+
+        def run():
+            if saturated:
+                self.client.stats.waited(time.monotonic() - submitted)
+            return self.client.post_json(url, payload, timeout)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._threads, run)
+        finally:
+            with self._lock:
+                self._busy -= 1
+
+    def close(self):
+        """Close connections and stop the request threads"""
+        self.closed = True
+        self._threads.shutdown(wait=False)
+        self.client.close()
+
+    def get_statistics(self) -> Dict:
+        """Pool metrics"""
+        return self.client.get_statistics()
+
+
+def create_transport(config: Dict) -> Transport:
+    """
+    Build the transport described by config['transport']
+
+    backend 'auto' uses httpx when it is installed and the stdlib pool
+    otherwise.
+    """
+    transport_config = config.get("transport") or {}
+    backend = transport_config.get("backend", "auto")
+    if backend not in TRANSPORT_BACKENDS:
+        raise ValueError(f"Unknown transport backend '{backend}', expected one of {TRANSPORT_BACKENDS}")
+    if backend == "auto":
+        backend = "httpx" if HTTPX_AVAILABLE else "stdlib"
+
+    max_connections = transport_config.get("max_connections", 20)
+    max_connections_per_host = transport_config.get("max_connections_per_host", 10)
+    options = {
+        "max_connections": max_connections,
+        "max_connections_per_host": max_connections_per_host,
+        "keepalive_expiry": transport_config.get("keepalive_expiry_seconds", 30.0)
+    }
+    if backend == "httpx":
+        client = HttpxTransport(http2=transport_config.get("http2", True), **options)
+    else:
+        client = StdlibTransport(**options)
+    return Transport(client, max_workers=min(max_connections, max_connections_per_host))
@@ -459,15 +459,29 @@ class PerformanceValidator:
             })
             report["meets_benchmarks"] = False
 
-        # Check token usage
-        if metrics.get("total_tokens", 0) > self.benchmarks["max_total_tokens"]:
+        # Check token usage; custom benchmarks may leave the token limits out
+        max_total_tokens = self.benchmarks.get("max_total_tokens")
+        if max_total_tokens is not None and metrics.get("total_tokens", 0) > max_total_tokens:
             report["violations"].append({
                 "metric": "total_tokens",
                 "value": metrics["total_tokens"],
-                "limit": self.benchmarks["max_total_tokens"]
+                "limit": max_total_tokens
             })
             report["meets_benchmarks"] = False
 
+        # Check per-agent token usage (mean tokens per test)
+        max_tokens_per_agent = self.benchmarks.get("max_tokens_per_agent")
+        if max_tokens_per_agent is not None:
+            for agent, tokens in (metrics.get("tokens_per_agent") or {}).items():
+                if tokens > max_tokens_per_agent:
+                    report["violations"].append({
+                        "metric": "tokens_per_agent",
+                        "agent": agent,
+                        "value": tokens,
+                        "limit": max_tokens_per_agent
+                    })
+                    report["meets_benchmarks"] = False
+
         # Check success rate
         success_rate = metrics.get("success_rate", 0)
         if success_rate < self.benchmarks["min_success_rate"]:
@@ -47,98 +47,101 @@ def main():
     print("\n🚀 Initializing Test Orchestrator...")
     orchestrator = TestOrchestrator(config)
 
-    # Run tests based on command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-
-        if command == "coverage":
-            # Show coverage report
-            loader.print_coverage_summary()
-
-        elif command == "validate":
-            # Validate fixtures
-            print("\n🔍 Validating Fixtures...")
-            validation = loader.validate_fixtures()
-            print(f"✓ Valid fixtures: {validation['valid_fixtures']}")
-            if validation['invalid_fixtures'] > 0:
-                print(f"✗ Invalid fixtures: {validation['invalid_fixtures']}")
-                for error in validation['errors'][:5]:
-                    print(f"  - {error}")
-
-        elif command == "quick":
-            # Quick test run
-            print("\n⚡ Running Quick Tests...")
-            config.test_mode = "quick"
-            orchestrator.run_regression_suite()
-
-        elif command == "benchmark":
-            # Performance benchmarks
-            print("\n📈 Running Performance Benchmarks...")
-            report = orchestrator.benchmark_performance()
-            print(json.dumps(report, indent=2, default=str))
-
-        elif command == "workflow":
-            # Test specific workflow
-            if len(sys.argv) > 2:
-                workflow = sys.argv[2]
-                print(f"\n🔄 Testing Workflow: {workflow}")
-                orchestrator.test_workflow(workflow)
-            else:
-                print("Available workflows: quick-news, blog-post, tutorial")
-
-        elif command == "agent":
-            # Test specific agent
-            if len(sys.argv) > 2:
-                agent = sys.argv[2]
-                print(f"\n🤖 Testing Agent: {agent}")
-                result = orchestrator._test_single_agent(agent)
-                print(json.dumps(result, indent=2, default=str))
-            else:
-                print("Please specify an agent name")
-
-        elif command == "phase":
-            # Test specific phase
-            if len(sys.argv) > 2:
-                phase = sys.argv[2]
-                print(f"\n📦 Testing Phase: {phase}")
-                agents = orchestrator.all_agents.get(phase, [])
-                if agents:
-                    results = orchestrator._test_phase(phase, agents)
-                    print(f"Tested {len(results)} agents in {phase} phase")
+    try:
+        # Run tests based on command line arguments
+        if len(sys.argv) > 1:
+            command = sys.argv[1]
+
+            if command == "coverage":
+                # Show coverage report
+                loader.print_coverage_summary()
+
+            elif command == "validate":
+                # Validate fixtures
+                print("\n🔍 Validating Fixtures...")
+                validation = loader.validate_fixtures()
+                print(f"✓ Valid fixtures: {validation['valid_fixtures']}")
+                if validation['invalid_fixtures'] > 0:
+                    print(f"✗ Invalid fixtures: {validation['invalid_fixtures']}")
+                    for error in validation['errors'][:5]:
+                        print(f"  - {error}")
+
+            elif command == "quick":
+                # Quick test run
+                print("\n⚡ Running Quick Tests...")
+                config.test_mode = "quick"
+                orchestrator.run_regression_suite()
+
+            elif command == "benchmark":
+                # Performance benchmarks
+                print("\n📈 Running Performance Benchmarks...")
+                report = orchestrator.benchmark_performance()
+                print(json.dumps(report, indent=2, default=str))
+
+            elif command == "workflow":
+                # Test specific workflow
+                if len(sys.argv) > 2:
+                    workflow = sys.argv[2]
+                    print(f"\n🔄 Testing Workflow: {workflow}")
+                    orchestrator.test_workflow(workflow)
+                else:
+                    print("Available workflows: quick-news, blog-post, tutorial")
+
+            elif command == "agent":
+                # Test specific agent
+                if len(sys.argv) > 2:
+                    agent = sys.argv[2]
+                    print(f"\n🤖 Testing Agent: {agent}")
+                    result = orchestrator._test_single_agent(agent)
+                    print(json.dumps(result, indent=2, default=str))
+                else:
+                    print("Please specify an agent name")
+
+            elif command == "phase":
+                # Test specific phase
+                if len(sys.argv) > 2:
+                    phase = sys.argv[2]
+                    print(f"\n📦 Testing Phase: {phase}")
+                    agents = orchestrator.all_agents.get(phase, [])
+                    if agents:
+                        results = orchestrator._test_phase(phase, agents)
+                        print(f"Tested {len(results)} agents in {phase} phase")
+                    else:
+                        print(f"Unknown phase: {phase}")
+                        print("Available phases:", list(orchestrator.all_agents.keys()))
                 else:
-                    print(f"Unknown phase: {phase}")
                     print("Available phases:", list(orchestrator.all_agents.keys()))
+
             else:
-                print("Available phases:", list(orchestrator.all_agents.keys()))
+                print(f"Unknown command: {command}")
+                print_usage()
 
         else:
-            print(f"Unknown command: {command}")
-            print_usage()
-
-    else:
-        # Run comprehensive tests
-        print("\n🎯 Running Comprehensive Test Suite...")
-        print("This will test all 41 agents with all fixtures")
-        print("Estimated time: 15-30 minutes")
-
-        try:
-            report = orchestrator.run_all_tests()
-
-            # Save detailed report
-            report_path = Path(__file__).parent / "reports" / f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            report_path.parent.mkdir(exist_ok=True)
-
-            with open(report_path, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
-
-            print(f"\n📄 Detailed report saved to: {report_path}")
-
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Test run interrupted by user")
-        except Exception as e:
-            print(f"\n\n❌ Test run failed: {e}")
-            import traceback
-            traceback.print_exc()
+            # Run comprehensive tests
+            print("\n🎯 Running Comprehensive Test Suite...")
+            print("This will test all 41 agents with all fixtures")
+            print("Estimated time: 15-30 minutes")
+
+            try:
+                report = orchestrator.run_all_tests()
+
+                # Save detailed report
+                report_path = Path(__file__).parent / "reports" / f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                report_path.parent.mkdir(exist_ok=True)
+
+                with open(report_path, 'w') as f:
+                    json.dump(report, f, indent=2, default=str)
+
+                print(f"\n📄 Detailed report saved to: {report_path}")
+
+            except KeyboardInterrupt:
+                print("\n\n⚠️  Test run interrupted by user")
+            except Exception as e:
+                print(f"\n\n❌ Test run failed: {e}")
+                import traceback
+                traceback.print_exc()
+    finally:
+        orchestrator.close()
 
 
 def print_usage():
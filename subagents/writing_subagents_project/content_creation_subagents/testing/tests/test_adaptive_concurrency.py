@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Adaptive Concurrency Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from rate_limiter import AdaptiveConcurrencyLimiter  # noqa: E402
+from stand_in_server import LatencyProfile, StandInServer  # noqa: E402
+from task_executor import ClaudeTaskExecutor, create_agent_task  # noqa: E402
+
+
+class LimitAdjustmentTests(unittest.TestCase):
+    """Additive increase, multiplicative decrease"""
+
+    def run_call(self, limiter: AdaptiveConcurrencyLimiter, outcome: str, latency: float = 0.1):
+        """Acquire a slot and release it as if the call took latency seconds"""
+        started_at = asyncio.run(limiter.acquire())
+        limiter.release(started_at - latency, outcome)
+
+    def test_healthy_successes_grow_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=4, maximum=64)
+        for _ in range(8):
+            self.run_call(limiter, "success")
+
+        # About one slot per round of `limit` completions
+        self.assertGreater(limiter.limit, 5.5)
+        self.assertLess(limiter.limit, 6.5)
+        self.assertEqual(limiter.stats["increases"], 8)
+
+    def test_limit_stays_within_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2, minimum=2, maximum=3)
+        for _ in range(20):
+            self.run_call(limiter, "success")
+        self.assertEqual(limiter.limit, 3)
+
+        for _ in range(5):
+            self.run_call(limiter, "throttled")
+        self.assertEqual(limiter.limit, 2)
+
+    def test_throttling_halves_the_limit_once_per_congestion_event(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=8)
+
+        async def congested():
+            # Four calls in flight together all get throttled
+            slots = [await limiter.acquire() for _ in range(4)]
+            for started_at in slots:
+                limiter.release(started_at, "throttled")
+
+        asyncio.run(congested())
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.stats["decreases"], 1)
+
+        # A call dispatched after the cut can cut again
+        self.run_call(limiter, "timeout", latency=0)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_slow_successes_and_errors_hold_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=4, latency_tolerance=2.0)
+        self.run_call(limiter, "success", latency=0.1)
+        limit = limiter.limit
+
+        self.run_call(limiter, "success", latency=0.5)
+        self.run_call(limiter, "error")
+        self.run_call(limiter, "cancelled")
+
+        self.assertEqual(limiter.limit, limit)
+        self.assertEqual(limiter.stats["held"], 3)
+
+
+class SlotTests(unittest.TestCase):
+    """Waiting for and handing over slots"""
+
+    def test_waiters_are_served_in_order_within_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=2)
+        order = []
+
+        async def call(name: str):
+            started_at = await limiter.acquire()
+            order.append(name)
+            await asyncio.sleep(0.01)
+            limiter.release(started_at, "error")
+
+        async def main():
+            await asyncio.gather(*(call(name) for name in "abcdef"))
+
+        asyncio.run(main())
+        self.assertEqual(order, list("abcdef"))
+        self.assertEqual(limiter.peak_in_flight, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_cancelled_waiter_does_not_leak_a_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(initial=1)
+
+        async def main():
+            held = await limiter.acquire()
+            waiter = asyncio.ensure_future(limiter.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+            limiter.release(held, "error")
+            # The slot is free again for the next caller
+            await asyncio.wait_for(limiter.acquire(), 1)
+
+        asyncio.run(main())
+        self.assertEqual(limiter.in_flight, 1)
+        self.assertEqual(limiter.get_statistics()["waiting"], 0)
+
+
+class ExecutorIntegrationTests(unittest.TestCase):
+    """adaptive_concurrency replaces the fixed max_parallel_tasks bound"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_throttling_backend_shrinks_the_limit(self):
+        profile = LatencyProfile(median_ms=10, ms_per_output_token=0, throttle_rate=1.0)
+        with StandInServer(seed=1, profiles={"haiku": profile, "sonnet": profile, "opus": profile}) as server:
+            executor = ClaudeTaskExecutor({
+                "fallback_to_mock": False,
+                "backend_url": server.url,
+                "cache_results": False,
+                "retry_attempts": 1,
+                "max_parallel_tasks": 8,
+                "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name},
+                "error_handling": {"circuit_breaker": {"enabled": False}},
+                "adaptive_concurrency": {"enabled": True, "min_concurrency": 1, "max_concurrency": 16}
+            })
+            try:
+                started = time.monotonic()
+                executor.batch_execute([
+                    create_agent_task("keyword-researcher", "spec", {"topic": str(index)}) for index in range(12)
+                ])
+                self.assertLess(time.monotonic() - started, 10)
+            finally:
+                executor.close()
+
+        self.assertLess(executor.stats["concurrency_limit"], 8)
+        self.assertEqual(executor.stats["current_concurrency"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
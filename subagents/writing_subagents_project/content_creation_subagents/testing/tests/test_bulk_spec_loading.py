@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Bulk Spec Loading Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from agent_spec_loader import AgentSpecLoader, normalize_tools  # noqa: E402
+
+EXTRA_SPECS = {
+    "comma-tools-agent.md": (
+        "---\nname: comma-tools\ndescription: Tools as a string\nmodel: haiku\ntools: WebSearch, Read\n---\n"
+        "## Prompt\nSearch and read.\n"
+    ),
+    "bad-model.md": (
+        "---\nname: bad-model\ndescription: Unknown model\nmodel: gpt-4\ntools: [Read, Teleport]\n---\n"
+        "## Prompt\nDo something.\n"
+    )
+}
+
+
+class NormalizeToolsTests(unittest.TestCase):
+    """Frontmatter tool lists"""
+
+    def test_strings_and_lists(self):
+        self.assertEqual(normalize_tools("WebSearch, Read,"), ["WebSearch", "Read"])
+        self.assertEqual(normalize_tools(["Read", "Write"]), ["Read", "Write"])
+        self.assertEqual(normalize_tools(None), [])
+        self.assertEqual(normalize_tools(""), [])
+
+
+class BulkLoadTests(unittest.TestCase):
+    """load_all_specs and validate_all_specs over a private copy of the specs"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.base_path = Path(self.temp_dir.name) / "specs"
+        self.spec_dir = self.base_path / "optimized_versions"
+        shutil.copytree(AgentSpecLoader(use_bundle=False).optimized_dir, self.spec_dir)
+        for filename, content in EXTRA_SPECS.items():
+            (self.spec_dir / filename).write_text(content, encoding="utf-8")
+
+    def loader(self) -> AgentSpecLoader:
+        return AgentSpecLoader(str(self.base_path), use_bundle=False)
+
+    def test_results_cover_every_agent_in_order(self):
+        loader = self.loader()
+        results = loader.load_all_specs()
+        self.assertEqual(list(results), loader.list_available_agents())
+        for agent_name, result in results.items():
+            with self.subTest(agent=agent_name):
+                self.assertEqual(result.agent_name, agent_name)
+                self.assertIsNone(result.error)
+                self.assertGreaterEqual(result.parse_time_ms, 0)
+                self.assertEqual(result.size_bytes, len(loader.load_agent_spec(agent_name).encode("utf-8")))
+
+    def test_parallel_and_serial_loads_agree(self):
+        parallel = {agent: result.spec.to_dict() for agent, result in self.loader().load_all_specs().items()}
+        serial = {agent: result.spec.to_dict()
+                  for agent, result in self.loader().load_all_specs(parallel=False).items()}
+        self.assertEqual(parallel, serial)
+
+    def test_cached_specs_are_reused(self):
+        loader = self.loader()
+        first = loader.load_all_specs()
+        second = loader.load_all_specs()
+        for agent_name in first:
+            self.assertIs(second[agent_name].spec, first[agent_name].spec)
+
+    def test_validation_matches_validate_spec(self):
+        loader = self.loader()
+        results = loader.validate_all_specs()
+        for agent_name, result in results.items():
+            with self.subTest(agent=agent_name):
+                self.assertEqual((result.valid, result.issues), loader.validate_spec(agent_name))
+
+        self.assertTrue(results["comma-tools"].valid)
+        self.assertEqual(results["comma-tools"].spec.tools, ["WebSearch", "Read"])
+        self.assertFalse(results["bad-model"].valid)
+        self.assertTrue(any("gpt-4" in issue for issue in results["bad-model"].issues))
+        self.assertTrue(any("Teleport" in issue for issue in results["bad-model"].issues))
+
+    def test_load_without_validate_reports_no_issues(self):
+        self.assertEqual(self.loader().load_all_specs()["bad-model"].issues, [])
+
+    def test_unreadable_spec_does_not_abort_the_sweep(self):
+        (self.spec_dir / "broken.md").write_bytes(b"\xff\xfe not utf-8")
+        results = self.loader().load_all_specs()
+        # The loader falls back to a generated default for the unreadable file
+        self.assertEqual(results["broken"].spec.name, "broken")
+        self.assertTrue(all(result.error is None for result in results.values()))
+
+    def test_export_writes_every_loaded_spec(self):
+        output_path = Path(self.temp_dir.name) / "specs.json"
+        loader = self.loader()
+        loader.export_all_specs(str(output_path))
+        exported = json.loads(output_path.read_text(encoding="utf-8"))
+        self.assertEqual(sorted(exported), loader.list_available_agents())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Model Cascade Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from stand_in_server import LatencyProfile, StandInServer  # noqa: E402
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+
+
+class CascadeTests(unittest.TestCase):
+    """Cheapest tier first, escalating when the output check or the call fails"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_executor(self, cascade: dict = None, **overrides) -> ClaudeTaskExecutor:
+        config = {
+            "mock_execution_delay": 0,
+            "cache_results": False,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name},
+            "cascade": {"enabled": True, **(cascade or {})}
+        }
+        config.update(overrides)
+        executor = ClaudeTaskExecutor(config)
+        self.addCleanup(executor.close)
+        return executor
+
+    def test_tiers_stop_at_the_assigned_tier(self):
+        executor = self.make_executor()
+        self.assertEqual(executor.get_cascade_tiers("keyword-researcher"), ["haiku"])
+        self.assertEqual(executor.get_cascade_tiers("body-writer"), ["haiku", "sonnet"])
+        self.assertEqual(executor.get_cascade_tiers("spec-writer"), ["haiku", "sonnet", "opus"])
+
+    def test_uncapped_tiers_and_unknown_assigned_tier(self):
+        executor = self.make_executor({"cap_at_assigned_tier": False, "tiers": ["haiku", "sonnet"]})
+        self.assertEqual(executor.get_cascade_tiers("keyword-researcher"), ["haiku", "sonnet"])
+        # opus is not a cascade tier, so opus agents run as assigned
+        self.assertEqual(executor.get_cascade_tiers("spec-writer"), ["opus"])
+
+    def test_passing_output_is_accepted_on_the_cheapest_tier(self):
+        executor = self.make_executor()
+        result = executor.execute_agent("topic-scout", "spec", {"topic": "cascades"})
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.model, "haiku")
+        stats = executor.get_statistics()["cascade"]["topic-scout"]
+        self.assertEqual(stats["escalations"], 0)
+        self.assertEqual(stats["accepted"], {"haiku": 1})
+
+    def test_failed_check_escalates_through_every_tier(self):
+        executor = self.make_executor()
+        # Mock spec-writer output lacks the schema's required properties
+        passed, _ = executor.check_output("spec-writer", {"title": "no specification"})
+        self.assertFalse(passed)
+
+        result = executor.execute_agent("spec-writer", "spec", {"requirement": "cascades"})
+
+        self.assertEqual(result.model, "opus")
+        stats = executor.get_statistics()["cascade"]["spec-writer"]
+        self.assertEqual(stats["executions"], 1)
+        self.assertEqual(stats["escalated"], 1)
+        self.assertEqual(stats["escalations"], 2)
+        self.assertEqual(stats["escalation_rate"], 1.0)
+
+    def test_failed_call_escalates(self):
+        failing = LatencyProfile(median_ms=1, ms_per_output_token=0, error_rate=1.0)
+        healthy = LatencyProfile(median_ms=1, ms_per_output_token=0)
+        with StandInServer(seed=1, profiles={"haiku": failing, "sonnet": healthy}) as server:
+            executor = self.make_executor(
+                fallback_to_mock=False,
+                backend_url=server.url,
+                error_handling={"circuit_breaker": {"enabled": False}}
+            )
+            result = executor.execute_agent("topic-scout", "spec", {"topic": "cascades"})
+            executor.close()
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(result.model, "sonnet")
+        self.assertEqual(executor.get_statistics()["cascade"]["topic-scout"]["accepted"], {"sonnet": 1})
+
+    def test_batches_run_inputs_alone_under_a_cascade(self):
+        executor = self.make_executor()
+        results = executor.execute_agent_batch(
+            "topic-scout", "spec", [{"topic": f"topic {index}"} for index in range(8)]
+        )
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(executor.stats["batched_calls"], 0)
+        self.assertEqual(executor.get_statistics()["cascade"]["topic-scout"]["executions"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
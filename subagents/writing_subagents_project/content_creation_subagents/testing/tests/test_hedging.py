@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Request Hedging Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from stand_in_server import LatencyProfile, StandInServer  # noqa: E402
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+
+AGENT = "keyword-researcher"
+
+
+class HedgeDelayTests(unittest.TestCase):
+    """When a call is hedged, and after how long"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_executor(self, **hedging) -> ClaudeTaskExecutor:
+        settings = {"enabled": True, "percentile": 90, "min_samples": 5, "models": ["haiku"]}
+        settings.update(hedging)
+        return ClaudeTaskExecutor({
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name},
+            "hedging": settings
+        })
+
+    def test_delay_is_the_latency_percentile(self):
+        executor = self.make_executor()
+        executor.agent_latencies[AGENT] = deque([0.1 * step for step in range(1, 11)])
+        self.assertAlmostEqual(executor._get_hedge_delay(AGENT), 0.9)
+
+    def test_not_hedged_without_enough_history(self):
+        executor = self.make_executor()
+        executor.agent_latencies[AGENT] = deque([0.1] * 4)
+        self.assertIsNone(executor._get_hedge_delay(AGENT))
+
+    def test_not_hedged_on_other_models_or_when_disabled(self):
+        executor = self.make_executor(models=["opus"])
+        executor.agent_latencies[AGENT] = deque([0.1] * 10)
+        self.assertIsNone(executor._get_hedge_delay(AGENT))
+
+        executor = self.make_executor(enabled=False)
+        executor.agent_latencies[AGENT] = deque([0.1] * 10)
+        self.assertIsNone(executor._get_hedge_delay(AGENT))
+
+
+class HedgeWinTests(unittest.TestCase):
+    """A duplicate request rescues a call stuck in the slow tail"""
+
+    def test_hedge_wins_over_a_hung_primary(self):
+        # With seed 3 the first request hangs and the second answers
+        profile = LatencyProfile(median_ms=10, sigma=0, tail_probability=0, ms_per_output_token=0,
+                                 timeout_rate=0.5, hang_seconds=0.5)
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                StandInServer(seed=3, profiles={"haiku": profile}) as server:
+            executor = ClaudeTaskExecutor({
+                "fallback_to_mock": False,
+                "backend_url": server.url,
+                "cache_results": False,
+                "cache_configuration": {"enabled": False, "cache_directory": temp_dir},
+                "hedging": {"enabled": True, "percentile": 95, "min_samples": 1, "models": ["haiku"]}
+            })
+            executor.agent_latencies[AGENT] = deque([0.05])
+            try:
+                started = time.monotonic()
+                result = executor.execute_agent(AGENT, f"{AGENT} spec", {"topic": "hedging"})
+                elapsed = time.monotonic() - started
+            finally:
+                executor.close()
+
+        self.assertTrue(result.success, result.error)
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(executor.stats["hedges_fired"], 1)
+        self.assertEqual(executor.stats["hedges_won"], 1)
+        # The hung primary had sent its prompt
+        self.assertGreater(executor.stats["hedge_tokens_wasted"], 0)
+
+
+class HedgeWasteTests(unittest.TestCase):
+    """Tokens charged for the losing request of a hedged call"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_hedged(self, **overrides) -> ClaudeTaskExecutor:
+        """One call that hedges after 50ms and takes 300ms, so the primary wins"""
+        config = {
+            "mock_execution_delay": 0.3,
+            "cache_results": False,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name},
+            "hedging": {"enabled": True, "percentile": 95, "min_samples": 1, "models": ["haiku"]}
+        }
+        config.update(overrides)
+        executor = ClaudeTaskExecutor(config)
+        executor.agent_latencies[AGENT] = deque([0.05])
+        try:
+            result = executor.execute_agent(AGENT, f"{AGENT} spec", {"topic": "hedging"})
+        finally:
+            executor.close()
+
+        self.assertTrue(result.success)
+        self.assertEqual(executor.stats["hedges_fired"], 1)
+        self.assertEqual(executor.stats["hedges_won"], 0)
+        return executor
+
+    def test_loser_cancelled_mid_flight_is_charged_its_prompt(self):
+        executor = self.run_hedged()
+        self.assertGreater(executor.stats["hedge_tokens_wasted"], 0)
+
+    def test_loser_still_queued_for_rate_limits_costs_nothing(self):
+        executor = self.run_hedged(
+            rate_limiting={"enabled": True, "apply_to_mock": True},
+            model_preferences={"haiku": {"requests_per_minute": 1}}
+        )
+        self.assertEqual(executor.stats["hedge_tokens_wasted"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
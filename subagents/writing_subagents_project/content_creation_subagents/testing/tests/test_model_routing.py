@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Model Routing Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import pickle
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from agent_spec_loader import ModelSelector  # noqa: E402
+from model_routing import DEFAULT_MAX_TOKENS, build_routing_table, load_routing_config  # noqa: E402
+
+CONFIG = {
+    "model_preferences": {
+        "haiku": {"agents": ["keyword-researcher"], "max_tokens": 1000, "cost_per_1k_tokens": 0.001},
+        "sonnet": {"agents": ["body-writer", "keyword-researcher"], "max_tokens": 3000},
+        "opus": {"agents": ["spec-writer"], "max_tokens": 4000}
+    },
+    "model_routing": {"default_model": "sonnet"}
+}
+
+
+class PrecedenceTests(unittest.TestCase):
+    """Overrides, then config, then frontmatter, then the default"""
+
+    def test_config_agents_lists(self):
+        table = build_routing_table(CONFIG)
+        self.assertEqual(table.model_for("body-writer"), "sonnet")
+        self.assertEqual(table.model_for("spec-writer"), "opus")
+        self.assertEqual(table.route_for("spec-writer").source, "config")
+
+    def test_first_preference_list_wins(self):
+        self.assertEqual(build_routing_table(CONFIG).model_for("keyword-researcher"), "haiku")
+
+    def test_config_beats_frontmatter_and_conflicts_are_reported(self):
+        table = build_routing_table(CONFIG, frontmatter={"body-writer": "opus", "trend-spotter": "haiku"})
+        self.assertEqual(table.model_for("body-writer"), "sonnet")
+        self.assertEqual(table.conflicts(), {"body-writer": {"config": "sonnet", "frontmatter": "opus"}})
+        self.assertEqual(table.route_for("trend-spotter").source, "frontmatter")
+        self.assertEqual(table.model_for("trend-spotter"), "haiku")
+
+    def test_unknown_frontmatter_models_are_ignored(self):
+        table = build_routing_table(CONFIG, frontmatter={"trend-spotter": "gpt-4"})
+        self.assertNotIn("trend-spotter", table)
+        self.assertEqual(table.model_for("trend-spotter"), "sonnet")
+
+    def test_overrides_beat_everything(self):
+        config = {**CONFIG, "model_routing": {"overrides": {"body-writer": "haiku"}}}
+        table = build_routing_table(config, frontmatter={"body-writer": "opus"}, overrides={"spec-writer": "sonnet"})
+        self.assertEqual(table.model_for("body-writer"), "haiku")
+        self.assertEqual(table.route_for("body-writer").source, "override")
+        self.assertEqual(table.model_for("spec-writer"), "sonnet")
+
+    def test_argument_overrides_beat_config_overrides(self):
+        config = {**CONFIG, "model_routing": {"overrides": {"body-writer": "haiku"}}}
+        table = build_routing_table(config, overrides={"body-writer": "opus"})
+        self.assertEqual(table.model_for("body-writer"), "opus")
+
+    def test_unknown_override_model_is_rejected(self):
+        with self.assertRaises(ValueError):
+            build_routing_table(CONFIG, overrides={"body-writer": "gpt-4"})
+
+    def test_default_model_for_unrouted_agents(self):
+        config = {**CONFIG, "model_routing": {"default_model": "haiku"}}
+        self.assertEqual(build_routing_table(config).model_for("unknown-agent"), "haiku")
+
+
+class LimitTests(unittest.TestCase):
+    """Per-agent and per-tier max_tokens and prices"""
+
+    def test_tier_limits_and_prices(self):
+        table = build_routing_table(CONFIG)
+        self.assertEqual(table.max_tokens("keyword-researcher"), 1000)
+        self.assertEqual(table.max_tokens("spec-writer"), 4000)
+        self.assertEqual(table.cost_per_1k_tokens("keyword-researcher"), 0.001)
+        self.assertAlmostEqual(table.price("keyword-researcher", "haiku", 2000), 0.002)
+
+    def test_escalated_calls_use_the_tier_limit(self):
+        table = build_routing_table(CONFIG)
+        self.assertEqual(table.max_tokens("keyword-researcher", "opus"), 4000)
+        self.assertEqual(table.max_tokens("keyword-researcher", "haiku"), 1000)
+
+    def test_unrouted_agents_use_the_default_tier(self):
+        table = build_routing_table(CONFIG)
+        self.assertEqual(table.max_tokens("unknown-agent"), 3000)
+        self.assertEqual(table.max_tokens("unknown-agent", "unknown-tier"), DEFAULT_MAX_TOKENS)
+
+    def test_override_limits_apply_to_that_agent_alone(self):
+        table = build_routing_table(CONFIG, overrides={
+            "body-writer": {"model": "sonnet", "max_tokens": 8000, "cost_per_1k_tokens": 0.01}
+        })
+        self.assertEqual(table.max_tokens("body-writer"), 8000)
+        self.assertEqual(table.cost_per_1k_tokens("body-writer"), 0.01)
+        self.assertEqual(table.max_tokens("unknown-agent"), 3000)
+        # On another tier the agent gets that tier's limit, not its override
+        self.assertEqual(table.max_tokens("body-writer", "opus"), 4000)
+
+
+class TableTests(unittest.TestCase):
+    """Read-only views and pickling"""
+
+    def test_views_are_read_only(self):
+        table = build_routing_table(CONFIG)
+        with self.assertRaises(TypeError):
+            table.models["body-writer"] = "opus"
+        with self.assertRaises(TypeError):
+            table.routes["body-writer"] = None
+
+    def test_agents_for_model(self):
+        table = build_routing_table(CONFIG)
+        self.assertEqual(table.agents_for_model("opus"), ("spec-writer",))
+        self.assertEqual(table.agents_for_model("unknown-tier"), ())
+
+    def test_pickle_round_trip(self):
+        table = build_routing_table(CONFIG, frontmatter={"trend-spotter": "haiku"})
+        restored = pickle.loads(pickle.dumps(table))
+        self.assertEqual(restored.to_dict(), table.to_dict())
+        self.assertEqual(restored.model_for("trend-spotter"), "haiku")
+
+
+class ModelSelectorTests(unittest.TestCase):
+    """The selector answers from the routing table"""
+
+    def test_shipped_config_routes(self):
+        selector = ModelSelector()
+        self.assertEqual(selector.get_model_for_agent("keyword-researcher"), "haiku")
+        self.assertEqual(selector.get_model_for_agent("body-writer"), "sonnet")
+        self.assertEqual(selector.get_model_for_agent("spec-writer"), "opus")
+        self.assertIn("spec-writer", selector.get_agents_for_model("opus"))
+
+    def test_shipped_config_loads(self):
+        self.assertIn("model_preferences", load_routing_config())
+
+    def test_prebuilt_table_is_used_as_is(self):
+        table = build_routing_table(CONFIG, overrides={"grammar-checker": "opus"})
+        selector = ModelSelector(routing_table=table)
+        self.assertEqual(selector.get_model_for_agent("grammar-checker"), "opus")
+        self.assertEqual(selector.get_max_tokens("grammar-checker"), 4000)
+        self.assertIs(selector.agent_to_model, table.models)
+
+    def test_frontmatter_can_be_disabled(self):
+        config = {**CONFIG, "model_routing": {"use_frontmatter": False}}
+        selector = ModelSelector(config)
+        self.assertEqual(dict(selector.agent_to_model), dict(build_routing_table(CONFIG).models))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Test Orchestrator Regression Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import json
+import sys
+import time
+import unittest
+from pathlib import Path
+
+TESTING_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TESTING_ROOT / "harness"))
+
+from stand_in_server import LatencyProfile, StandInServer  # noqa: E402
+from test_orchestrator import TestConfig, TestOrchestrator  # noqa: E402
+
+
+class ParallelPhaseTests(unittest.TestCase):
+    """Parallel phases against a backend that never answers in time"""
+
+    def setUp(self):
+        hanging = LatencyProfile(timeout_rate=1.0, hang_seconds=5.0)
+        self.server = StandInServer(
+            seed=1, profiles={"haiku": hanging, "sonnet": hanging, "opus": hanging}
+        ).start()
+        self.orchestrator = TestOrchestrator(TestConfig(
+            max_workers=2, timeout_per_agent=0.3, verbose=False, save_reports=False
+        ))
+        runner = self.orchestrator.test_runner
+        runner.test_fixtures = json.loads((TESTING_ROOT / "data" / "test_fixtures.json").read_text())
+        self.executor = runner.task_executor
+        self.executor.mock_mode = False
+        self.executor.config.update({"backend_url": self.server.url, "cache_results": False})
+
+    def tearDown(self):
+        self.orchestrator.close()
+        self.server.stop()
+
+    def test_hung_calls_time_out_and_free_their_slots(self):
+        agents = ["topic-scout", "source-gatherer", "keyword-researcher", "body-writer", "grammar-checker"]
+
+        started = time.monotonic()
+        results = self.orchestrator._test_agents_parallel(agents)
+        elapsed = time.monotonic() - started
+
+        self.assertEqual(set(results), set(agents))
+        self.assertTrue(all(result["status"] == "timeout" for result in results.values()))
+        # Three waves of two workers, each bounded by timeout_per_agent
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(self.executor.stats["current_concurrency"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
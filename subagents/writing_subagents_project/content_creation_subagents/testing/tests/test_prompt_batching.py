@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Prompt Batching Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+
+
+class BatchAccountingTests(unittest.TestCase):
+    """Usage and latency of a multi-input call"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.executor = ClaudeTaskExecutor({
+            "mock_execution_delay": 0,
+            "cache_results": False,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name}
+        })
+
+    def tearDown(self):
+        self.executor.close()
+        self.temp_dir.cleanup()
+
+    def run_batch(self, count: int):
+        inputs = [{"topic": f"topic {index}"} for index in range(count)]
+        return self.executor.execute_agent_batch("keyword-researcher", "keyword-researcher spec", inputs)
+
+    def test_split_usage_adds_up_to_the_call(self):
+        results = self.run_batch(7)
+
+        self.assertEqual(self.executor.stats["batched_calls"], 1)
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(sum(result.tokens_used for result in results), self.executor.stats["total_tokens"])
+        ledger = self.executor.token_ledger
+        self.assertEqual(sum(result.prompt_tokens for result in results), ledger.totals["prompt_tokens"])
+        self.assertEqual(sum(result.completion_tokens for result in results), ledger.totals["completion_tokens"])
+
+    def test_batch_latency_is_not_a_single_call_sample(self):
+        self.run_batch(7)
+
+        self.assertIsNone(self.executor.get_expected_duration("keyword-researcher"))
+        self.assertEqual(self.executor.task_history[-1]["batch_size"], 7)
+
+    def test_split_tokens_gives_remainder_to_last_share(self):
+        self.assertEqual(self.executor._split_tokens(23, 7), [3, 3, 3, 3, 3, 3, 5])
+        self.assertEqual(self.executor._split_tokens(0, 3), [0, 0, 0])
+
+
+class BatchPackingTests(unittest.TestCase):
+    """Chunking, caching and splitting of batched inputs"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_executor(self, **overrides) -> ClaudeTaskExecutor:
+        config = {
+            "mock_execution_delay": 0,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name}
+        }
+        config.update(overrides)
+        executor = ClaudeTaskExecutor(config)
+        self.addCleanup(executor.close)
+        return executor
+
+    def test_inputs_are_sent_in_chunks_of_max_batch_size(self):
+        executor = self.make_executor(
+            cache_results=False, prompt_batching={"enabled": True, "max_batch_size": 10}
+        )
+        inputs = [{"topic": f"topic {index}"} for index in range(25)]
+        results = executor.execute_agent_batch("keyword-researcher", "spec", inputs)
+
+        self.assertEqual(executor.stats["batched_calls"], 3)
+        self.assertEqual(executor.stats["batched_inputs"], 25)
+        self.assertEqual(executor.stats["batch_fallbacks"], 0)
+        # Results line up with their inputs
+        self.assertEqual([result.output["primary_keyword"] for result in results],
+                         [f"test keyword for topic {index}" for index in range(25)])
+
+    def test_cached_inputs_skip_the_batch_and_results_are_cached_singly(self):
+        executor = self.make_executor(cache_results=True)
+        inputs = [{"topic": f"topic {index}"} for index in range(7)]
+        executor.execute_agent("keyword-researcher", "spec", inputs[0])
+
+        executor.execute_agent_batch("keyword-researcher", "spec", inputs)
+        self.assertEqual(executor.stats["cache_hits"], 1)
+        self.assertEqual(executor.stats["batched_inputs"], 6)
+
+        executor.execute_agent("keyword-researcher", "spec", inputs[3])
+        self.assertEqual(executor.stats["cache_hits"], 2)
+
+    def test_split_keeps_only_well_formed_entries(self):
+        executor = self.make_executor()
+        keys = ["input-0", "input-1", "input-2", "input-3"]
+        outputs = executor._split_batch_output(
+            '[{"key": "input-0", "output": {"a": 1}}, {"key": "input-1", "output": "text"}, '
+            '{"key": "input-9", "output": {}}, "stray", {"key": "input-3", "output": {"b": 2}}, '
+            '{"key": "input-3", "output": {"b": 3}}]',
+            keys
+        )
+        self.assertEqual(outputs, {"input-0": {"a": 1}, "input-3": {"b": 2}})
+        self.assertEqual(executor._split_batch_output("not json", keys), {})
+        self.assertEqual(executor._split_batch_output({"input-0": {}}, keys), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
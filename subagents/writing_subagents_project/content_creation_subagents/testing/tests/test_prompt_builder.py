@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Prompt Builder Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from prompt_builder import EPHEMERAL_CACHE_CONTROL, PromptBuilder  # noqa: E402
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+
+SPEC = "Find keywords for the topic."
+
+
+class PrefixTests(unittest.TestCase):
+    """The agent-only prefix is built once and shared"""
+
+    def setUp(self):
+        self.builder = PromptBuilder()
+
+    def test_calls_share_one_prefix_object(self):
+        first = self.builder.build("keyword-researcher", SPEC, {"topic": "a"})
+        second = self.builder.build("keyword-researcher", SPEC, {"topic": "b"})
+
+        self.assertIs(first.prefix, second.prefix)
+        self.assertNotEqual(first.suffix, second.suffix)
+        self.assertEqual(self.builder.stats["prefixes_built"], 1)
+        self.assertEqual(self.builder.stats["prefix_reuses"], 1)
+        self.assertEqual(self.builder.stats["prefix_chars_reused"], len(first.prefix))
+
+    def test_prefix_holds_the_spec_and_suffix_only_the_input(self):
+        prompt = self.builder.build("keyword-researcher", SPEC, {"topic": "gardening", "depth": 2})
+
+        self.assertIn(SPEC, prompt.prefix)
+        self.assertIn("You are the keyword-researcher agent.", prompt.prefix)
+        self.assertNotIn("gardening", prompt.prefix)
+        self.assertEqual(prompt.suffix, '## Input Data\n{"topic":"gardening","depth":2}')
+        self.assertEqual(prompt.text, prompt.prefix + prompt.suffix)
+
+    def test_batched_prompts_have_their_own_prefix(self):
+        single = self.builder.build("keyword-researcher", SPEC, {"topic": "a"})
+        batched = self.builder.build(
+            "keyword-researcher", SPEC, {"input-0": {"topic": "a"}, "input-1": {"topic": "b"}}, batch_size=2
+        )
+
+        self.assertNotEqual(single.prefix, batched.prefix)
+        self.assertIn("JSON array", batched.prefix)
+        self.assertIn("following 2 inputs", batched.suffix)
+        self.assertIn('"input-1":{"topic":"b"}', batched.suffix)
+
+    def test_a_changed_spec_gets_a_new_prefix(self):
+        old = self.builder.prefix("keyword-researcher", SPEC)
+        new = self.builder.prefix("keyword-researcher", SPEC + " Prefer long tail terms.")
+        self.assertNotEqual(old, new)
+
+    def test_invalidate_drops_one_agent(self):
+        self.builder.prefix("keyword-researcher", SPEC)
+        self.builder.prefix("keyword-researcher", SPEC, batch=True)
+        self.builder.prefix("topic-scout", SPEC)
+
+        self.builder.invalidate("keyword-researcher")
+        self.assertEqual(self.builder.get_statistics()["cached_prefixes"], 1)
+        self.builder.invalidate()
+        self.assertEqual(self.builder.get_statistics()["cached_prefixes"], 0)
+
+
+class MessagesTests(unittest.TestCase):
+    """Messages-API request bodies"""
+
+    def test_prefix_is_a_cached_system_block(self):
+        builder = PromptBuilder.from_config({"prompt_caching": {"enabled": True}})
+        prompt = builder.build("keyword-researcher", SPEC, {"topic": "a"})
+        messages = builder.to_messages(prompt)
+
+        self.assertEqual(messages["system"], [
+            {"type": "text", "text": prompt.prefix, "cache_control": EPHEMERAL_CACHE_CONTROL}
+        ])
+        self.assertEqual(messages["messages"], [
+            {"role": "user", "content": [{"type": "text", "text": prompt.suffix}]}
+        ])
+
+    def test_cache_control_omitted_when_disabled(self):
+        builder = PromptBuilder.from_config({"prompt_caching": {"enabled": False}})
+        messages = builder.to_messages(builder.build("keyword-researcher", SPEC, {"topic": "a"}))
+        self.assertNotIn("cache_control", messages["system"][0])
+
+
+class ExecutorPromptTests(unittest.TestCase):
+    """The executor builds prompts through its PromptBuilder"""
+
+    def test_spec_change_invalidates_the_agent_prefix(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            executor = ClaudeTaskExecutor({
+                "mock_execution_delay": 0,
+                "cache_configuration": {"enabled": False, "cache_directory": temp_dir}
+            })
+            try:
+                for topic in ("a", "b", "c"):
+                    executor.execute_agent("keyword-researcher", SPEC, {"topic": topic})
+                stats = executor.get_statistics()["prompt_prefix"]
+                executor.invalidate_agent("keyword-researcher")
+                remaining = executor.prompt_builder.get_statistics()["cached_prefixes"]
+            finally:
+                executor.close()
+
+        self.assertEqual(stats["cached_prefixes"], 1)
+        self.assertGreaterEqual(stats["prefix_reuses"], 2)
+        self.assertEqual(remaining, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
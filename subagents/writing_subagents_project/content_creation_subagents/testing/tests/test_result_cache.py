@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Disk Result Cache Regression Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from result_cache import DiskResultCache  # noqa: E402
+
+
+class ExpiryTests(unittest.TestCase):
+    """TTL expiry against LRU ordering"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskResultCache(self.temp_dir.name, ttl_seconds=60, max_size_mb=10)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def backdate(self, key: str, created_seconds_ago: float, used_seconds_ago: float):
+        """Rewrite an entry's created_at and set its mtime"""
+        path = self.cache._path_for(key)
+        entry = json.loads(path.read_text())
+        entry["created_at"] = time.time() - created_seconds_ago
+        path.write_text(json.dumps(entry))
+        used_at = time.time() - used_seconds_ago
+        os.utime(path, (used_at, used_at))
+
+    def test_recent_hits_do_not_extend_ttl(self):
+        self.cache.put("aa01", {"output": "stale"})
+        self.backdate("aa01", created_seconds_ago=120, used_seconds_ago=1)
+
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertIsNone(self.cache.get("aa01"))
+
+    def test_idle_entries_within_ttl_survive(self):
+        self.cache.put("aa02", {"output": "fresh"})
+        self.backdate("aa02", created_seconds_ago=30, used_seconds_ago=30)
+
+        self.assertEqual(self.cache.evict(), 0)
+        self.assertEqual(self.cache.get("aa02"), {"output": "fresh"})
+
+
+if __name__ == "__main__":
+    unittest.main()
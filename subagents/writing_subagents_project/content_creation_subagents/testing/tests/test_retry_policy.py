@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Retry Policy Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import random
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from retry_policy import CircuitBreaker, CircuitBreakerRegistry, RetryPolicy  # noqa: E402
+from stand_in_server import LatencyProfile, StandInServer  # noqa: E402
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+
+
+class FromConfigTests(unittest.TestCase):
+    """Attempt counts read from executor config"""
+
+    def test_retry_attempts_counts_total_attempts(self):
+        policy = RetryPolicy.from_config({"retry_attempts": 2, "error_handling": {"max_retries": 2}})
+        self.assertEqual(policy.max_attempts, 2)
+
+    def test_max_retries_used_without_retry_attempts(self):
+        policy = RetryPolicy.from_config({"error_handling": {"max_retries": 3}})
+        self.assertEqual(policy.max_attempts, 4)
+
+    def test_default_matches_executor_default(self):
+        self.assertEqual(RetryPolicy.from_config({}).max_attempts, 2)
+
+
+class BackoffTests(unittest.TestCase):
+    """Exponential bounds and jitter"""
+
+    def test_bounds_grow_exponentially_up_to_the_cap(self):
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=5.0, jitter="none")
+        self.assertEqual([policy.delay(retry) for retry in range(5)], [1.0, 2.0, 4.0, 5.0, 5.0])
+
+    def test_full_jitter_stays_under_the_bound(self):
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, jitter="full", rng=random.Random(7))
+        delays = [policy.delay(2) for _ in range(200)]
+        self.assertTrue(all(0 <= delay <= 4.0 for delay in delays))
+        # Spread out, not bunched at the bound
+        self.assertLess(min(delays), 1.0)
+        self.assertGreater(max(delays), 3.0)
+
+    def test_equal_jitter_keeps_half_the_bound(self):
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, jitter="equal", rng=random.Random(7))
+        delays = [policy.delay(2) for _ in range(200)]
+        self.assertTrue(all(2.0 <= delay <= 4.0 for delay in delays))
+
+    def test_unknown_jitter_mode(self):
+        with self.assertRaises(ValueError):
+            RetryPolicy(jitter="decorrelated")
+
+    def test_only_retryable_outcomes_within_the_count(self):
+        policy = RetryPolicy(max_retries=2)
+        for outcome in ("throttled", "timeout", "deadline", "error"):
+            self.assertTrue(policy.should_retry(outcome, 1), outcome)
+        self.assertFalse(policy.should_retry("error", 2))
+        for outcome in ("success", "cancelled", "circuit_open", "budget_exhausted"):
+            self.assertFalse(policy.should_retry(outcome, 0), outcome)
+
+
+class CircuitBreakerTests(unittest.TestCase):
+    """Closed, open and half-open transitions"""
+
+    def trip(self, breaker: CircuitBreaker):
+        for _ in range(breaker.failure_threshold):
+            self.assertTrue(breaker.allow())
+            breaker.record("error")
+
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        breaker.allow()
+        breaker.record("error")
+        breaker.allow()
+        breaker.record("success")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+
+        self.trip(breaker)
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.stats["rejected"], 1)
+        self.assertGreater(breaker.retry_after(), 59)
+
+    def test_neutral_outcomes_do_not_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        for outcome in ("error", "cancelled", "deadline", "budget_exhausted", "cassette_miss"):
+            breaker.allow()
+            breaker.record(outcome)
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(breaker.consecutive_failures, 1)
+
+    def test_half_open_trial_success_closes(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, half_open_max_calls=1)
+        self.trip(breaker)
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        # Only one trial at a time
+        self.assertFalse(breaker.allow())
+
+        breaker.record("success")
+        self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+        self.assertTrue(breaker.allow())
+
+    def test_half_open_trial_failure_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        self.trip(breaker)
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow())
+        breaker.record("timeout")
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(breaker.stats["opened"], 2)
+        self.assertFalse(breaker.allow())
+
+    def test_neutral_trial_frees_its_slot(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+        self.trip(breaker)
+        time.sleep(0.06)
+
+        self.assertTrue(breaker.allow())
+        breaker.record("cancelled")
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertTrue(breaker.allow())
+
+
+class RegistryTests(unittest.TestCase):
+    """Agent and model breakers together"""
+
+    def test_model_breaker_trips_every_agent_on_the_tier(self):
+        registry = CircuitBreakerRegistry(failure_threshold=5, reset_timeout=60, model_failure_threshold=2)
+        for agent in ("topic-scout", "body-writer"):
+            self.assertIsNone(registry.allow(agent, "sonnet"))
+            registry.record(agent, "sonnet", "error")
+
+        self.assertIn("model sonnet", registry.allow("fact-verifier", "sonnet"))
+        self.assertIsNone(registry.allow("fact-verifier", "haiku"))
+
+    def test_agent_rejection_returns_the_model_trial_slot(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1, reset_timeout=0.05, model_failure_threshold=1)
+        self.assertIsNone(registry.allow("body-writer", "sonnet"))
+        registry.record("body-writer", "sonnet", "error")
+        time.sleep(0.06)
+
+        # Both half-open; re-open only the agent breaker
+        agent_breaker = registry.agents["body-writer"]
+        agent_breaker.allow()
+        agent_breaker.record("error")
+
+        self.assertIn("agent body-writer", registry.allow("body-writer", "sonnet"))
+        self.assertIsNone(registry.allow("topic-scout", "sonnet"))
+
+    def test_disabled_in_config(self):
+        self.assertIsNone(CircuitBreakerRegistry.from_config({"error_handling": {"circuit_breaker": {}}}))
+
+
+class ExecutorRetryTests(unittest.TestCase):
+    """retry_on_failure against a failing backend"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def run_retries(self, profile: LatencyProfile, **overrides) -> tuple:
+        config = {
+            "fallback_to_mock": False,
+            "cache_results": False,
+            "retry_attempts": 3,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name},
+            "error_handling": {
+                "retry_delay_seconds": 0.01,
+                "max_retry_delay_seconds": 0.05,
+                "circuit_breaker": {"enabled": False}
+            }
+        }
+        config.update(overrides)
+        with StandInServer(seed=1, profiles={"haiku": profile}) as server:
+            config["backend_url"] = server.url
+            executor = ClaudeTaskExecutor(config)
+            try:
+                result = executor.retry_on_failure("keyword-researcher", "spec", {"topic": "retries"})
+            finally:
+                executor.close()
+            requests = server.backend.stats["requests"]
+        return executor, result, requests
+
+    def test_failures_are_retried_up_to_retry_attempts(self):
+        executor, result, requests = self.run_retries(
+            LatencyProfile(median_ms=1, ms_per_output_token=0, error_rate=1.0)
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("Failed after 3 attempts", result.error)
+        self.assertEqual(executor.stats["retries"], 2)
+        self.assertEqual(requests, 3)
+
+    def test_open_circuit_stops_retrying(self):
+        executor, result, requests = self.run_retries(
+            LatencyProfile(median_ms=1, ms_per_output_token=0, error_rate=1.0),
+            retry_attempts=5,
+            error_handling={
+                "retry_delay_seconds": 0.01,
+                "circuit_breaker": {"enabled": True, "failure_threshold": 2, "reset_timeout_seconds": 60}
+            }
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("Circuit open", result.error)
+        self.assertEqual(requests, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Task Scheduler Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from scheduler import TaskScheduler  # noqa: E402
+from task_executor import AgentTask, ClaudeTaskExecutor, create_agent_task  # noqa: E402
+
+MODELS = {
+    "spec-writer": "opus",
+    "fact-verifier": "opus",
+    "body-writer": "sonnet",
+    "topic-scout": "sonnet",
+    "grammar-checker": "haiku",
+    "keyword-researcher": "haiku"
+}
+
+
+def make_scheduler(durations: dict = None) -> TaskScheduler:
+    """Scheduler over MODELS with spec-writer and grammar-checker critical"""
+    return TaskScheduler(
+        model_for_agent=MODELS.get,
+        expected_duration_for_agent=(durations or {}).get,
+        critical_agents=["spec-writer", "grammar-checker"]
+    )
+
+
+def task(agent_name: str, timeout: int = 30, priority: int = None) -> AgentTask:
+    """AgentTask with an empty input"""
+    return AgentTask(agent_name, "spec", {}, timeout=timeout, priority=priority)
+
+
+class OrderingTests(unittest.TestCase):
+    """Priority, then deadline, then expected duration, then enqueue order"""
+
+    def agents(self, tasks) -> list:
+        return [entry.agent_name for entry in tasks]
+
+    def test_critical_agents_then_model_tiers(self):
+        ordered = make_scheduler().order([
+            task("keyword-researcher"), task("body-writer"), task("grammar-checker"),
+            task("fact-verifier"), task("spec-writer")
+        ])
+        self.assertEqual(self.agents(ordered), [
+            "spec-writer", "grammar-checker", "fact-verifier", "body-writer", "keyword-researcher"
+        ])
+
+    def test_explicit_priority_overrides_derived_priority(self):
+        ordered = make_scheduler().order([task("spec-writer"), task("keyword-researcher", priority=100)])
+        self.assertEqual(self.agents(ordered), ["keyword-researcher", "spec-writer"])
+
+    def test_earlier_deadline_first_within_a_priority(self):
+        ordered = make_scheduler().order([task("body-writer", timeout=60), task("topic-scout", timeout=10)])
+        self.assertEqual(self.agents(ordered), ["topic-scout", "body-writer"])
+
+    def test_longest_expected_duration_first_within_a_deadline(self):
+        scheduler = make_scheduler({"body-writer": 2.0, "topic-scout": 9.0})
+        ordered = scheduler.order([task("body-writer"), task("topic-scout")])
+        self.assertEqual(self.agents(ordered), ["topic-scout", "body-writer"])
+
+    def test_history_replaces_the_tier_default_duration(self):
+        scheduler = make_scheduler({"keyword-researcher": 42.0})
+        self.assertEqual(scheduler.expected_duration("keyword-researcher"), 42.0)
+        self.assertEqual(scheduler.expected_duration("body-writer"), 8.0)
+
+    def test_ties_keep_enqueue_order(self):
+        scheduler = make_scheduler()
+        first, second, third = task("body-writer"), task("body-writer"), task("body-writer")
+        for entry in (first, second, third):
+            scheduler.push(entry)
+        popped = [scheduler.pop() for _ in range(len(scheduler))]
+        self.assertEqual([id(entry) for entry in popped], [id(first), id(second), id(third)])
+
+    def test_push_can_carry_an_item(self):
+        scheduler = make_scheduler()
+        scheduler.push(task("keyword-researcher"), (0, "low"))
+        scheduler.push(task("spec-writer"), (1, "high"))
+        self.assertEqual(scheduler.pop(), (1, "high"))
+        self.assertEqual(scheduler.pop(), (0, "low"))
+        self.assertEqual(len(scheduler), 0)
+
+    def test_order_agents(self):
+        scheduler = make_scheduler({"topic-scout": 30.0})
+        self.assertEqual(
+            scheduler.order_agents(["keyword-researcher", "body-writer", "topic-scout", "spec-writer"]),
+            ["spec-writer", "topic-scout", "body-writer", "keyword-researcher"]
+        )
+
+
+class ExecutorSchedulingTests(unittest.TestCase):
+    """batch_execute starts tasks in scheduler order and returns them in input order"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_batch_starts_in_scheduler_order(self):
+        executor = ClaudeTaskExecutor({
+            "mock_execution_delay": 0.01,
+            "cache_results": False,
+            "max_parallel_tasks": 1,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name}
+        })
+        tasks = [
+            create_agent_task(agent, "spec", {"topic": agent})
+            for agent in ["keyword-researcher", "topic-scout", "spec-writer", "grammar-checker"]
+        ]
+        try:
+            results = executor.batch_execute(tasks)
+        finally:
+            executor.close()
+
+        self.assertEqual([result.agent_name for result in results], [entry.agent_name for entry in tasks])
+        started = [entry["agent"] for entry in executor.task_history]
+        self.assertEqual(started, [entry.agent_name for entry in executor.create_scheduler().order(tasks)])
+        self.assertEqual(started[:2], ["spec-writer", "grammar-checker"])
+
+
+if __name__ == "__main__":
+    unittest.main()
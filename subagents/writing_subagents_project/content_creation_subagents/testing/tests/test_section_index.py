@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Section Index Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from agent_spec_loader import AgentSpecLoader, frontmatter_end, index_markdown_sections  # noqa: E402
+from section_benchmark import legacy_extract_markdown_sections, synthetic_spec  # noqa: E402
+
+
+class FrontmatterEndTests(unittest.TestCase):
+    """Locating the body after a YAML fence"""
+
+    def test_closed_fence(self):
+        content = "---\nname: a\n---\n# Prompt\nbody\n"
+        self.assertEqual(content[frontmatter_end(content):], "# Prompt\nbody\n")
+
+    def test_trailing_spaces_on_fences_are_allowed(self):
+        content = "---  \nname: a\n---  \nbody\n"
+        self.assertEqual(content[frontmatter_end(content):], "body\n")
+
+    def test_no_frontmatter(self):
+        self.assertEqual(frontmatter_end("# Prompt\nbody\n"), 0)
+        self.assertEqual(frontmatter_end("---title\nname: a\n---\nbody\n"), 0)
+
+    def test_unclosed_fence(self):
+        self.assertEqual(frontmatter_end("---\nname: a\nbody\n"), 0)
+        self.assertEqual(frontmatter_end("---\nname: a\n---"), 0)
+
+    def test_dashes_followed_by_text_do_not_close(self):
+        content = "---\nname: a\n---not a fence\nmore: b\n---\nbody\n"
+        self.assertEqual(content[frontmatter_end(content):], "body\n")
+
+
+class IndexTests(unittest.TestCase):
+    """Single-pass heading index"""
+
+    def sections(self, content: str):
+        return {name: content[start:end] for name, (start, end) in index_markdown_sections(content).items()}
+
+    def test_level_one_and_two_headings_open_sections(self):
+        sections = self.sections("# Title\nintro\n## Prompt\nDo the work.\n## Guardrails\nBe careful.\n")
+        self.assertEqual(sections, {"title": "intro", "prompt": "Do the work.", "guardrails": "Be careful.\n"})
+
+    def test_deeper_headings_stay_in_their_parent(self):
+        sections = self.sections("## Prompt\nStep one.\n### Details\nStep two.\n#### More\nStep three.\n")
+        self.assertEqual(list(sections), ["prompt"])
+        self.assertIn("### Details\nStep two.", sections["prompt"])
+
+    def test_aliases_and_case_are_folded(self):
+        sections = self.sections("## EXAMPLE\nx\n## Guardrail\ny\n## Instruction\nz\n")
+        self.assertEqual(set(sections), {"examples", "guardrails", "instructions"})
+
+    def test_first_section_with_a_name_wins(self):
+        sections = self.sections("## Prompt\nfirst\n## Prompt\nsecond\n")
+        self.assertEqual(sections["prompt"], "first")
+
+    def test_empty_section_does_not_swallow_the_next_heading(self):
+        sections = self.sections("## Description\n## Prompt\nbody\n")
+        self.assertEqual(sections["description"], "")
+        self.assertEqual(sections["prompt"], "body\n")
+
+    def test_hashes_inside_lines_are_not_headings(self):
+        sections = self.sections("## Prompt\nUse C# and tag #1 here.\n")
+        self.assertEqual(list(sections), ["prompt"])
+
+    def test_unterminated_last_line_is_not_a_heading(self):
+        sections = self.sections("## Prompt\nbody\n## Examples")
+        self.assertEqual(list(sections), ["prompt"])
+
+    def test_start_offset_skips_frontmatter(self):
+        content = "---\nname: a\n---\n## Prompt\nbody\n"
+        self.assertEqual(list(index_markdown_sections(content, frontmatter_end(content))), ["prompt"])
+
+
+class ExtractionTests(unittest.TestCase):
+    """Loader extraction matches the regex implementation it replaced"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.loader = AgentSpecLoader(use_bundle=False)
+
+    def test_real_specs_match_legacy_extraction(self):
+        for agent_name in self.loader.list_available_agents():
+            content = self.loader.load_agent_spec(agent_name)
+            with self.subTest(agent=agent_name):
+                self.assertEqual(self.loader._extract_markdown_sections(content),
+                                 legacy_extract_markdown_sections(content))
+
+    def test_synthetic_specs_match_legacy_extraction(self):
+        for spec_sections in (True, False):
+            content = synthetic_spec(64 * 1024, spec_sections=spec_sections)
+            with self.subTest(spec_sections=spec_sections):
+                self.assertEqual(self.loader._extract_markdown_sections(content),
+                                 legacy_extract_markdown_sections(content))
+
+    def test_missing_prompt_falls_back_to_the_body(self):
+        content = "---\nname: a\n---\n## Description\nShort.\n"
+        sections = self.loader._extract_markdown_sections(content)
+        self.assertEqual(sections, {"description": "Short.", "prompt": "## Description\nShort."})
+
+    def test_extract_sections_returns_every_heading(self):
+        sections = self.loader.extract_sections("---\nname: a\n---\n# Role\nWriter\n## Output Format\n JSON \n")
+        self.assertEqual(sections, {"role": "Writer", "output format": "JSON"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Spec Bundle Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from agent_spec_loader import AgentSpecLoader  # noqa: E402
+from spec_bundle import SpecBundle, build_spec_bundle, load_spec_bundle  # noqa: E402
+
+
+class _Exploit:
+    """Pickles to a call that would record that it ran"""
+    ran = []
+
+    def __reduce__(self):
+        return (_Exploit.ran.append, ("unpickled",))
+
+
+class SpecBundleTests(unittest.TestCase):
+    """Round trip and refusal of non-bundle files"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.bundle_path = Path(self.temp_dir.name) / "spec_bundle.json"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_round_trip_serves_parsed_specs(self):
+        parsing_loader = AgentSpecLoader(use_bundle=False)
+        build_spec_bundle(parsing_loader, self.bundle_path)
+
+        bundle = load_spec_bundle(self.bundle_path)
+        self.assertIsInstance(bundle, SpecBundle)
+        agents = parsing_loader.list_available_agents()
+        self.assertTrue(agents)
+        self.assertEqual(sorted(bundle.entries), sorted(agents))
+        self.assertEqual(bundle.stale_agents(), [])
+
+        bundled_loader = AgentSpecLoader(bundle_path=self.bundle_path)
+        self.assertIsNotNone(bundled_loader.bundle)
+        for agent in agents:
+            self.assertEqual(bundled_loader.parse_agent_spec(agent).to_dict(),
+                             parsing_loader.parse_agent_spec(agent).to_dict())
+
+    def test_pickle_file_is_never_unpickled(self):
+        self.bundle_path.write_bytes(pickle.dumps(_Exploit()))
+        self.assertIsNone(load_spec_bundle(self.bundle_path))
+        self.assertEqual(_Exploit.ran, [])
+
+    def test_malformed_bundles_are_ignored(self):
+        for text in ("not json", "[]", '{"version": 3}', '{"version": 1, "entries": {}}'):
+            self.bundle_path.write_text(text)
+            self.assertIsNone(load_spec_bundle(self.bundle_path), text)
+
+    def test_missing_bundle_is_ignored(self):
+        self.assertIsNone(load_spec_bundle(self.bundle_path))
+
+
+class FreshnessTests(unittest.TestCase):
+    """Bundled specs are only served while their source file is unchanged"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        root = Path(self.temp_dir.name)
+        shutil.copytree(AgentSpecLoader(use_bundle=False).optimized_dir, root / "specs" / "optimized_versions")
+        self.base_path = root / "specs"
+        self.bundle_path = root / "spec_bundle.json"
+        self.bundle = build_spec_bundle(AgentSpecLoader(str(self.base_path), use_bundle=False), self.bundle_path)
+        self.agent = sorted(self.bundle.entries)[0]
+        self.source = self.base_path / "optimized_versions" / self.bundle.entries[self.agent].filename
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def loader(self) -> AgentSpecLoader:
+        return AgentSpecLoader(str(self.base_path), bundle_path=self.bundle_path)
+
+    def test_unchanged_files_are_served_from_the_bundle(self):
+        loader = self.loader()
+        self.assertIsNotNone(loader.bundle)
+        self.assertEqual(loader.load_agent_spec(self.agent), self.bundle.entries[self.agent].content)
+
+    def test_touched_file_with_same_content_stays_fresh(self):
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(load_spec_bundle(self.bundle_path).stale_agents(), [])
+
+    def test_edited_and_deleted_files_are_stale(self):
+        with open(self.source, "a", encoding="utf-8") as f:
+            f.write("\nEdited after the bundle was built.\n")
+        bundle = load_spec_bundle(self.bundle_path)
+        self.assertEqual(bundle.stale_agents(), [self.agent])
+        self.assertIn("Edited after the bundle was built.", self.loader().load_agent_spec(self.agent))
+
+        self.source.unlink()
+        self.assertEqual(bundle.stale_agents(), [self.agent])
+
+    def test_bundle_for_another_directory_is_not_used(self):
+        loader = AgentSpecLoader(bundle_path=self.bundle_path)
+        self.assertIsNone(loader.bundle)
+
+
+if __name__ == "__main__":
+    unittest.main()
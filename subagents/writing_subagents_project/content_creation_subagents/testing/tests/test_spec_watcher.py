@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Spec Watcher Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from agent_spec_loader import AgentSpecLoader  # noqa: E402
+from spec_watcher import SpecWatcher  # noqa: E402
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+from test_runner import SubAgentTestRunner  # noqa: E402
+
+
+class SpecDirTestCase(unittest.TestCase):
+    """Works on a private copy of the optimized specs"""
+
+    agent = "topic-scout"
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        base_path = Path(self.temp_dir.name) / "specs"
+        shutil.copytree(AgentSpecLoader(use_bundle=False).optimized_dir, base_path / "optimized_versions")
+        self.loader = AgentSpecLoader(str(base_path), use_bundle=False)
+        self.spec = self.loader.load_agent_spec(self.agent)
+        self.source = self.loader.cache[self.agent].path
+
+    def edit_spec(self, text: str = "\nEdited while the harness was running.\n"):
+        with open(self.source, "a", encoding="utf-8") as f:
+            f.write(text)
+        # Make the edit visible even on filesystems with coarse mtimes
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class PollingTests(SpecDirTestCase):
+    """poll_once publishes exactly the content changes"""
+
+    def test_unchanged_specs_publish_nothing(self):
+        watcher = SpecWatcher(self.loader, backend="polling")
+        self.assertEqual(watcher.poll_once(), [])
+        self.assertEqual(watcher.get_statistics()["changes"], 0)
+
+    def test_touch_without_content_change_publishes_nothing(self):
+        stat = self.source.stat()
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(SpecWatcher(self.loader, backend="polling").poll_once(), [])
+
+    def test_edit_is_published_and_reloaded(self):
+        received = []
+        self.loader.subscribe(received.append)
+        watcher = SpecWatcher(self.loader, backend="polling")
+
+        self.edit_spec()
+        events = watcher.poll_once()
+
+        self.assertEqual([(event.agent_name, event.kind) for event in events], [(self.agent, "modified")])
+        self.assertNotEqual(events[0].old_hash, events[0].new_hash)
+        self.assertEqual(received, events)
+        self.assertIn("Edited while the harness was running.", self.loader.load_agent_spec(self.agent))
+        self.assertEqual(watcher.get_statistics()["changes"], 1)
+        self.assertIsNotNone(watcher.get_statistics()["last_change_at"])
+
+    def test_deleted_spec_falls_back_to_a_default(self):
+        watcher = SpecWatcher(self.loader, backend="polling")
+        self.source.unlink()
+        events = watcher.poll_once()
+        self.assertEqual([(event.agent_name, event.kind) for event in events], [(self.agent, "deleted")])
+
+    def test_background_polling_picks_up_edits(self):
+        received = threading.Event()
+        self.loader.subscribe(lambda event: received.set())
+        with SpecWatcher(self.loader, interval_seconds=0.02, backend="polling"):
+            self.edit_spec()
+            self.assertTrue(received.wait(5))
+
+
+class ConfigTests(unittest.TestCase):
+    """spec_reload configuration"""
+
+    def test_disabled_unless_watch_is_set(self):
+        loader = AgentSpecLoader(use_bundle=False)
+        self.assertIsNone(SpecWatcher.from_config(loader, {}))
+        self.assertIsNone(SpecWatcher.from_config(loader, {"spec_reload": {"watch": False}}))
+
+        watcher = SpecWatcher.from_config(loader, {"spec_reload": {"watch": True, "interval_seconds": 0.5,
+                                                                   "backend": "polling"}})
+        self.assertEqual((watcher.backend, watcher.interval_seconds), ("polling", 0.5))
+
+    def test_unknown_backend_is_rejected(self):
+        with self.assertRaises(ValueError):
+            SpecWatcher(AgentSpecLoader(use_bundle=False), backend="fanotify")
+
+
+class ExecutorInvalidationTests(SpecDirTestCase):
+    """Cached results for an edited spec are dropped"""
+
+    def test_spec_change_drops_cached_results(self):
+        executor = ClaudeTaskExecutor({
+            "mock_execution_delay": 0,
+            "cache_results": True,
+            "cache_configuration": {"enabled": False, "cache_directory": self.temp_dir.name}
+        })
+        self.addCleanup(executor.close)
+        self.loader.subscribe(executor.on_spec_change)
+        input_data = {"topic": "hot reload"}
+
+        executor.execute_agent(self.agent, self.spec, input_data)
+        executor.execute_agent(self.agent, self.spec, input_data)
+        self.assertEqual(executor.get_statistics()["cache_hits"], 1)
+
+        self.edit_spec()
+        SpecWatcher(self.loader, backend="polling").poll_once()
+
+        self.assertFalse([result for result in executor.execution_cache.values() if result.agent_name == self.agent])
+        executor.execute_agent(self.agent, self.loader.load_agent_spec(self.agent), input_data)
+        self.assertEqual(executor.get_statistics()["cache_hits"], 1)
+
+
+class RunnerLifecycleTests(unittest.TestCase):
+    """The runner owns the watcher it starts"""
+
+    def test_close_stops_the_watcher(self):
+        runner = SubAgentTestRunner()
+        runner.spec_watcher = SpecWatcher(runner.spec_loader, interval_seconds=0.05, backend="polling").start()
+        self.assertIn("spec-watcher", [thread.name for thread in threading.enumerate()])
+
+        runner.close()
+
+        self.assertNotIn("spec-watcher", [thread.name for thread in threading.enumerate()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Stand-in LLM Server Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import http.client
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from mock_outputs import generate_mock_response  # noqa: E402
+from stand_in_server import LatencyProfile, StandInBackend, StandInServer  # noqa: E402
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+
+# No simulated delay unless a test asks for one
+INSTANT = dict(median_ms=0, sigma=0, tail_probability=0, ms_per_1k_prompt_tokens=0, ms_per_output_token=0)
+
+
+def message_request(model: str = "haiku", topic: str = "servers") -> dict:
+    """A messages request for keyword-researcher"""
+    return {
+        "model": model,
+        "max_tokens": 500,
+        "system": [{"type": "text", "text": "You are the keyword-researcher agent."}],
+        "messages": [{"role": "user", "content": [{"type": "text", "text": f"topic {topic}"}]}],
+        "metadata": {"agent_name": "keyword-researcher", "input": {"topic": topic}}
+    }
+
+
+class BackendTests(unittest.TestCase):
+    """Responses and failure modes of StandInBackend"""
+
+    def backend(self, seed: int = 1, **profile) -> StandInBackend:
+        tier = LatencyProfile(**{**INSTANT, **profile})
+        return StandInBackend({"haiku": tier, "sonnet": tier, "opus": tier}, seed=seed)
+
+    def test_success_carries_mock_output_and_usage(self):
+        backend = self.backend()
+        status, _, body = backend.handle_messages(message_request())
+
+        self.assertEqual(status, 200)
+        message = json.loads(body)
+        output = json.loads(message["content"][0]["text"])
+        self.assertEqual(output, generate_mock_response("keyword-researcher", {"topic": "servers"}))
+        self.assertGreater(message["usage"]["input_tokens"], 0)
+        self.assertGreater(message["usage"]["output_tokens"], 0)
+        self.assertEqual(backend.stats["succeeded"], 1)
+
+    def test_failure_modes(self):
+        status, headers, body = self.backend(throttle_rate=1.0, retry_after_seconds=7).handle_messages(
+            message_request())
+        self.assertEqual((status, headers["Retry-After"]), (429, "7"))
+        self.assertEqual(json.loads(body)["error"]["type"], "rate_limit_error")
+
+        status, _, _ = self.backend(timeout_rate=1.0, hang_seconds=0.01).handle_messages(message_request())
+        self.assertEqual(status, 504)
+
+        status, _, _ = self.backend(error_rate=1.0).handle_messages(message_request())
+        self.assertEqual(status, 500)
+
+        status, _, body = self.backend(malformed_rate=1.0).handle_messages(message_request())
+        self.assertEqual(status, 200)
+        with self.assertRaises(ValueError):
+            json.loads(body)
+
+    def test_seed_makes_fates_reproducible(self):
+        def fates(seed):
+            backend = self.backend(seed=seed, throttle_rate=0.3, error_rate=0.3)
+            return [backend.handle_messages(message_request())[0] for _ in range(30)]
+
+        self.assertEqual(fates(5), fates(5))
+        self.assertEqual(set(fates(5)), {200, 429, 500})
+
+    def test_latency_follows_the_profile_and_time_scale(self):
+        backend = self.backend(median_ms=200)
+        backend.time_scale = 0.25
+        started = time.monotonic()
+        backend.handle_messages(message_request())
+        self.assertGreaterEqual(time.monotonic() - started, 0.045)
+        self.assertLess(time.monotonic() - started, 0.2)
+
+    def test_profile_lookup_by_tier_name(self):
+        backend = StandInBackend()
+        self.assertIs(backend.profile_for("claude-3-5-haiku-latest"), backend.profiles["haiku"])
+        self.assertIs(backend.profile_for("unknown-model"), backend.profiles["sonnet"])
+
+
+class HttpTests(unittest.TestCase):
+    """The HTTP front end"""
+
+    def setUp(self):
+        tier = LatencyProfile(**INSTANT)
+        self.server = StandInServer(seed=1, profiles={"haiku": tier}).start()
+        parts = urlsplit(self.server.url)
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=5)
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.stop()
+
+    def request(self, method: str, path: str, body: bytes = None) -> tuple:
+        self.connection.request(method, path, body=body, headers={"Content-Type": "application/json"})
+        response = self.connection.getresponse()
+        return response.status, response.read()
+
+    def test_routes(self):
+        self.assertEqual(self.request("GET", "/health"), (200, b'{"status":"ok"}'))
+        self.assertEqual(self.request("GET", "/missing")[0], 404)
+        self.assertEqual(self.request("POST", "/v1/other", b"{}")[0], 404)
+        self.assertEqual(self.request("POST", "/v1/messages", b"not json")[0], 400)
+
+    def test_messages_and_stats_over_one_keep_alive_connection(self):
+        for topic in ("one", "two"):
+            status, _ = self.request("POST", "/v1/messages", json.dumps(message_request(topic=topic)).encode())
+            self.assertEqual(status, 200)
+
+        status, body = self.request("GET", "/stats")
+        stats = json.loads(body)
+        self.assertEqual(status, 200)
+        self.assertEqual(stats["requests"], 2)
+        self.assertEqual(stats["succeeded"], 2)
+        self.assertIn("haiku", stats["profiles"])
+
+
+class ExecutorTests(unittest.TestCase):
+    """The executor's real path reads stand-in failures correctly"""
+
+    def run_agent(self, **profile):
+        tier = LatencyProfile(**{**INSTANT, **profile})
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                StandInServer(seed=1, profiles={"haiku": tier}) as server:
+            executor = ClaudeTaskExecutor({
+                "fallback_to_mock": False,
+                "backend_url": server.url,
+                "cache_results": False,
+                "cache_configuration": {"enabled": False, "cache_directory": temp_dir}
+            })
+            try:
+                result = executor.execute_agent("keyword-researcher", "spec", {"topic": "servers"})
+            finally:
+                executor.close()
+        return executor, result
+
+    def test_outcomes(self):
+        executor, result = self.run_agent()
+        self.assertTrue(result.success)
+        self.assertEqual(result.output["primary_keyword"], "test keyword for servers")
+        self.assertEqual(executor.get_statistics()["transport"]["requests"], 1)
+
+        executor, result = self.run_agent(throttle_rate=1.0)
+        self.assertEqual(executor._classify_outcome(result), "throttled")
+
+        executor, result = self.run_agent(timeout_rate=1.0, hang_seconds=0.01)
+        self.assertEqual(executor._classify_outcome(result), "timeout")
+
+        executor, result = self.run_agent(malformed_rate=1.0)
+        self.assertFalse(result.success)
+        self.assertIn("Malformed response", result.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
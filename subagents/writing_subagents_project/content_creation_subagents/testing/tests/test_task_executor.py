@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Task Executor Regression Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from cassette import Cassette  # noqa: E402
+from stand_in_server import LatencyProfile, StandInServer  # noqa: E402
+from task_executor import ClaudeTaskExecutor, create_agent_task  # noqa: E402
+
+
+def make_executor(temp_dir: str, **overrides) -> ClaudeTaskExecutor:
+    """Executor with its disk cache in temp_dir and no mock delay"""
+    config = {
+        "mock_execution_delay": 0,
+        "cache_configuration": {
+            "enabled": True,
+            "ttl_seconds": 3600,
+            "max_cache_size_mb": 10,
+            "cache_directory": str(Path(temp_dir) / "task_results")
+        }
+    }
+    config.update(overrides)
+    return ClaudeTaskExecutor(config)
+
+
+def make_task(agent_name: str, input_data: dict):
+    """AgentTask with a short spec"""
+    return create_agent_task(agent_name, f"{agent_name} spec", input_data)
+
+
+class BudgetTests(unittest.TestCase):
+    """Cost budget reservations against the real-path backend"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.server = StandInServer(seed=1, time_scale=0.001).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_queued_calls_do_not_hold_reservations(self):
+        # 60 opus calls could each reserve ~$0.05 of worst case, far more
+        # than $1 in total, but only a handful run at once
+        executor = make_executor(
+            self.temp_dir.name,
+            fallback_to_mock=False,
+            backend_url=self.server.url,
+            cache_results=False,
+            max_parallel_tasks=4,
+            performance_limits={"max_tokens_per_test": 5000, "max_total_time": 3600, "max_cost_per_run": 1.0}
+        )
+        try:
+            results = executor.batch_execute([
+                make_task("spec-writer", {"requirement": f"spec {index}"}) for index in range(60)
+            ])
+            budget = executor.get_cost_report()["budget"]
+        finally:
+            executor.close()
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(executor.stats["budget_degraded"], 0)
+        self.assertLess(budget["spent"], 1.0)
+        self.assertEqual(budget["reserved"], 0)
+
+    def test_degraded_results_are_not_cached_or_recorded(self):
+        cassette_path = Path(self.temp_dir.name) / "cassette.jsonl"
+        config = dict(
+            fallback_to_mock=False,
+            backend_url=self.server.url,
+            performance_limits={"max_tokens_per_test": 5000, "max_total_time": 3600, "max_cost_per_run": 0.0001},
+            cassette={"mode": "record", "path": str(cassette_path), "on_miss": "error"}
+        )
+        tasks = [make_task("spec-writer", {"requirement": f"spec {index}"}) for index in range(5)]
+
+        for _ in range(2):
+            executor = make_executor(self.temp_dir.name, **config)
+            try:
+                results = executor.batch_execute(tasks)
+            finally:
+                executor.close()
+            self.assertTrue(all(result.degraded for result in results))
+            self.assertEqual(executor.stats["cache_hits"], 0)
+            self.assertEqual(executor.stats["budget_degraded"], len(tasks))
+
+        self.assertEqual(executor.stats["cassette_recorded"], 0)
+        self.assertFalse(cassette_path.exists())
+
+
+class DeadlineTests(unittest.TestCase):
+    """Per-task deadlines against a backend that never answers in time"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        hanging = LatencyProfile(timeout_rate=1.0, hang_seconds=2.0)
+        self.server = StandInServer(
+            seed=1, profiles={"haiku": hanging, "sonnet": hanging, "opus": hanging}
+        ).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_deadline_caps_request_and_spares_circuit_breaker(self):
+        executor = make_executor(
+            self.temp_dir.name,
+            fallback_to_mock=False,
+            backend_url=self.server.url,
+            cache_results=False,
+            error_handling={
+                "max_retries": 0,
+                "circuit_breaker": {"enabled": True, "failure_threshold": 2, "reset_timeout_seconds": 30}
+            }
+        )
+        request_timeouts = []
+        send = executor.transport.apost_json
+
+        async def recording_send(url, payload, timeout):
+            request_timeouts.append(timeout)
+            return await send(url, payload, timeout)
+
+        executor.transport.apost_json = recording_send
+        try:
+            results = [
+                executor.execute_agent("keyword-researcher", "keyword-researcher spec", {"topic": str(index)},
+                                       timeout=0.2)
+                for index in range(4)
+            ]
+            breakers = executor.circuit_breakers.get_statistics()
+        finally:
+            executor.close()
+
+        self.assertTrue(all(result.timed_out for result in results))
+        self.assertEqual(len(request_timeouts), 4)
+        self.assertTrue(all(timeout <= 0.2 for timeout in request_timeouts))
+        self.assertEqual(breakers["agents"], {})
+        self.assertTrue(all(breaker["state"] == "closed" for breaker in breakers["models"].values()))
+
+
+class RunBudgetTests(unittest.TestCase):
+    """performance_limits.max_total_time across runs of one executor"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_start_run_restarts_time_budget(self):
+        executor = make_executor(
+            self.temp_dir.name,
+            cache_results=False,
+            performance_limits={"max_tokens_per_test": 5000, "max_total_time": 0.2}
+        )
+        spec = "keyword-researcher spec"
+        try:
+            executor.start_run()
+            first = executor.execute_agent("keyword-researcher", spec, {"topic": "a"})
+            time.sleep(0.3)
+            exhausted = executor.execute_agent("keyword-researcher", spec, {"topic": "b"})
+            executor.start_run()
+            second = executor.execute_agent("keyword-researcher", spec, {"topic": "c"})
+        finally:
+            executor.close()
+
+        self.assertTrue(first.success)
+        self.assertEqual(exhausted.error, "Run time budget exhausted")
+        self.assertTrue(second.success)
+
+
+class BreakerTests(unittest.TestCase):
+    """Circuit breakers around calls rejected before dispatch"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        failing = LatencyProfile(median_ms=1, error_rate=1.0)
+        self.server = StandInServer(
+            seed=1, profiles={"haiku": failing, "sonnet": failing, "opus": failing}
+        ).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_oversize_prompt_does_not_wedge_half_open_breaker(self):
+        executor = make_executor(
+            self.temp_dir.name,
+            fallback_to_mock=False,
+            backend_url=self.server.url,
+            cache_results=False,
+            performance_limits={"max_tokens_per_test": 2000, "max_total_time": 3600},
+            error_handling={
+                "max_retries": 0,
+                "circuit_breaker": {"enabled": True, "failure_threshold": 1, "reset_timeout_seconds": 0.05}
+            }
+        )
+        spec = "keyword-researcher spec"
+        try:
+            failed = executor.execute_agent("keyword-researcher", spec, {"topic": "a"})
+            time.sleep(0.1)  # Breakers go half-open
+            oversize = executor.execute_agent("keyword-researcher", spec, {"topic": "word " * 5000})
+            admitted = executor.execute_agent("keyword-researcher", spec, {"topic": "b"})
+        finally:
+            executor.close()
+
+        self.assertIn("HTTP 500", failed.error)
+        self.assertIn("max_tokens_per_test", oversize.error)
+        self.assertIn("HTTP 500", admitted.error)
+        self.assertEqual(executor.stats["circuit_rejections"], 0)
+
+
+class StreamingTests(unittest.TestCase):
+    """Streaming batches consumed partially"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.server = StandInServer(seed=1, time_scale=0.2).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_breaking_out_early_settles_pending_executions(self):
+        executor = make_executor(
+            self.temp_dir.name,
+            fallback_to_mock=False,
+            backend_url=self.server.url,
+            cache_results=False,
+            max_parallel_tasks=3,
+            performance_limits={"max_tokens_per_test": 5000, "max_total_time": 3600, "max_cost_per_run": 10.0}
+        )
+        tasks = [make_task("spec-writer", {"requirement": f"spec {index}"}) for index in range(12)]
+        try:
+            for _, result in executor.iter_batch_execute(tasks, window=6):
+                self.assertTrue(result.success)
+                break
+            in_flight = executor.stats["current_concurrency"]
+            reserved = executor.get_cost_report()["budget"]["reserved"]
+        finally:
+            executor.close()
+
+        self.assertEqual(in_flight, 0)
+        self.assertEqual(reserved, 0)
+
+
+class CassetteTests(unittest.TestCase):
+    """Recording over an existing cassette"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.temp_dir.name) / "cassette.jsonl"
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_rerecording_replaces_earlier_session(self):
+        first = Cassette(self.path)
+        first.record("key", {"output": "old"})
+        first.record("key", {"output": "old retry"})
+
+        second = Cassette(self.path)
+        second.record("key", {"output": "new"})
+        second.record("key", {"output": "new retry"})
+        self.assertEqual(second.compact(), 2)
+
+        replay = Cassette(self.path)
+        self.assertEqual(len(replay), 2)
+        self.assertEqual(
+            [replay.play("key")["output"] for _ in range(3)],
+            ["new", "new retry", "new retry"]
+        )
+        self.assertEqual(len(self.path.read_text().splitlines()), 2)
+
+    def test_record_mode_bypasses_result_cache(self):
+        task = make_task("keyword-researcher", {"topic": "container gardening"})
+
+        executor = make_executor(self.temp_dir.name)
+        try:
+            executor.batch_execute([task])
+        finally:
+            executor.close()
+
+        executor = make_executor(
+            self.temp_dir.name,
+            cassette={"mode": "record", "path": str(self.path), "on_miss": "error"}
+        )
+        try:
+            executor.batch_execute([task])
+            executor.batch_execute([task])
+        finally:
+            executor.close()
+
+        self.assertEqual(executor.stats["cache_hits"], 0)
+        self.assertEqual(executor.stats["cassette_recorded"], 2)
+        self.assertEqual(len(Cassette(self.path)), 2)
+
+
+class SerializationTests(unittest.TestCase):
+    """Input serialization shared by cache keys and prompts"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_input_mutated_between_calls_is_reserialized(self):
+        executor = make_executor(self.temp_dir.name)
+        input_data = {"topic": "container gardening"}
+        try:
+            first = executor.execute_agent("keyword-researcher", "keyword-researcher spec", input_data)
+            first_key = executor._get_cache_key("keyword-researcher", input_data, "keyword-researcher spec")
+
+            input_data["topic"] = "indoor composting"
+            second = executor.execute_agent("keyword-researcher", "keyword-researcher spec", input_data)
+            second_key = executor._get_cache_key("keyword-researcher", input_data, "keyword-researcher spec")
+            prompt = executor.prompt_builder.build("keyword-researcher", "keyword-researcher spec", input_data)
+        finally:
+            executor.close()
+
+        self.assertTrue(first.success and second.success)
+        self.assertEqual(executor.stats["cache_hits"], 0)
+        self.assertNotEqual(first_key, second_key)
+        self.assertIn("indoor composting", prompt.text)
+        self.assertNotIn("container gardening", prompt.text)
+
+
+class CloseTests(unittest.TestCase):
+    """close() releases resources without retiring the executor"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.server = StandInServer(seed=1, time_scale=0.001).start()
+
+    def tearDown(self):
+        self.server.stop()
+        self.temp_dir.cleanup()
+
+    def test_execution_after_close_rebuilds_loop_and_transport(self):
+        executor = make_executor(
+            self.temp_dir.name, fallback_to_mock=False, backend_url=self.server.url, cache_results=False
+        )
+        try:
+            first = executor.execute_agent("keyword-researcher", "keyword-researcher spec", {"topic": "one"})
+            closed_transport = executor.transport
+            executor.close()
+            second = executor.execute_agent("keyword-researcher", "keyword-researcher spec", {"topic": "two"})
+        finally:
+            executor.close()
+
+        self.assertTrue(first.success, first.error)
+        self.assertTrue(second.success, second.error)
+        self.assertIsNot(executor.transport, closed_transport)
+        with self.assertRaises(RuntimeError):
+            closed_transport.post_json(self.server.url + "/v1/messages", {}, 1)
+
+
+class LeaseOrderTests(unittest.TestCase):
+    """Rate limit leases are only held by calls that have a concurrency slot"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def assert_one_lease_at_a_time(self, **overrides):
+        executor = make_executor(
+            self.temp_dir.name,
+            mock_execution_delay=0.05,
+            cache_results=False,
+            max_parallel_tasks=1,
+            rate_limiting={"enabled": True, "apply_to_mock": True},
+            **overrides
+        )
+        try:
+            results = executor.batch_execute([
+                make_task("keyword-researcher", {"topic": f"topic {index}"}) for index in range(4)
+            ])
+            rate_limits = executor.get_statistics()["rate_limits"]
+        finally:
+            executor.close()
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertTrue(rate_limits)
+        for model_stats in rate_limits.values():
+            self.assertEqual(model_stats["peak_in_flight"], 1)
+            self.assertEqual(model_stats["in_flight"], 0)
+
+    def test_semaphore_slot_before_lease(self):
+        self.assert_one_lease_at_a_time()
+
+    def test_adaptive_slot_before_lease(self):
+        self.assert_one_lease_at_a_time(adaptive_concurrency={
+            "enabled": True, "initial_concurrency": 1, "min_concurrency": 1, "max_concurrency": 1
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Token Accounting Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from task_executor import ClaudeTaskExecutor  # noqa: E402
+from token_accounting import HeuristicTokenizer, TokenCounter, TokenLedger, get_tokenizer  # noqa: E402
+
+
+class HeuristicTokenizerTests(unittest.TestCase):
+    """BPE-like pre-tokenization counts"""
+
+    def setUp(self):
+        self.tokenizer = HeuristicTokenizer()
+
+    def test_short_words_are_one_token_each(self):
+        self.assertEqual(self.tokenizer.count("the quick brown fox"), 4)
+
+    def test_long_words_and_digit_runs_split(self):
+        # 20 letters at six per token, seven digits at three per token
+        self.assertEqual(self.tokenizer.count("abcdefghijklmnopqrst"), 4)
+        self.assertEqual(self.tokenizer.count("1234567"), 3)
+
+    def test_punctuation_is_dense(self):
+        self.assertEqual(self.tokenizer.count('{"a": 1}'), 7)
+        self.assertGreater(self.tokenizer.count('{"a": 1}'), len('{"a": 1}') // 4)
+
+    def test_lookup_by_name(self):
+        self.assertIsInstance(get_tokenizer("heuristic"), HeuristicTokenizer)
+        with self.assertRaises(ValueError):
+            get_tokenizer("sentencepiece")
+
+
+class TokenCounterTests(unittest.TestCase):
+    """Counting helpers and memoisation"""
+
+    def setUp(self):
+        self.counter = TokenCounter(HeuristicTokenizer())
+
+    def test_empty_and_json(self):
+        self.assertEqual(self.counter.count(""), 0)
+        self.assertEqual(self.counter.count_json("plain text"), self.counter.count("plain text"))
+        self.assertEqual(self.counter.count_json({"a": 1}), self.counter.count('{"a": 1}'))
+
+    def test_spec_and_prefix_counts_are_memoised(self):
+        spec = "You are a careful agent. " * 50
+        first = self.counter.count_spec(spec)
+        self.assertEqual(self.counter.count_spec(spec), first)
+        self.assertEqual(len(self.counter._spec_counts), 1)
+
+        self.assertEqual(self.counter.count_prefix(spec), first)
+        self.counter.count_prefix(spec)
+        self.assertEqual(len(self.counter._prefix_counts), 1)
+
+
+class TokenLedgerTests(unittest.TestCase):
+    """Aggregation per agent, phase and model"""
+
+    def test_usage_is_aggregated_along_every_dimension(self):
+        ledger = TokenLedger(phase_for_agent={"topic-scout": "research", "body-writer": "content"}.get)
+        ledger.record("topic-scout", "haiku", 100, 20)
+        ledger.record("topic-scout", "sonnet", 50, 10)
+        ledger.record("body-writer", "sonnet", 200, 300)
+        ledger.record("body-writer", "sonnet", 1, 1, phase="rewrite")
+
+        stats = ledger.get_statistics()
+        self.assertEqual(stats["totals"], {
+            "calls": 4, "prompt_tokens": 351, "completion_tokens": 331, "total_tokens": 682
+        })
+        self.assertEqual(stats["by_agent"]["topic-scout"]["total_tokens"], 180)
+        self.assertEqual(stats["by_phase"]["content"]["calls"], 1)
+        self.assertEqual(stats["by_phase"]["rewrite"]["calls"], 1)
+        self.assertEqual(stats["by_model"]["sonnet"]["prompt_tokens"], 251)
+
+        ledger.reset()
+        self.assertEqual(ledger.get_statistics()["totals"]["calls"], 0)
+
+    def test_concurrent_records_are_not_lost(self):
+        ledger = TokenLedger()
+        with ThreadPoolExecutor(max_workers=8) as threads:
+            list(threads.map(lambda index: ledger.record("agent", "haiku", 3, 2), range(2000)))
+
+        totals = ledger.get_statistics()["totals"]
+        self.assertEqual(totals["calls"], 2000)
+        self.assertEqual(totals["total_tokens"], 10000)
+        self.assertEqual(ledger.get_statistics()["by_phase"]["unknown"]["calls"], 2000)
+
+
+class ExecutorLedgerTests(unittest.TestCase):
+    """Executions feed the executor's ledger"""
+
+    def test_each_call_is_recorded_with_its_tier(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            executor = ClaudeTaskExecutor({
+                "mock_execution_delay": 0,
+                "cache_results": False,
+                "cache_configuration": {"enabled": False, "cache_directory": temp_dir}
+            })
+            try:
+                results = [
+                    executor.execute_agent(agent, "spec", {"topic": "ledgers"})
+                    for agent in ("keyword-researcher", "body-writer", "body-writer")
+                ]
+            finally:
+                executor.close()
+
+        ledger = executor.token_ledger.get_statistics()
+        self.assertEqual(ledger["totals"]["calls"], 3)
+        self.assertEqual(ledger["totals"]["total_tokens"], sum(result.tokens_used for result in results))
+        self.assertEqual(ledger["totals"]["total_tokens"], executor.stats["total_tokens"])
+        self.assertEqual(ledger["by_agent"]["body-writer"]["calls"], 2)
+        self.assertEqual(ledger["by_model"]["haiku"]["total_tokens"], results[0].tokens_used)
+        for result in results:
+            self.assertGreater(result.prompt_tokens, 0)
+            self.assertEqual(result.tokens_used, result.prompt_tokens + result.completion_tokens)
+
+
+if __name__ == "__main__":
+    unittest.main()
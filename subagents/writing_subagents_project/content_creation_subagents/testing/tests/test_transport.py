@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - HTTP Transport Regression Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from stand_in_server import StandInServer  # noqa: E402
+from transport import (  # noqa: E402
+    HTTPX_AVAILABLE, ConnectionPool, HttpxTransport, StdlibTransport, create_transport
+)
+
+
+def message_request(index: int) -> dict:
+    """A small messages request the stand-in server answers"""
+    return {
+        "model": "haiku",
+        "max_tokens": 200,
+        "messages": [{"role": "user", "content": f"request {index}"}],
+        "metadata": {"agent_name": "keyword-researcher", "input": {"topic": str(index)}}
+    }
+
+
+class PerHostLimitTests(unittest.TestCase):
+    """max_connections_per_host bounds concurrent requests to one host"""
+
+    def setUp(self):
+        self.server = StandInServer(seed=1, time_scale=0.05).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def assert_per_host_limit(self, client):
+        url = self.server.url + "/v1/messages"
+        try:
+            with ThreadPoolExecutor(max_workers=8) as threads:
+                responses = list(threads.map(
+                    lambda index: client.post_json(url, message_request(index), 30), range(16)
+                ))
+        finally:
+            client.close()
+
+        self.assertTrue(all(status == 200 for status, _, _ in responses))
+        self.assertLessEqual(self.server.backend.stats["peak_in_flight"], 2)
+
+    def test_stdlib_pool(self):
+        self.assert_per_host_limit(StdlibTransport(max_connections=8, max_connections_per_host=2))
+
+    @unittest.skipUnless(HTTPX_AVAILABLE, "httpx is not installed")
+    def test_httpx(self):
+        self.assert_per_host_limit(HttpxTransport(max_connections=8, max_connections_per_host=2, http2=False))
+
+
+class PoolWaitTests(unittest.TestCase):
+    """Waiting for a connection is bounded by the request timeout"""
+
+    def test_wait_times_out(self):
+        pool = ConnectionPool(max_connections=4, max_connections_per_host=1)
+        origin = ("http", "127.0.0.1", 9)
+        connection, _ = pool.acquire(origin, 5)
+        try:
+            started = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                pool.acquire(origin, 0.2)
+            self.assertLess(time.monotonic() - started, 1.0)
+        finally:
+            pool.release(origin, connection, reusable=False)
+        self.assertEqual(pool.get_statistics()["open"], 0)
+
+    def test_worker_threads_match_per_host_limit(self):
+        transport = create_transport({"transport": {
+            "backend": "stdlib", "max_connections": 20, "max_connections_per_host": 3
+        }})
+        try:
+            self.assertEqual(transport.max_workers, 3)
+        finally:
+            transport.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
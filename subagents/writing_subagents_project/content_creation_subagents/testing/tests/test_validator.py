@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+SubAgent Testing Harness - Validator Regression Tests
+Run from the testing directory: python -m unittest discover tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "harness"))
+
+from validator import PerformanceValidator  # noqa: E402
+
+
+class PerformanceValidatorTests(unittest.TestCase):
+    """Benchmarks checked against run metrics"""
+
+    METRICS = {
+        "execution_time": 5,
+        "total_tokens": 90000,
+        "tokens_per_agent": {"spec-writer": 4000},
+        "success_rate": 1.0
+    }
+
+    def test_token_checks_skipped_without_token_benchmarks(self):
+        validator = PerformanceValidator({"max_execution_time": 60, "min_success_rate": 0.9})
+
+        meets, report = validator.validate_performance(dict(self.METRICS))
+
+        self.assertTrue(meets)
+        self.assertEqual(report["violations"], [])
+
+    def test_token_checks_applied_with_default_benchmarks(self):
+        meets, report = PerformanceValidator().validate_performance(dict(self.METRICS))
+
+        self.assertFalse(meets)
+        self.assertEqual(
+            sorted(violation["metric"] for violation in report["violations"]),
+            ["tokens_per_agent", "total_tokens"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()